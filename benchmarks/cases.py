@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    One service run under fixed parameters.
+
+    Services are looked up in the CLI tool registry, so a benchmark calls
+    exactly the code path that `python main.py convert <tool>` runs.
+
+    Attributes:
+        name: Unique case name used in reports and baselines
+        tool: Name of the CLI tool (see src/presentation/cli/tools.py)
+        fixture: Input fixture name (see benchmarks/fixtures.py)
+        params: Keyword arguments passed to the service method
+        output: Output file name inside the run's scratch directory,
+                None to let the service choose
+        requires: Files that must exist (e.g. model weights); the case is
+                  skipped when one is missing
+        external: Whether the case needs an office application; these are
+                  skipped unless --external is given
+    """
+    name: str
+    tool: str
+    fixture: str
+    params: Dict[str, object] = field(default_factory=dict)
+    output: Optional[str] = None
+    requires: List[str] = field(default_factory=list)
+    external: bool = False
+
+
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase('pdf2img_text_10p', 'pdf2img', 'text_pdf', output='pages',
+                  params={'use_cache': False}),
+    BenchmarkCase('pdf2xlsx_tables_5p', 'pdf2xlsx', 'table_pdf', output='tables.xlsx'),
+    BenchmarkCase('pdf2docx_text_10p', 'pdf2docx', 'text_pdf', output='text.docx'),
+    BenchmarkCase('pdf2docx_text_10p_mp', 'pdf2docx', 'text_pdf', output='text_mp.docx',
+                  params={'multi_processing': True, 'cpu_count': 4}),
+    BenchmarkCase('img2pdf_a4_x5', 'img2pdf', 'photo_set', output='combined.pdf'),
+    BenchmarkCase('resize_rgb_4000_to_1024', 'resize', 'photo_rgb_large', output='resized.jpg',
+                  params={'size': (1024, 768), 'color_mode': 'RGB'}),
+    BenchmarkCase('resize_rgba_4000_to_1024', 'resize', 'photo_rgba_large', output='resized.png',
+                  params={'size': (1024, 768)}),
+    BenchmarkCase('resize_android_icons', 'resize', 'icon_source', params={'android_mode': True}),
+    BenchmarkCase('ico_from_1024', 'ico', 'icon_source', output='icon.ico'),
+    BenchmarkCase('iconset_from_1024', 'iconset', 'icon_source', output='icons'),
+    BenchmarkCase('iconbundle_all_from_1024', 'iconbundle', 'icon_source', output='bundle'),
+    BenchmarkCase('android_icons_from_1024', 'android', 'icon_source', output='android_res'),
+    BenchmarkCase('rmbg_1024x768', 'rmbg', 'photo_rgb_medium', output='nobg.png'),
+    BenchmarkCase('upscale_x2_320x240', 'upscale', 'photo_rgb_small', output='upscaled.png',
+                  params={'scale_factor': 2}, requires=['models/EDSR_x2.pb']),
+    BenchmarkCase('upscale_x4_320x240', 'upscale', 'photo_rgb_small', output='upscaled.png',
+                  params={'scale_factor': 4}, requires=['models/EDSR_x4.pb']),
+    BenchmarkCase('docx2pdf_60p', 'docx2pdf', 'docx_doc', output='document.pdf', external=True),
+    BenchmarkCase('ppt2pdf_20_slides', 'ppt2pdf', 'pptx_deck', output='deck.pdf', external=True),
+]
@@ -0,0 +1,173 @@
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+import fitz  # PyMuPDF
+import numpy as np
+from PIL import Image, ImageDraw
+
+# Bump when a generator changes so cached fixtures are rebuilt
+FIXTURE_VERSION = 1
+
+SEED = 20240601
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud "
+    "exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. "
+)
+
+
+def make_text_pdf(path: Path, pages: int = 10) -> None:
+    """
+    Write a multi-page A4 PDF with headings, paragraphs and a vector figure per page.
+    """
+    doc = fitz.open()
+    for number in range(1, pages + 1):
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((56, 72), f"Section {number}", fontsize=20)
+        page.insert_textbox(fitz.Rect(56, 96, 539, 520), LOREM * 6, fontsize=11)
+        page.draw_rect(fitz.Rect(56, 540, 539, 780), color=(0.2, 0.3, 0.6), fill=(0.85, 0.9, 1.0))
+        page.draw_circle((297, 660), 80 - number, color=(0.6, 0.1, 0.1), fill=(1.0, 0.8, 0.8))
+    doc.save(str(path), deflate=True)
+    doc.close()
+
+
+def make_table_pdf(path: Path, pages: int = 5, rows: int = 25, columns: int = 5) -> None:
+    """
+    Write a PDF whose pages each hold one ruled table with a header row.
+    """
+    rng = np.random.RandomState(SEED)
+    doc = fitz.open()
+    cell_w, cell_h = 96, 24
+    for number in range(1, pages + 1):
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((56, 56), f"Report table {number}", fontsize=14)
+        left, top = 56, 72
+        for row in range(rows + 1):
+            for col in range(columns):
+                rect = fitz.Rect(left + col * cell_w, top + row * cell_h,
+                                 left + (col + 1) * cell_w, top + (row + 1) * cell_h)
+                page.draw_rect(rect, color=(0, 0, 0), width=0.5)
+                text = f"Column {col + 1}" if row == 0 else f"{rng.randint(0, 100000):,}"
+                page.insert_text((rect.x0 + 4, rect.y1 - 7), text, fontsize=9)
+    doc.save(str(path), deflate=True)
+    doc.close()
+
+
+def make_photo(path: Path, size: Tuple[int, int], mode: str = 'RGB', seed: int = SEED) -> None:
+    """
+    Write a photo-like image: smooth gradients, shapes and a little seeded noise,
+    so encoders and models see realistic (not trivially compressible) content.
+    """
+    width, height = size
+    rng = np.random.RandomState(seed)
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    base = np.stack([
+        127 + 127 * np.sin(x / width * 6.0),
+        127 + 127 * np.cos(y / height * 4.0),
+        127 + 127 * np.sin((x + y) / (width + height) * 10.0)
+    ], axis=-1)
+    base += rng.normal(0, 6, size=base.shape)
+    img = Image.fromarray(np.clip(base, 0, 255).astype(np.uint8), 'RGB')
+
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x0, y0 = int(rng.randint(0, width)), int(rng.randint(0, height))
+        radius = int(rng.randint(min(size) // 20, min(size) // 6))
+        color = tuple(int(c) for c in rng.randint(0, 256, size=3))
+        draw.ellipse((x0 - radius, y0 - radius, x0 + radius, y0 + radius), fill=color)
+
+    if mode == 'RGBA':
+        alpha = Image.fromarray((255 * (0.5 + 0.5 * np.sin(x / width * 3.0))).astype(np.uint8), 'L')
+        img.putalpha(alpha)
+    img.save(path)
+
+
+def make_icon_source(path: Path, size: int = 1024) -> None:
+    """
+    Write a square RGBA logo with a transparent background.
+    """
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    margin = size // 10
+    draw.rounded_rectangle((margin, margin, size - margin, size - margin),
+                           radius=size // 6, fill=(30, 110, 200, 255))
+    draw.ellipse((size // 3, size // 3, 2 * size // 3, 2 * size // 3), fill=(255, 255, 255, 255))
+    img.save(path)
+
+
+def make_docx(path: Path, paragraphs: int = 60) -> None:
+    """
+    Write a DOCX with headings, paragraphs and a table.
+    """
+    from docx import Document
+    document = Document()
+    for index in range(paragraphs):
+        if index % 10 == 0:
+            document.add_heading(f"Chapter {index // 10 + 1}", level=1)
+        document.add_paragraph(LOREM * 2)
+    table = document.add_table(rows=20, cols=4)
+    for row_index, row in enumerate(table.rows):
+        for col_index, cell in enumerate(row.cells):
+            cell.text = f"{row_index}.{col_index}"
+    document.save(str(path))
+
+
+def make_pptx(path: Path, slides: int = 20) -> None:
+    """
+    Write a PPTX deck with a title and bullet text per slide.
+    """
+    from pptx import Presentation
+    deck = Presentation()
+    layout = deck.slide_layouts[1]
+    for index in range(slides):
+        slide = deck.slides.add_slide(layout)
+        slide.shapes.title.text = f"Slide {index + 1}"
+        slide.placeholders[1].text = LOREM
+    deck.save(str(path))
+
+
+FIXTURES: Dict[str, Tuple[str, Callable[[Path], None]]] = {
+    'text_pdf': ('text_10p.pdf', lambda p: make_text_pdf(p, pages=10)),
+    'table_pdf': ('tables_5p.pdf', lambda p: make_table_pdf(p, pages=5)),
+    'photo_rgb_large': ('photo_4000x3000.jpg', lambda p: make_photo(p, (4000, 3000))),
+    'photo_rgba_large': ('photo_4000x3000.png', lambda p: make_photo(p, (4000, 3000), 'RGBA')),
+    'photo_rgb_medium': ('photo_1024x768.png', lambda p: make_photo(p, (1024, 768))),
+    'photo_rgb_small': ('photo_320x240.png', lambda p: make_photo(p, (320, 240))),
+    'icon_source': ('icon_1024.png', make_icon_source),
+    'docx_doc': ('document_60p.docx', make_docx),
+    'pptx_deck': ('deck_20.pptx', make_pptx),
+}
+
+# Fixtures made of several files: name -> (file names, generator per index)
+MULTI_FIXTURES: Dict[str, Tuple[List[str], Callable[[Path, int], None]]] = {
+    # Five A4 pages at 300 DPI
+    'photo_set': ([f"set_{i}.jpg" for i in range(5)],
+                  lambda p, i: make_photo(p, (2480, 3508), seed=SEED + i)),
+}
+
+
+def ensure_fixture(name: str, fixtures_dir: Path):
+    """
+    Return the path of a fixture, generating it on first use.
+
+    Returns:
+        Path, or a list of paths for multi-file fixtures
+    """
+    target_dir = fixtures_dir / f"v{FIXTURE_VERSION}"
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    if name in MULTI_FIXTURES:
+        filenames, generate_one = MULTI_FIXTURES[name]
+        paths = []
+        for index, filename in enumerate(filenames):
+            path = target_dir / filename
+            if not path.exists():
+                generate_one(path, index)
+            paths.append(path)
+        return paths
+
+    filename, generate = FIXTURES[name]
+    path = target_dir / filename
+    if not path.exists():
+        generate(path)
+    return path
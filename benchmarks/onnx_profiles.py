@@ -0,0 +1,121 @@
+"""
+Micro-benchmark of ONNX Runtime session profiles for background removal.
+
+Measures, per profile, single-image latency (one image at a time) and
+multi-image throughput (as many images in flight as the profile has
+sessions), then recommends a profile for each goal on this host.
+
+Usage (from the repository root):
+    python -m benchmarks.onnx_profiles
+    python -m benchmarks.onnx_profiles --images 32 --sessions 2,4,8
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional, Sequence
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from benchmarks.fixtures import ensure_fixture
+from benchmarks.run import DEFAULT_FIXTURES_DIR
+
+
+def measure(profile, image, repeat: int, images: int, model_name: str) -> dict:
+    from src.infrastructure.image_services.onnx_sessions import RembgSessionPool
+
+    started = time.perf_counter()
+    pool = RembgSessionPool(model_name, profile)
+    pool.warm_up()
+    setup_seconds = time.perf_counter() - started
+
+    latencies = []
+    for _ in range(repeat):
+        with pool.session() as session:
+            started = time.perf_counter()
+            session.predict(image)
+            latencies.append(time.perf_counter() - started)
+
+    def predict_one(_):
+        with pool.session() as session:
+            session.predict(image)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        list(executor.map(predict_one, range(images)))
+    throughput_seconds = time.perf_counter() - started
+
+    return {
+        'profile': profile.name,
+        'sessions': pool.size,
+        'intra_op_threads': profile.intra_op_threads,
+        'setup_seconds': round(setup_seconds, 3),
+        'latency_median': statistics.median(latencies),
+        'latency_min': min(latencies),
+        'images_per_second': images / throughput_seconds
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.onnx_profiles',
+                                     description='Compare ONNX Runtime session profiles')
+    parser.add_argument('--model', default='u2net', help='rembg model (default u2net)')
+    parser.add_argument('--profiles', default='default,latency,throughput',
+                        help='Comma-separated profiles to compare')
+    parser.add_argument('--sessions', default='',
+                        help='Extra throughput variants with these session counts, e.g. 2,4,8')
+    parser.add_argument('--repeat', type=int, default=5, help='Single-image runs for latency (default 5)')
+    parser.add_argument('--images', type=int, default=16, help='Images for the throughput run (default 16)')
+    parser.add_argument('--fixtures-dir', type=Path, default=DEFAULT_FIXTURES_DIR,
+                        help='Where generated fixtures are cached')
+    parser.add_argument('--json', action='store_true', help='Print JSON instead of a table')
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    from PIL import Image
+    from src.infrastructure.image_services.onnx_sessions import session_profile
+
+    profiles = [session_profile(name.strip()) for name in args.profiles.split(',') if name.strip()]
+    throughput = session_profile('throughput')
+    for count in (int(c) for c in args.sessions.split(',') if c.strip()):
+        profiles.append(replace(throughput, name=f"throughput-{count}", sessions=count))
+
+    with Image.open(ensure_fixture('photo_rgb_medium', args.fixtures_dir)) as img:
+        image = img.convert('RGB')
+
+    results: List[dict] = []
+    for profile in profiles:
+        print(f"measuring {profile.name} ...", file=sys.stderr)
+        results.append(measure(profile, image, args.repeat, args.images, args.model))
+
+    best_latency = min(results, key=lambda r: r['latency_median'])
+    best_throughput = max(results, key=lambda r: r['images_per_second'])
+    if args.json:
+        json.dump({'results': results, 'latency': best_latency['profile'],
+                   'throughput': best_throughput['profile']}, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return 0
+
+    print(f"{'profile':16} {'sessions':>8} {'latency s':>10} {'images/s':>9} {'setup s':>8}")
+    for r in results:
+        print(f"{r['profile']:16} {r['sessions']:8} {r['latency_median']:10.3f} "
+              f"{r['images_per_second']:9.2f} {r['setup_seconds']:8.2f}")
+    print(f"\nFastest single image: {environment(best_latency)}")
+    print(f"Highest throughput:   {environment(best_throughput)}")
+    return 0
+
+
+def environment(result: dict) -> str:
+    """
+    Environment settings that select a measured profile.
+    """
+    name, _, sessions = result['profile'].partition('-')
+    return f"HIEL_ONNX_PROFILE={name}" + (f" HIEL_ONNX_SESSIONS={sessions}" if sessions else '')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
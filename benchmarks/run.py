@@ -0,0 +1,268 @@
+"""
+Benchmark runner for the converters and image services.
+
+Each case runs in its own child process so peak RSS is measured per case and
+one service's caches or loaded models cannot skew another's numbers.
+
+Usage (from the repository root):
+    python -m benchmarks.run                         # run every case
+    python -m benchmarks.run -k resize --repeat 5    # cases whose name contains 'resize'
+    python -m benchmarks.run --save baseline.json    # record a baseline
+    python -m benchmarks.run --compare baseline.json # fail on regressions
+"""
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_FIXTURES_DIR = ROOT / 'benchmarks' / '.fixtures'
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Peak resident set size of this process, or None if it cannot be measured.
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset
+    except (ImportError, AttributeError):
+        return None
+
+
+def run_case_in_process(case_name: str, repeat: int, warmup: int, fixtures_dir: Path) -> dict:
+    """
+    Run one case in this process and return its measurements.
+
+    Called in the child process started by run_case().
+    """
+    from benchmarks.cases import CASES
+    from benchmarks.fixtures import ensure_fixture
+    from src.infrastructure.monitoring.instrumentation import add_sink
+    from src.infrastructure.monitoring.metrics_sinks import MemoryMetricsSink
+    from src.presentation.cli.tools import TOOLS
+
+    case = next(c for c in CASES if c.name == case_name)
+    tool = TOOLS[case.tool]
+
+    setup_started = time.perf_counter()
+    fixture = ensure_fixture(case.fixture, fixtures_dir)
+    fixture_seconds = time.perf_counter() - setup_started
+
+    setup_started = time.perf_counter()
+    service = tool.create_service()
+    method = getattr(service, tool.method)
+    setup_seconds = time.perf_counter() - setup_started
+
+    sink = MemoryMetricsSink(capacity=10000)
+    add_sink(sink)
+
+    timings = []
+    with tempfile.TemporaryDirectory(prefix='hiel_bench_') as scratch:
+        # Never read pages cached by earlier runs or other processes
+        os.environ['HIEL_PAGE_CACHE_DIR'] = str(Path(scratch) / 'page_cache')
+        for iteration in range(warmup + repeat):
+            run_dir = Path(scratch) / str(iteration)
+            run_dir.mkdir()
+            if case.output is None:
+                # Services that write next to their input get a private copy
+                inputs = [Path(shutil.copy(p, run_dir)) for p in fixture] if isinstance(fixture, list) \
+                    else Path(shutil.copy(fixture, run_dir))
+                output = None
+            else:
+                inputs = fixture
+                output = str(run_dir / case.output)
+            input_arg = [str(p) for p in inputs] if isinstance(inputs, list) else str(inputs)
+
+            if iteration == warmup:
+                sink.clear()
+            started = time.perf_counter()
+            method(input_arg, output, **case.params)
+            elapsed = time.perf_counter() - started
+            if iteration >= warmup:
+                timings.append(elapsed)
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+    counters: Dict[str, float] = {}
+    stages: Dict[str, float] = {}
+    for metrics in sink.records():
+        for name, value in metrics.counters.items():
+            counters[name] = counters.get(name, 0) + value
+        for name, value in metrics.stages.items():
+            stages[name] = stages.get(name, 0.0) + value
+    measured = sum(timings)
+
+    return {
+        'case': case.name,
+        'tool': case.tool,
+        'status': 'ok',
+        'repeat': repeat,
+        'wall_seconds': {
+            'median': statistics.median(timings),
+            'min': min(timings),
+            'max': max(timings)
+        },
+        'setup_seconds': round(setup_seconds, 4),
+        'fixture_seconds': round(fixture_seconds, 4),
+        'peak_rss_bytes': peak_rss_bytes(),
+        'throughput': {f"{name}/s": value / measured for name, value in counters.items()} if measured else {},
+        'stages_per_run': {name: value / repeat for name, value in stages.items()}
+    }
+
+
+def run_case(case, repeat: int, warmup: int, fixtures_dir: Path, timeout: float) -> dict:
+    """
+    Run one case in a child process.
+    """
+    missing = [p for p in case.requires if not (ROOT / p).exists()]
+    if missing:
+        return {'case': case.name, 'tool': case.tool, 'status': 'skipped',
+                'reason': f"missing {', '.join(missing)}"}
+
+    command = [
+        sys.executable, '-m', 'benchmarks.run', '--child', case.name,
+        '--repeat', str(repeat), '--warmup', str(warmup),
+        '--fixtures-dir', str(fixtures_dir)
+    ]
+    try:
+        completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'case': case.name, 'tool': case.tool, 'status': 'failed',
+                'reason': f"timed out after {timeout:.0f}s"}
+
+    if completed.returncode != 0:
+        lines = (completed.stderr or completed.stdout).strip().splitlines()
+        reason = lines[-1] if lines else f"exit code {completed.returncode}"
+        status = 'skipped' if 'ModuleNotFoundError' in reason or 'ImportError' in reason else 'failed'
+        return {'case': case.name, 'tool': case.tool, 'status': status, 'reason': reason}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(results: List[dict], baseline: dict, time_tolerance: float, rss_tolerance: float) -> List[str]:
+    """
+    Compare results against a baseline report.
+
+    Returns:
+        One message per regression
+    """
+    previous = {r['case']: r for r in baseline.get('results', []) if r.get('status') == 'ok'}
+    regressions = []
+    for result in results:
+        before = previous.get(result['case'])
+        if result.get('status') != 'ok' or before is None:
+            continue
+
+        now_time, then_time = result['wall_seconds']['median'], before['wall_seconds']['median']
+        result['vs_baseline'] = {'wall_ratio': round(now_time / then_time, 3) if then_time else None}
+        if then_time and now_time > then_time * (1 + time_tolerance):
+            regressions.append(f"{result['case']}: median {now_time:.3f}s vs {then_time:.3f}s "
+                               f"(+{(now_time / then_time - 1) * 100:.0f}%)")
+
+        now_rss, then_rss = result.get('peak_rss_bytes'), before.get('peak_rss_bytes')
+        if now_rss and then_rss:
+            result['vs_baseline']['rss_ratio'] = round(now_rss / then_rss, 3)
+            if now_rss > then_rss * (1 + rss_tolerance):
+                regressions.append(f"{result['case']}: peak RSS {now_rss / 2**20:.0f} MiB vs "
+                                   f"{then_rss / 2**20:.0f} MiB (+{(now_rss / then_rss - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_table(results: List[dict]) -> None:
+    print(f"{'case':32} {'median s':>9} {'min s':>8} {'RSS MiB':>8}  throughput")
+    for r in results:
+        if r['status'] != 'ok':
+            print(f"{r['case']:32} {r['status'].upper():>9}  {r.get('reason', '')}")
+            continue
+        wall = r['wall_seconds']
+        rss = f"{r['peak_rss_bytes'] / 2**20:.0f}" if r.get('peak_rss_bytes') else '-'
+        rates = ', '.join(f"{value:.1f} {name}" for name, value in r['throughput'].items())
+        ratio = r.get('vs_baseline', {}).get('wall_ratio')
+        suffix = f"  [x{ratio} vs baseline]" if ratio else ''
+        print(f"{r['case']:32} {wall['median']:9.3f} {wall['min']:8.3f} {rss:>8}  {rates}{suffix}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description='Run the HiEL benchmark suite')
+    parser.add_argument('-k', '--filter', help='Only run cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case (default 3)')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed runs before timing (default 1)')
+    parser.add_argument('--fixtures-dir', type=Path, default=DEFAULT_FIXTURES_DIR,
+                        help='Where generated fixtures are cached')
+    parser.add_argument('--timeout', type=float, default=900, help='Per-case timeout in seconds')
+    parser.add_argument('--external', action='store_true', help='Include cases that need an office application')
+    parser.add_argument('--save', type=Path, help='Write the JSON report to this file')
+    parser.add_argument('--compare', type=Path, help='Baseline JSON report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='Allowed median slowdown before a case counts as a regression (default 0.10)')
+    parser.add_argument('--rss-tolerance', type=float, default=0.20,
+                        help='Allowed peak RSS growth before a case counts as a regression (default 0.20)')
+    parser.add_argument('--json', action='store_true', help='Print the JSON report instead of a table')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.child:
+        result = run_case_in_process(args.child, args.repeat, args.warmup, args.fixtures_dir)
+        print(json.dumps(result))
+        return 0
+
+    from benchmarks.cases import CASES
+    cases = [c for c in CASES
+             if (not args.filter or args.filter in c.name) and (args.external or not c.external)]
+    if not cases:
+        print("error: no benchmark cases selected", file=sys.stderr)
+        return 2
+
+    results = []
+    for case in cases:
+        print(f"running {case.name} ...", file=sys.stderr)
+        results.append(run_case(case, args.repeat, args.warmup, args.fixtures_dir, args.timeout))
+
+    regressions = []
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        regressions = compare(results, baseline, args.tolerance, args.rss_tolerance)
+
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'repeat': args.repeat,
+        'results': results,
+        'regressions': regressions
+    }
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print_table(results)
+        for message in regressions:
+            print(f"REGRESSION  {message}")
+
+    failed = any(r['status'] == 'failed' for r in results)
+    return 1 if regressions or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,27 @@
 import sys
-from PySide6.QtWidgets import QApplication
-from src.presentation.views.main_window import MainWindow
+from multiprocessing import freeze_support
 
 def main():
+    from src.application.logging_config import configure_logging
+    
+    # Command-line mode never imports PySide6, so it runs on headless servers
+    from src.presentation.cli.app import COMMANDS
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        from src.presentation.cli.app import main as cli_main
+        # Keep stderr clean for --json consumers; problems still reach the log file
+        configure_logging(console=False)
+        sys.exit(cli_main(sys.argv[1:]))
+    
+    configure_logging()
+    
+    from PySide6.QtWidgets import QApplication
+    from src.presentation.views.main_window import MainWindow
+    
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    freeze_support()
+    main()
\ No newline at end of file
@@ -0,0 +1,300 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+import logging
+import threading
+import time
+
+from src.domain.models.conversion_result import ConversionResult
+from src.domain.models.watch_rule import WatchRule
+from src.infrastructure.file_services.watch_ledger import WatchLedger
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional; the watcher falls back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+logger = logging.getLogger(__name__)
+
+# Files that are still being written by common tools, or are not documents
+IGNORED_PREFIXES = ('.', '~$')
+IGNORED_SUFFIXES = ('.tmp', '.part', '.partial', '.crdownload', '.download', '.swp')
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, notice: Callable[[Path], None]):
+        super().__init__()
+        self._notice = notice
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._notice(Path(event.src_path))
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._notice(Path(event.src_path))
+
+    def on_moved(self, event):
+        # Many scanners write a temporary name and rename it when done
+        if not event.is_directory:
+            self._notice(Path(event.dest_path))
+
+
+class FolderWatcher:
+    """
+    Converts files dropped into a folder, routed by file name rules.
+
+    New files are picked up from native file system events (inotify,
+    FSEvents, ReadDirectoryChangesW through the optional watchdog package)
+    or, without it, by polling. A file is only converted once its size and
+    modification time have not changed for `settle_seconds` and it can be
+    opened, so files still being copied or scanned are not read half-written.
+    Conversions run in a bounded thread pool, and a persistent ledger
+    remembers every handled file so a restart does not convert it again.
+    """
+
+    def __init__(self,
+                 folder: Union[str, Path],
+                 rules: Sequence[WatchRule],
+                 convert: Callable[[WatchRule, Path, Path], ConversionResult],
+                 ledger: WatchLedger,
+                 output_dir: Optional[Union[str, Path]] = None,
+                 max_workers: int = 2,
+                 settle_seconds: float = 2.0,
+                 poll_interval: float = 1.0,
+                 recursive: bool = False,
+                 use_native: bool = True,
+                 on_result: Optional[Callable[[ConversionResult], None]] = None):
+        """
+        Initialize the watcher.
+
+        Args:
+            folder: Folder to watch
+            rules: Routing rules; the first rule matching a file name wins
+            convert: Runs one conversion: (rule, input path, output directory) -> result
+            ledger: Record of handled files
+            output_dir: Default output directory. Defaults to '<folder>/converted',
+                        which is never watched itself
+            max_workers: Conversions run at the same time
+            settle_seconds: How long a file must stay unchanged before it is converted
+            poll_interval: Seconds between checks for settled files (and between
+                           folder scans when polling)
+            recursive: Also watch subfolders
+            use_native: Use native file system events when watchdog is installed
+            on_result: Optional callback for every finished conversion
+        """
+        if not rules:
+            raise ValueError("At least one watch rule is required")
+        self.folder = Path(folder)
+        if not self.folder.is_dir():
+            raise FileNotFoundError(f"Folder not found: {self.folder}")
+        self.rules = list(rules)
+        self.output_dir = Path(output_dir) if output_dir else self.folder / 'converted'
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self.recursive = recursive
+        self.native = use_native and Observer is not None
+        self._convert = convert
+        self._ledger = ledger
+        self._on_result = on_result
+
+        self._excluded = [self.output_dir.resolve()] + [
+            Path(rule.output_dir).resolve() for rule in self.rules if rule.output_dir
+        ]
+        self._pending: Dict[Path, Tuple[int, int, float]] = {}
+        self._in_flight: Set[Path] = set()
+        # Versions known to be in the ledger, so polling does not query it for every file
+        self._handled: Dict[Path, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # Bounds queued plus running conversions; the settle loop waits when full
+        self._slots = threading.BoundedSemaphore(max(1, max_workers) * 2)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='hiel-watch')
+        self._threads: List[threading.Thread] = []
+        self._observer = None
+
+    def start(self) -> None:
+        """
+        Queue files already in the folder and start watching for new ones.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.scan()
+
+        if self.native:
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self.notice), str(self.folder), recursive=self.recursive)
+            self._observer.start()
+        else:
+            self._start_thread(self._poll_loop, 'hiel-watch-poll')
+        self._start_thread(self._settle_loop, 'hiel-watch-settle')
+        logger.info("Watching %s (%s) with %d rule(s)", self.folder,
+                    'native events' if self.native else f'polling every {self.poll_interval}s', len(self.rules))
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop watching. Running conversions finish when `wait` is True.
+        """
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def run_forever(self) -> None:
+        """
+        Watch until interrupted with Ctrl+C.
+        """
+        self.start()
+        try:
+            while not self._stop.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            logger.info("Stopping watcher")
+        finally:
+            self.stop()
+
+    def run_once(self) -> None:
+        """
+        Convert the files currently in the folder, then return.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.scan()
+        while True:
+            self._dispatch_settled()
+            with self._lock:
+                if not self._pending:
+                    break
+            time.sleep(min(self.poll_interval, self.settle_seconds) or 0.1)
+        self.stop()
+
+    def scan(self) -> None:
+        """
+        Notice every file currently in the folder.
+        """
+        paths = self.folder.rglob('*') if self.recursive else self.folder.iterdir()
+        for path in paths:
+            self.notice(path)
+
+    def notice(self, path: Path) -> None:
+        """
+        Register a new or changed file; it is converted once it has settled.
+        """
+        if not self._wanted(path):
+            return
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        version = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if path in self._in_flight or self._handled.get(path) == version:
+                return
+            previous = self._pending.get(path)
+            if previous is None or previous[:2] != version:
+                # A file last modified longer ago than the settle time (e.g. found
+                # by the startup scan) counts as settled already
+                age = min(max(0.0, time.time() - stat.st_mtime), self.settle_seconds)
+                self._pending[path] = (*version, time.monotonic() - age)
+
+    def rule_for(self, path: Path) -> Optional[WatchRule]:
+        return next((rule for rule in self.rules if rule.matches(path)), None)
+
+    def _wanted(self, path: Path) -> bool:
+        name = path.name
+        if name.startswith(IGNORED_PREFIXES) or name.lower().endswith(IGNORED_SUFFIXES):
+            return False
+        if self.rule_for(path) is None or not path.is_file():
+            return False
+        resolved = path.resolve()
+        return not any(resolved.is_relative_to(excluded) for excluded in self._excluded)
+
+    def _start_thread(self, target: Callable[[], None], name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.scan()
+            except OSError as e:
+                logger.warning("Scanning %s failed: %s", self.folder, e)
+
+    def _settle_loop(self) -> None:
+        while not self._stop.wait(min(self.poll_interval, self.settle_seconds) or 0.1):
+            self._dispatch_settled()
+
+    def _dispatch_settled(self) -> None:
+        now = time.monotonic()
+        ready = []
+        with self._lock:
+            for path, (size, mtime_ns, since) in list(self._pending.items()):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    del self._pending[path]  # Deleted or renamed before it settled
+                    continue
+                if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                    self._pending[path] = (stat.st_size, stat.st_mtime_ns, now)
+                elif now - since >= self.settle_seconds:
+                    del self._pending[path]
+                    ready.append(path)
+
+        for path in ready:
+            rule = self.rule_for(path)
+            if self._ledger.contains(path, rule.tool):
+                self._mark_handled(path)
+                continue
+            if not self._can_open(path):
+                self.notice(path)  # Still locked by the writer; check again later
+                continue
+            self._slots.acquire()
+            with self._lock:
+                self._in_flight.add(path)
+            self._executor.submit(self._run, rule, path)
+
+    def _mark_handled(self, path: Path) -> None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        with self._lock:
+            self._handled[path] = (stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def _can_open(path: Path) -> bool:
+        # On Windows a file being copied cannot be opened until the copy finishes
+        try:
+            with open(path, 'rb'):
+                return True
+        except OSError:
+            return False
+
+    def _run(self, rule: WatchRule, path: Path) -> None:
+        output_dir = Path(rule.output_dir) if rule.output_dir else self.output_dir
+        started = time.perf_counter()
+        try:
+            try:
+                result = self._convert(rule, path, output_dir)
+            except Exception as e:
+                result = ConversionResult(str(path), None, time.perf_counter() - started, str(e))
+            # Record before releasing the file so a rescan cannot queue it again
+            self._ledger.record(path, rule.tool, result)
+            self._mark_handled(path)
+        finally:
+            with self._lock:
+                self._in_flight.discard(path)
+            self._slots.release()
+
+        if result.succeeded:
+            logger.info("Converted %s with %s in %.2fs", path, rule.tool, result.seconds)
+        else:
+            logger.error("Converting %s with %s failed: %s", path, rule.tool, result.error)
+        if self._on_result:
+            self._on_result(result)
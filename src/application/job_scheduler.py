@@ -0,0 +1,311 @@
+from concurrent.futures import Future
+from enum import Enum, IntEnum
+from typing import Any, Callable, Dict, List, Optional
+import itertools
+import logging
+import os
+import queue
+import threading
+
+from src.domain.models.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceClass(Enum):
+    """
+    Kind of resource a job mostly consumes. Each class has its own worker pool.
+    """
+    CPU = 'cpu'            # Rasterization, resizing, PDF parsing
+    MODEL = 'model'        # ML inference (rembg, EDSR); large memory footprint
+    EXTERNAL = 'external'  # Work done by another process (LibreOffice, Office, Java)
+
+
+class JobPriority(IntEnum):
+    """
+    Lower values are started first within a resource class.
+    """
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class JobState(Enum):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+
+def default_limits() -> Dict[ResourceClass, int]:
+    """
+    Concurrency caps per resource class, overridable with HIEL_MAX_CPU_JOBS,
+    HIEL_MAX_MODEL_JOBS and HIEL_MAX_EXTERNAL_JOBS.
+    """
+    cpus = os.cpu_count() or 1
+    return {
+        ResourceClass.CPU: int(os.environ.get('HIEL_MAX_CPU_JOBS', max(1, cpus // 2))),
+        ResourceClass.MODEL: int(os.environ.get('HIEL_MAX_MODEL_JOBS', 1)),
+        ResourceClass.EXTERNAL: int(os.environ.get('HIEL_MAX_EXTERNAL_JOBS', 2))
+    }
+
+
+class Job:
+    """
+    Handle for a submitted task.
+
+    Attributes:
+        id: Sequential job identifier
+        name: Human-readable job name
+        resource_class: Pool the job runs in
+        priority: Scheduling priority within the pool
+        future: Future resolved with the task's return value or exception
+        cancel_token: Optional token used to stop the task once it is running
+    """
+
+    def __init__(self,
+                 job_id: int,
+                 name: str,
+                 fn: Callable[..., Any],
+                 args: tuple,
+                 kwargs: dict,
+                 resource_class: ResourceClass,
+                 priority: JobPriority,
+                 cancel_token: Optional[CancellationToken] = None):
+        self.id = job_id
+        self.name = name
+        self.resource_class = resource_class
+        self.priority = priority
+        self.future: Future = Future()
+        self.cancel_token = cancel_token
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    @property
+    def state(self) -> JobState:
+        if self.future.cancelled():
+            return JobState.CANCELLED
+        if self.future.done():
+            return JobState.FAILED if self.future.exception() is not None else JobState.COMPLETED
+        if self.future.running():
+            return JobState.RUNNING
+        return JobState.PENDING
+
+    def cancel(self) -> bool:
+        """
+        Cancel the job. A pending job is dropped; a running job is asked to
+        stop through its cancel token, if it has one.
+
+        Returns:
+            True if the job will not run or has been asked to stop
+        """
+        if self.future.cancel():
+            return True
+        if self.cancel_token is not None and not self.future.done():
+            self.cancel_token.cancel()
+            return True
+        return False
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.future.result(timeout)
+
+    def add_done_callback(self, callback: Callable[['Job'], None]) -> None:
+        self.future.add_done_callback(lambda _: callback(self))
+
+    def _run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+    def __repr__(self) -> str:
+        return f"Job(id={self.id}, name={self.name!r}, class={self.resource_class.value}, state={self.state.value})"
+
+
+class _ResourcePool:
+    """
+    Priority queue plus a capped set of worker threads for one resource class.
+    """
+
+    def __init__(self, resource_class: ResourceClass, limit: int):
+        self.resource_class = resource_class
+        self._limit = max(1, limit)
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._idle = 0
+        self._shutdown = False
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def set_limit(self, limit: int) -> None:
+        with self._lock:
+            self._limit = max(1, limit)
+        # Surplus workers retire after their current job when the cap is lowered
+        self._ensure_workers()
+
+    def put(self, job: Job) -> None:
+        self._queue.put((job.priority, job.id, job))
+        self._ensure_workers()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def shutdown(self, wait: bool) -> None:
+        with self._lock:
+            self._shutdown = True
+            workers = list(self._workers)
+        for _ in workers:
+            self._queue.put((JobPriority.LOW + 1, -1, None))
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if self._shutdown:
+                return
+            self._workers = [w for w in self._workers if w.is_alive()]
+            if self._queue.qsize() > self._idle and len(self._workers) < self._limit:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"hiel-{self.resource_class.value}-{len(self._workers)}",
+                    daemon=True
+                )
+                self._workers.append(worker)
+                worker.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                self._idle += 1
+            _, _, job = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+                # Leave the count right away, so only the surplus retires and
+                # not every worker that sees it before the first one is gone
+                retire = job is not None and len(self._workers) > self._limit
+                if retire:
+                    self._workers.remove(threading.current_thread())
+            if job is None:
+                return
+
+            logger.debug("Starting %r", job)
+            job._run()
+            logger.debug("Finished %r", job)
+
+            if retire:
+                if self._queue.qsize():
+                    self._ensure_workers()
+                return
+
+
+class JobScheduler:
+    """
+    Central scheduler for converter and image-processing tasks.
+
+    Each resource class has its own pool with a concurrency cap, so e.g. a
+    background removal, an upscale and a PDF rasterization can run together
+    without two model inferences competing for memory.
+    """
+
+    def __init__(self, limits: Optional[Dict[ResourceClass, int]] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            limits: Optional per-class concurrency caps. Missing classes use default_limits()
+        """
+        caps = default_limits()
+        caps.update(limits or {})
+        self._pools = {rc: _ResourcePool(rc, caps[rc]) for rc in ResourceClass}
+        self._ids = itertools.count(1)
+        self._jobs: Dict[int, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self,
+               fn: Callable[..., Any],
+               *args,
+               resource_class: ResourceClass = ResourceClass.CPU,
+               priority: JobPriority = JobPriority.NORMAL,
+               name: Optional[str] = None,
+               cancel_token: Optional[CancellationToken] = None,
+               **kwargs) -> Job:
+        """
+        Queue a task for execution.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            resource_class: Pool the task runs in
+            priority: Scheduling priority within the pool
+            name: Optional job name for logs and the UI
+            cancel_token: Token the task observes; cancelling the job cancels it.
+                          Not passed to fn, so pass it in kwargs as well if needed
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Job handle
+        """
+        job = Job(next(self._ids), name or getattr(fn, '__name__', 'job'),
+                  fn, args, kwargs, resource_class, priority, cancel_token)
+        with self._lock:
+            self._jobs[job.id] = job
+        job.future.add_done_callback(lambda _: self._forget(job.id))
+        self._pools[resource_class].put(job)
+        return job
+
+    def cancel(self, job: Job) -> bool:
+        return job.cancel()
+
+    def cancel_all(self) -> int:
+        """
+        Cancel every pending job and signal running jobs that have a cancel token.
+
+        Returns:
+            Number of cancelled jobs
+        """
+        return sum(1 for job in self.active_jobs() if job.cancel())
+
+    def active_jobs(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def set_limit(self, resource_class: ResourceClass, limit: int) -> None:
+        self._pools[resource_class].set_limit(limit)
+
+    def limit(self, resource_class: ResourceClass) -> int:
+        return self._pools[resource_class].limit
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        if cancel_pending:
+            self.cancel_all()
+        for pool in self._pools.values():
+            pool.shutdown(wait)
+
+    def _forget(self, job_id: int) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+
+_scheduler: Optional[JobScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> JobScheduler:
+    """
+    Return the process-wide scheduler, creating it on first use.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = JobScheduler()
+        return _scheduler
@@ -0,0 +1,134 @@
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Optional, Union
+import atexit
+import logging
+import os
+import queue
+
+LOG_FORMAT = '%(asctime)s %(levelname)-7s [%(threadName)s] %(name)s: %(message)s'
+
+# Third-party loggers that are chatty at INFO
+DEFAULT_MODULE_LEVELS = {
+    'pdf2docx': logging.WARNING,
+    'PIL': logging.INFO,
+    'urllib3': logging.WARNING,
+}
+
+_listener: Optional[QueueListener] = None
+
+
+def default_log_file() -> Path:
+    """
+    Per-user log file location, overridable with HIEL_LOG_FILE.
+    """
+    env_path = os.environ.get('HIEL_LOG_FILE')
+    if env_path:
+        return Path(env_path)
+    base = os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_STATE_HOME') or Path.home() / '.local' / 'state'
+    return Path(base) / 'hiel' / 'hiel.log'
+
+
+def parse_module_levels(spec: str) -> Dict[str, int]:
+    """
+    Parse 'module=LEVEL,module=LEVEL' into a mapping of logger names to levels.
+
+    Example:
+        parse_module_levels('src.infrastructure=DEBUG,pdf2docx=ERROR')
+    """
+    levels = {}
+    for item in spec.split(','):
+        if not item.strip():
+            continue
+        if '=' not in item:
+            raise ValueError(f"Log level must be MODULE=LEVEL: {item}")
+        name, level = item.split('=', 1)
+        levels[name.strip()] = _level(level)
+    return levels
+
+
+def _level(value: Union[str, int]) -> int:
+    if isinstance(value, int):
+        return value
+    level = logging.getLevelName(value.strip().upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {value}")
+    return level
+
+
+def configure_logging(level: Union[str, int, None] = None,
+                      module_levels: Optional[Dict[str, Union[str, int]]] = None,
+                      log_file: Union[str, Path, None] = None,
+                      console: bool = True,
+                      max_bytes: int = 5 * 1024 * 1024,
+                      backup_count: int = 3) -> None:
+    """
+    Configure logging for the whole process. Called once by the entry point.
+
+    Records are put on a queue by a QueueHandler and written by a background
+    QueueListener, so the threads doing conversions never block on file or
+    console I/O. Services only log through their module loggers.
+
+    Args:
+        level: Root level. Defaults to HIEL_LOG_LEVEL or WARNING
+        module_levels: Per-logger levels, merged over DEFAULT_MODULE_LEVELS and
+                       HIEL_LOG_LEVELS ('module=LEVEL,...')
+        log_file: Rotating log file. Defaults to default_log_file(); pass ''
+                  to disable file logging
+        console: Whether to also log to stderr
+        max_bytes: Size at which the log file is rotated
+        backup_count: Number of rotated files kept
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    root_level = _level(level if level is not None else os.environ.get('HIEL_LOG_LEVEL', 'WARNING'))
+    levels = dict(DEFAULT_MODULE_LEVELS)
+    levels.update(parse_module_levels(os.environ.get('HIEL_LOG_LEVELS', '')))
+    levels.update({name: _level(value) for name, value in (module_levels or {}).items()})
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
+
+    if log_file is None:
+        log_file = default_log_file()
+    if log_file:
+        log_file = Path(log_file)
+        try:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes,
+                                               backupCount=backup_count, encoding='utf-8', delay=True)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError as e:
+            logging.getLogger(__name__).warning("File logging disabled: %s", e)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(root_level)
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the background writer.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
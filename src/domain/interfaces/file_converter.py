@@ -1,19 +1,54 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import BinaryIO, List, Optional, Union
 from pathlib import Path
+from src.domain.models.cancellation import CancellationToken
+
+# In-memory input accepted by the buffer-based methods: raw bytes or a
+# readable binary file object (read from its current position)
+BinarySource = Union[bytes, bytearray, memoryview, BinaryIO]
 
 class FileConverter(ABC):
     @abstractmethod
-    def convert(self, input_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None, **kwargs) -> Union[str, List[str]]:
+    def convert(self, 
+                input_path: Union[str, Path], 
+                output_path: Optional[Union[str, Path]] = None, 
+                *,
+                cancel_token: Optional[CancellationToken] = None,
+                **kwargs) -> Union[str, List[str]]:
         """
         Convert a file from one format to another.
         
         Args:
             input_path: Path to the input file
             output_path: Optional path for the output file/directory
+            cancel_token: Optional token checked between units of work. When it is
+                          cancelled or its deadline passes, partial outputs are removed
+                          and OperationCancelledError is raised. Keyword-only, as is
+                          any progress callback an implementation adds
             **kwargs: Additional conversion parameters
             
         Returns:
             Path or list of paths to the converted file(s)
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def convert_buffer(self,
+                       data: BinarySource,
+                       *,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> Union[bytes, List[bytes]]:
+        """
+        Convert a document that is already in memory, without touching the
+        caller's file system.
+        
+        Args:
+            data: Input document as bytes or a binary file object
+            cancel_token: Optional token checked between units of work. Keyword-only,
+                          as for convert()
+            **kwargs: Additional conversion parameters, as for convert()
+            
+        Returns:
+            Converted document bytes, or one bytes object per output file
+        """
+        pass
\ No newline at end of file
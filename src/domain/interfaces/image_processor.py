@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Union, Tuple
+from typing import Any, Optional, Union, Tuple
 from pathlib import Path
+from src.domain.interfaces.file_converter import BinarySource
+from src.domain.models.cancellation import CancellationToken
+
+# Encoded image bytes, a binary file object, or an already decoded
+# PIL.Image.Image (the domain layer does not depend on PIL)
+ImageSource = Union[BinarySource, Any]
 
 class ImageProcessor(ABC):
     @abstractmethod
@@ -8,6 +14,8 @@ class ImageProcessor(ABC):
                 input_path: Union[str, Path], 
                 output_path: Optional[Union[str, Path]] = None,
                 size: Optional[Tuple[int, int]] = None,
+                *,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> str:
         """
         Process an image file.
@@ -16,9 +24,38 @@ class ImageProcessor(ABC):
             input_path: Path to the input image
             output_path: Optional path for the output image
             size: Optional tuple of (width, height) for resizing
+            cancel_token: Optional token checked between units of work. When it is
+                          cancelled or its deadline passes, partial outputs are removed
+                          and OperationCancelledError is raised. Keyword-only, as is
+                          any progress callback an implementation adds
             **kwargs: Additional processing parameters
             
         Returns:
             Path to the processed image
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def process_buffer(self,
+                       source: ImageSource,
+                       size: Optional[Tuple[int, int]] = None,
+                       *,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> bytes:
+        """
+        Process an image that is already in memory.
+        
+        A PIL image passed as source is not modified.
+        
+        Args:
+            source: Encoded image bytes, a binary file object or a PIL image
+            size: Optional tuple of (width, height) for resizing
+            cancel_token: Optional token checked between units of work. Keyword-only,
+                          as for process()
+            **kwargs: Additional processing parameters, as for process(), and
+                      format: output format name, e.g. 'png' or 'jpeg'
+            
+        Returns:
+            Encoded output image
+        """
+        pass
\ No newline at end of file
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from src.domain.models.job_metrics import JobMetrics
+
+class MetricsSink(ABC):
+    """
+    Destination for the JobMetrics recorded by instrumented services.
+    
+    emit() is called on the thread that ran the job, so implementations must be
+    thread-safe and cheap.
+    """
+    
+    @abstractmethod
+    def emit(self, metrics: JobMetrics) -> None:
+        """
+        Record the metrics of one finished job.
+        
+        Args:
+            metrics: Metrics of the finished job
+        """
+        pass
+    
+    def close(self) -> None:
+        """
+        Release any resources held by the sink.
+        """
+        pass
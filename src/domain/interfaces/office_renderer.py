@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+from pathlib import Path
+from src.domain.models.cancellation import CancellationToken
+
+class OfficeRenderer(ABC):
+    """
+    Backend that renders office documents (DOCX, PPTX, ...) to PDF.
+    
+    Implementations may keep the rendering application running between calls,
+    so a renderer should be closed once it is no longer needed.
+    """
+    
+    @abstractmethod
+    def render_to_pdf(self, 
+                      input_path: Union[str, Path], 
+                      output_path: Union[str, Path],
+                      timeout: Optional[float] = None,
+                      cancel_token: Optional[CancellationToken] = None) -> str:
+        """
+        Render an office document to PDF.
+        
+        Args:
+            input_path: Path to the input document
+            output_path: Path of the PDF file to write
+            timeout: Optional maximum number of seconds for this job
+            cancel_token: Optional token; cancelling it aborts the job
+            
+        Returns:
+            Path to the generated PDF file
+        """
+        pass
+    
+    def close(self) -> None:
+        """
+        Release the rendering application and any worker resources.
+        """
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,97 @@
+from typing import Callable, List, Optional
+import threading
+import time
+
+
+class OperationCancelledError(Exception):
+    """Raised when a conversion is stopped through its CancellationToken."""
+
+
+class DeadlineExceededError(OperationCancelledError, TimeoutError):
+    """Raised when a conversion runs past its CancellationToken deadline."""
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag with an optional deadline.
+
+    Services call raise_if_cancelled() between units of work (pages, tiles,
+    images). Code holding an external resource, such as a child process, can
+    register a callback with on_cancel() to release it as soon as cancel() is
+    called instead of waiting for the next check.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Initialize the token.
+
+        Args:
+            timeout: Optional number of seconds after which the token expires
+        """
+        self._event = threading.Event()
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or self.expired
+
+    @property
+    def expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def remaining(self) -> Optional[float]:
+        """
+        Seconds left before the deadline, or None if there is no deadline.
+        """
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Register a callback run when cancel() is called.
+
+        The callback runs immediately if the token is already cancelled.
+
+        Returns:
+            Function that unregisters the callback
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+
+                def unregister():
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+                return unregister
+        callback()
+        return lambda: None
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise OperationCancelledError("Operation cancelled")
+        if self.expired:
+            raise DeadlineExceededError("Operation exceeded its deadline")
+
+
+def raise_if_cancelled(token: Optional[CancellationToken]) -> None:
+    """
+    Check an optional token, so services can call this without a None check.
+    """
+    if token is not None:
+        token.raise_if_cancelled()
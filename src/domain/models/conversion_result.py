@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+
+@dataclass
+class ConversionResult:
+    """
+    Outcome of converting a single file as part of a batch.
+    
+    Attributes:
+        input_path: Path of the input file
+        output_path: Path(s) of the converted output, None if the conversion failed
+        seconds: Wall time spent on this file
+        error: Error message if the conversion failed
+    """
+    input_path: str
+    output_path: Optional[Union[str, List[str], Dict[str, str]]] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+    
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
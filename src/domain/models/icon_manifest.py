@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+Size = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class IconTarget:
+    """
+    One icon file to generate.
+    
+    Attributes:
+        path: Output path relative to the bundle directory (absolute paths are
+              used as-is). '{stem}' is replaced with the source file's stem
+        size: Pixel size of the icon (the largest size for ICO files)
+        format: 'png' or 'ico'
+        ico_sizes: Sizes embedded in an ICO file
+        background: RGB color to flatten transparency onto, None keeps alpha
+    """
+    path: str
+    size: Size
+    format: str = 'png'
+    ico_sizes: Tuple[Size, ...] = ()
+    background: Optional[Tuple[int, int, int]] = None
+    
+    @property
+    def sizes(self) -> Tuple[Size, ...]:
+        return self.ico_sizes if self.format == 'ico' else (self.size,)
+    
+    @property
+    def encode_key(self) -> tuple:
+        """
+        Targets with the same key have byte-identical content.
+        """
+        return self.format, self.sizes, self.background
+
+
+@dataclass
+class IconManifest:
+    """
+    Named set of icon targets for one platform.
+    
+    Attributes:
+        name: Manifest name, e.g. 'android' or 'ios'
+        targets: Icon files to generate
+        files: Extra text files written alongside the icons (path -> content),
+               e.g. an iOS Contents.json or a web app manifest
+    """
+    name: str
+    targets: List[IconTarget]
+    files: Dict[str, str] = field(default_factory=dict)
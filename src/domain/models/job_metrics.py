@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class JobMetrics:
+    """
+    Timing and throughput data recorded for one service call.
+    
+    Attributes:
+        service: Name of the service and operation, e.g. 'PDFToImageConverter.convert'
+        started_at: Wall-clock start time (seconds since the epoch)
+        seconds: Total wall time of the call
+        stages: Seconds spent per stage (decode, render, inference, encode, write, ...)
+        counters: Work done per unit (pages, megapixels, bytes_written, ...)
+        error: Error message if the call failed
+    """
+    service: str
+    started_at: float
+    seconds: float = 0.0
+    stages: Dict[str, float] = field(default_factory=dict)
+    counters: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+    
+    @property
+    def rates(self) -> Dict[str, float]:
+        """
+        Counters divided by total wall time, keyed as '<counter>/s'.
+        """
+        if self.seconds <= 0:
+            return {}
+        return {f"{name}/s": value / self.seconds for name, value in self.counters.items()}
+    
+    def to_dict(self) -> dict:
+        return {
+            'service': self.service,
+            'started_at': self.started_at,
+            'seconds': round(self.seconds, 6),
+            'stages': {name: round(value, 6) for name, value in self.stages.items()},
+            'counters': self.counters,
+            'rates': {name: round(value, 3) for name, value in self.rates.items()},
+            'error': self.error
+        }
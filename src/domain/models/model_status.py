@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+
+class ModelState(Enum):
+    NOT_LOADED = 'not loaded'
+    LOADING = 'loading'
+    READY = 'ready'
+    MISSING = 'missing'    # Model file is not installed
+    FAILED = 'failed'
+
+
+@dataclass(frozen=True)
+class ModelStatus:
+    """
+    Load state of one ML model.
+
+    Attributes:
+        name: Model name, e.g. 'u2net' or 'edsr_x2'
+        description: Human-readable model name for the UI
+        state: Current load state
+        load_seconds: Time spent loading and warming up, once finished
+        error: Error message if loading failed or the model file is missing
+    """
+    name: str
+    description: str
+    state: ModelState
+    load_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.state == ModelState.READY
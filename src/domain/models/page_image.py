@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Union
+
+
+@dataclass(frozen=True)
+class PageImage:
+    """
+    One page of a PDF converted to an image.
+
+    Attributes:
+        page_index: 0-based page number
+        dpi: Resolution of the image; for extracted scans, the scan's own
+             resolution on the page
+        output: Path of the image file, or the encoded image for in-memory
+                conversions
+        extracted: True if the embedded scan was saved instead of rendering
+                   the page
+    """
+    page_index: int
+    dpi: int
+    output: Union[str, bytes]
+    extracted: bool = False
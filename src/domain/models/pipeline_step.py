@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class PipelineStep:
+    """
+    One operation of an in-memory image pipeline.
+
+    Attributes:
+        operation: Operation name, e.g. 'remove_background', 'trim', 'resize',
+                   'upscale', 'save' or 'icon_bundle'
+        params: Keyword arguments for the operation
+    """
+    operation: str
+    params: Dict[str, object] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        if not self.params:
+            return self.operation
+        return f"{self.operation}: " + ', '.join(f"{k}={v}" for k, v in self.params.items())
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    """
+    Raw pixels of one rasterized document page.
+
+    Attributes:
+        page_index: 0-based page number
+        dpi: Resolution the page was rendered at
+        colorspace: 'rgb' or 'gray'
+        width: Width in pixels
+        height: Height in pixels
+        samples: Packed 8-bit pixel rows without padding (3 bytes per pixel
+                 for 'rgb', 1 for 'gray')
+    """
+    page_index: int
+    dpi: int
+    colorspace: str
+    width: int
+    height: int
+    samples: bytes
+
+    @property
+    def channels(self) -> int:
+        return 1 if self.colorspace == 'gray' else 3
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.samples)
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class RenditionSpec:
+    """
+    One image size to produce for every page of a document.
+
+    Exactly one of dpi and max_size is set.
+
+    Attributes:
+        name: Rendition name, also its output subdirectory, e.g. 'thumb'
+        dpi: Resolution to render at
+        max_size: Length in pixels of the longer side
+        fmt: 'png', 'jpeg' or 'webp'
+        quality: JPEG/WebP quality (1-100)
+    """
+    name: str
+    dpi: Optional[int] = None
+    max_size: Optional[int] = None
+    fmt: str = 'png'
+    quality: int = 90
+
+    def __str__(self) -> str:
+        size = f"{self.dpi}dpi" if self.dpi else f"{self.max_size}px"
+        return f"{self.name}:{size}:{self.fmt}:{self.quality}"
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class WatchRule:
+    """
+    Routes files dropped into a watched folder to a conversion.
+
+    Attributes:
+        pattern: File name pattern, e.g. '*.pdf' (case-insensitive)
+        tool: Name of the conversion to run (see src/presentation/cli/tools.py)
+        params: Extra keyword arguments for the service method
+        output_dir: Directory for outputs; None uses the watcher's output directory
+    """
+    pattern: str
+    tool: str
+    params: Dict[str, object] = field(default_factory=dict)
+    output_dir: Optional[str] = None
+
+    def matches(self, path: Path) -> bool:
+        return fnmatch(path.name.lower(), self.pattern.lower())
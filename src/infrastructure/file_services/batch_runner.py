@@ -0,0 +1,66 @@
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Union
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+
+from src.domain.models.cancellation import CancellationToken, OperationCancelledError
+from src.domain.models.conversion_result import ConversionResult
+
+logger = logging.getLogger(__name__)
+
+
+def run_batch(convert: Callable[[Path, Optional[Path]], str],
+              input_paths: Sequence[Union[str, Path]],
+              output_path_for: Optional[Callable[[Path], Path]] = None,
+              progress_callback: Optional[Callable[[int], None]] = None,
+              max_workers: int = 1,
+              cancel_token: Optional[CancellationToken] = None) -> List[ConversionResult]:
+    """
+    Convert many files, recording per-file timing and errors.
+    
+    A failing file is recorded in its result and never aborts the batch. Once
+    the cancel token fires, files that have not started are recorded as cancelled.
+    
+    Args:
+        convert: Callable converting one input path to an optional output path
+        input_paths: Files to convert
+        output_path_for: Optional callable mapping an input path to its output path
+        progress_callback: Optional callback for progress updates (0-100)
+        max_workers: Number of files converted concurrently
+        cancel_token: Optional token checked before each file
+        
+    Returns:
+        One ConversionResult per input, in input order
+    """
+    paths = [Path(p) for p in input_paths]
+    total = len(paths)
+    completed = 0
+    lock = threading.Lock()
+    
+    def convert_one(path: Path) -> ConversionResult:
+        nonlocal completed
+        started = time.perf_counter()
+        try:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            output = convert(path, output_path_for(path) if output_path_for else None)
+            result = ConversionResult(str(path), output, time.perf_counter() - started)
+        except OperationCancelledError as e:
+            result = ConversionResult(str(path), None, time.perf_counter() - started, f"Cancelled: {e}")
+        except Exception as e:
+            logger.error("Batch conversion failed for %s: %s", path, e)
+            result = ConversionResult(str(path), None, time.perf_counter() - started, str(e))
+        
+        with lock:
+            completed += 1
+            if progress_callback:
+                progress_callback(int(completed / total * 100))
+        return result
+    
+    if max_workers <= 1 or total <= 1:
+        return [convert_one(path) for path in paths]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+        return list(executor.map(convert_one, paths))
@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+import io
+import tempfile
+import zipfile
+
+from src.domain.interfaces.file_converter import BinarySource
+
+# Top-level folder of each Office Open XML package type
+_OOXML_FOLDERS = {'word/': '.docx', 'ppt/': '.pptx', 'xl/': '.xlsx'}
+_OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+
+def read_binary(source: BinarySource) -> bytes:
+    """
+    Return the content of an in-memory source as bytes.
+
+    Bytes are returned as they are; file objects are read from their current
+    position.
+    """
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, 'read'):
+        return source.read()
+    raise TypeError(f"Expected bytes or a binary file object, got {type(source).__name__}")
+
+
+def sniff_suffix(data: bytes) -> Optional[str]:
+    """
+    Guess a document's file extension from its content.
+
+    Recognizes PDF, DOCX, PPTX, XLSX and legacy OLE files (reported as '.ppt',
+    the only OLE format the converters accept). Returns None otherwise.
+    """
+    head = data[:1024]
+    if b'%PDF' in head:
+        return '.pdf'
+    if head.startswith(_OLE_SIGNATURE):
+        return '.ppt'
+    if head.startswith(b'PK'):
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as package:
+                for name in package.namelist():
+                    for folder, suffix in _OOXML_FOLDERS.items():
+                        if name.startswith(folder):
+                            return suffix
+        except zipfile.BadZipFile:
+            return None
+    return None
+
+
+@contextmanager
+def spill_to_file(data: bytes, suffix: str, name: str = 'input') -> Iterator[Path]:
+    """
+    Write bytes to a private temporary directory for tools that only accept
+    file paths, e.g. office applications and worker processes.
+
+    The directory and everything written to it is removed on exit, so output
+    files can be created next to the yielded path.
+    """
+    with tempfile.TemporaryDirectory(prefix='hiel_buffer_') as tmp_dir:
+        path = Path(tmp_dir) / f"{name}{suffix}"
+        path.write_bytes(data)
+        yield path
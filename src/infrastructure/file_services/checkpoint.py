@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import Dict, Optional, Union
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_VERSION = 1
+# File name of the manifest kept in an output directory
+MANIFEST_NAME = '.hiel-checkpoint.jsonl'
+
+
+class ConversionCheckpoint:
+    """
+    Manifest of the finished parts of a long conversion, for resuming it.
+
+    The manifest is a JSON Lines file: a header with the input fingerprint
+    and the conversion parameters, then one line per finished part (a page,
+    or a chunk of pages) naming its output file and that file's size. Lines
+    are appended and flushed as parts finish, so the manifest costs O(1) per
+    part and survives the process being killed; a torn last line is ignored.
+
+    Opening a manifest written for another input version or other parameters
+    starts over. A part counts as done only while its output file still
+    exists with the recorded size, which is checked with one stat() call.
+    """
+
+    def __init__(self, path: Union[str, Path], fingerprint: str, params: dict):
+        """
+        Open or create the manifest.
+
+        Args:
+            path: Manifest file. Output names are resolved relative to its directory
+            fingerprint: Content hash of the input document
+            params: JSON-serializable parameters that affect the output
+        """
+        self.path = Path(path)
+        # Round-tripped so it compares equal to a header read back from disk
+        self._header = json.loads(json.dumps({'version': _VERSION, 'fingerprint': fingerprint,
+                                              'params': params}))
+        self._parts: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._load()
+
+    def completed(self, key: str) -> Optional[dict]:
+        """
+        Return the recorded part if its output is still intact, else None.
+
+        Returns:
+            The recorded fields, with 'output' resolved to a full path
+        """
+        part = self._parts.get(key)
+        if part is None:
+            return None
+        output = self.path.parent / part['output']
+        try:
+            if output.stat().st_size != part['size']:
+                return None
+        except OSError:
+            return None
+        return dict(part, output=str(output))
+
+    def completed_parts(self) -> Dict[str, dict]:
+        """
+        Return every recorded part whose output is still intact, by key.
+        """
+        parts = {}
+        for key in list(self._parts):
+            part = self.completed(key)
+            if part is not None:
+                parts[key] = part
+        return parts
+
+    def record(self, key: str, output: Union[str, Path], **info) -> None:
+        """
+        Record a finished part. Safe to call from several threads.
+
+        Args:
+            key: Part identifier, e.g. the page index
+            output: The part's output file, inside the manifest's directory
+            **info: Further JSON-serializable fields to keep, e.g. the DPI
+        """
+        output = Path(output)
+        part = dict(info, key=key, output=output.name, size=output.stat().st_size)
+        line = json.dumps(part, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._parts[key] = part
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def discard(self) -> None:
+        """
+        Delete the manifest, e.g. once the conversion has finished.
+        """
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        try:
+            text = self.path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            text = ''
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", self.path, e)
+            text = ''
+        lines = text.splitlines()
+
+        header = _parse_line(lines[0]) if lines else None
+        if header == self._header:
+            for line in lines[1:]:
+                part = _parse_line(line)
+                if part and 'key' in part and 'output' in part and 'size' in part:
+                    self._parts[part['key']] = part
+            if not text.endswith('\n'):
+                # Terminate a torn last line so the next record starts on its own line
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write('\n')
+            if self._parts:
+                logger.info("Resuming from %s: %d parts already done", self.path, len(self._parts))
+            return
+
+        # New run, or different input or parameters: start a fresh manifest
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._header, separators=(',', ':')) + '\n', encoding='utf-8')
+
+
+def _parse_line(line: str) -> Optional[dict]:
+    try:
+        value = json.loads(line)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
@@ -1,29 +1,62 @@
 from pathlib import Path
-from typing import Optional, Union, Callable
+from typing import Optional, Union, Callable, Iterable, List, Sequence, Set
+from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+import json
 import logging
+import multiprocessing
 import os
+import queue
+import shutil
+import signal
+import tempfile
 
 from pdf2docx import Converter
-from docx2pdf import convert
-from src.domain.interfaces.file_converter import FileConverter
+from src.domain.interfaces.file_converter import BinarySource, FileConverter
+from src.domain.interfaces.office_renderer import OfficeRenderer
+from src.domain.models.cancellation import CancellationToken, raise_if_cancelled
+from src.domain.models.conversion_result import ConversionResult
+from src.infrastructure.file_services.batch_runner import run_batch
+from src.infrastructure.file_services.buffer_io import read_binary, sniff_suffix, spill_to_file
+from src.infrastructure.file_services.checkpoint import MANIFEST_NAME, ConversionCheckpoint
+from src.infrastructure.file_services.page_cache import document_fingerprint
+from src.infrastructure.monitoring.instrumentation import instrument
+from src.infrastructure.office_services.renderer_factory import get_office_renderer
+
+# Most pages parsed between checkpoints when converting PDF to DOCX
+CHECKPOINT_PAGES = 25
+# Documents with more selected pages than this are checkpointed by default
+RESUME_MIN_PAGES = 100
 
 class DocxConverter(FileConverter):
     def __init__(self, 
-                 log_level: int = logging.INFO):
+                 log_level: Optional[int] = None,
+                 renderer: Optional[OfficeRenderer] = None):
         """
-        Initialize DocxConverter with logging options.
+        Initialize DocxConverter.
         
         Args:
-            log_level: Logging level for conversion process
+            log_level: Optional level for this module's logger. Logging itself is
+                       configured by the application entry point
+            renderer: Optional backend for DOCX to PDF rendering. Defaults to
+                      the shared renderer selected for this host
         """
-        logging.basicConfig(level=log_level, 
-                            format='%(asctime)s - %(levelname)s - %(message)s')
         self.logger = logging.getLogger(__name__)
+        if log_level is not None:
+            self.logger.setLevel(log_level)
+        self._renderer = renderer
+    
+    @property
+    def renderer(self) -> OfficeRenderer:
+        if self._renderer is None:
+            self._renderer = get_office_renderer()
+        return self._renderer
 
     def convert(self, 
                 input_path: Union[str, Path], 
                 output_path: Optional[Union[str, Path]] = None,
+                *,
                 progress_callback: Optional[Callable[[int, str], None]] = None,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> str:
         """
         Convert PDF to DOCX or DOCX to PDF with enhanced features.
@@ -32,7 +65,17 @@ class DocxConverter(FileConverter):
             input_path: Path to input file
             output_path: Optional path for output file
             progress_callback: Optional callback for tracking conversion progress
-            **kwargs: Additional conversion parameters
+            cancel_token: Optional token checked between pages
+            **kwargs: Additional conversion parameters including:
+                     - pages: Pages to convert for PDF input, e.g. '1-3,5',
+                       'all' or a list of 1-based page numbers
+                     - multi_processing: Parse PDF pages in parallel processes
+                     - cpu_count: Number of worker processes (0 uses all cores)
+                     - resume: For PDF input, save parsed pages to
+                       '<output>.checkpoint' as the conversion goes, and
+                       reuse them when the same PDF and pages are converted
+                       again after an interrupted run. Defaults to on for
+                       more than RESUME_MIN_PAGES selected pages
         
         Returns:
             Path to the converted file
@@ -55,66 +98,480 @@ class DocxConverter(FileConverter):
                     output_path = output_path.with_suffix(output_format)
             
             if input_format == '.pdf':
-                output_path = self._convert_pdf_to_docx(input_path, output_path, progress_callback)
+                output_path = self._convert_pdf_to_docx(
+                    input_path,
+                    output_path,
+                    progress_callback,
+                    pages=kwargs.get('pages'),
+                    multi_processing=kwargs.get('multi_processing', False),
+                    cpu_count=kwargs.get('cpu_count', 0),
+                    cancel_token=cancel_token,
+                    resume=kwargs.get('resume')
+                )
             else:
-                output_path = self._convert_docx_to_pdf(input_path, output_path)
+                output_path = self._convert_docx_to_pdf(input_path, output_path, kwargs.get('timeout'), cancel_token)
             
-            self.logger.info(f"Conversion completed: {input_path} -> {output_path}")
+            self.logger.info("Conversion completed: %s -> %s", input_path, output_path)
             return str(output_path)
         
         except Exception as e:
-            self.logger.error(f"Conversion error: {e}")
+            self.logger.error("Conversion error: %s", e)
             raise
 
+    def convert_buffer(self,
+                       data: BinarySource,
+                       *,
+                       progress_callback: Optional[Callable[[int, str], None]] = None,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> bytes:
+        """
+        Convert an in-memory PDF to DOCX or DOCX to PDF.
+        
+        The office applications and the parallel pdf2docx workers only open
+        files, so the document is written to a private temporary directory
+        that is removed afterwards; the caller never handles paths.
+        
+        Args:
+            data: Input document as bytes or a binary file object
+            progress_callback: Optional callback for tracking conversion progress
+            cancel_token: Optional token checked between pages
+            **kwargs: As for convert(), plus input_format ('.pdf' or '.docx'),
+                      detected from the content when omitted
+        
+        Returns:
+            The converted document
+        """
+        content = read_binary(data)
+        input_format = kwargs.pop('input_format', None)
+        kwargs.setdefault('resume', False)  # The temporary output does not outlive this call
+        input_format = f".{input_format.lstrip('.').lower()}" if input_format else sniff_suffix(content)
+        if input_format not in ('.pdf', '.docx'):
+            raise ValueError("Cannot detect the input format; pass input_format='.pdf' or '.docx'")
+        
+        with spill_to_file(content, input_format) as input_path:
+            output_path = self.convert(input_path, None, progress_callback=progress_callback,
+                                       cancel_token=cancel_token, **kwargs)
+            return Path(output_path).read_bytes()
+
+    def convert_batch(self,
+                      input_paths: Sequence[Union[str, Path]],
+                      output_dir: Optional[Union[str, Path]] = None,
+                      progress_callback: Optional[Callable[[int], None]] = None,
+                      max_workers: Optional[int] = None,
+                      cancel_token: Optional[CancellationToken] = None,
+                      **kwargs) -> List[ConversionResult]:
+        """
+        Convert many PDF/DOCX files, reusing the same rendering backend.
+        
+        Args:
+            input_paths: Files to convert
+            output_dir: Optional directory for all outputs. Defaults to each input's directory
+            progress_callback: Optional callback for overall progress (0-100)
+            max_workers: Files converted concurrently. Defaults to the renderer's
+                         pool size for DOCX inputs and 1 otherwise
+            cancel_token: Optional token; files not started when it is cancelled
+                          are reported as cancelled
+            **kwargs: Conversion parameters passed to convert()
+        
+        Returns:
+            One ConversionResult per input, in input order
+        """
+        paths = [Path(p) for p in input_paths]
+        if max_workers is None:
+            all_docx = all(p.suffix.lower() == '.docx' for p in paths)
+            max_workers = getattr(self.renderer, 'size', 1) if all_docx else 1
+        
+        output_path_for = None
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            output_path_for = lambda p: output_dir / f"{p.stem}{'.docx' if p.suffix.lower() == '.pdf' else '.pdf'}"
+        
+        results = run_batch(
+            lambda p, out: self.convert(p, out, cancel_token=cancel_token, **kwargs),
+            paths,
+            output_path_for,
+            progress_callback,
+            max_workers,
+            cancel_token
+        )
+        
+        failed = sum(1 for r in results if not r.succeeded)
+        self.logger.info("Batch completed: %d converted, %d failed", len(results) - failed, failed)
+        return results
+
     def _convert_pdf_to_docx(self, 
                                input_path: Path, 
                                output_path: Path, 
-                               progress_callback: Optional[Callable[[int, str], None]] = None) -> Path:
+                               progress_callback: Optional[Callable[[int, str], None]] = None,
+                               pages: Optional[Union[str, Iterable[int]]] = None,
+                               multi_processing: bool = False,
+                               cpu_count: int = 0,
+                               cancel_token: Optional[CancellationToken] = None,
+                               resume: Optional[bool] = None) -> Path:
         """
         Convert PDF to DOCX using pdf2docx library.
         
+        Pages are parsed one by one so progress can be reported per page. With
+        multi_processing enabled the selected pages are split into contiguous
+        segments that are parsed in separate processes and merged afterwards.
+        
+        With resume, parsed pages are serialized in chunks of at most
+        CHECKPOINT_PAGES (one chunk per parallel segment) to a checkpoint
+        directory next to the output and recorded in its manifest. A later run
+        over the same PDF and pages loads those chunks instead of parsing them
+        again; the directory is removed once the DOCX is written.
+        
         Args:
             input_path: Path to input PDF
             output_path: Path to output DOCX
             progress_callback: Optional callback for tracking progress
+            pages: Optional page selection (1-based), None or 'all' for every page
+            multi_processing: Parse pages in parallel processes
+            cpu_count: Number of worker processes (0 uses all cores)
+            cancel_token: Optional token checked between pages; cancelling it
+                          terminates parallel workers immediately
+            resume: Checkpoint parsed pages and reuse those of an interrupted run.
+                    None enables it for more than RESUME_MIN_PAGES pages
         
         Returns:
             Path to the generated DOCX file
         """
-        try:
-            # Initialize converter
-            cv = Converter(str(input_path))
+        with instrument('DocxConverter.pdf_to_docx') as recorder:
+            with recorder.stage('open'):
+                cv = Converter(str(input_path))
+            checkpoint = None
+            try:
+                settings = cv.default_settings
+                page_indexes = self._parse_page_selection(pages, len(cv.fitz_doc))
+                if not page_indexes:
+                    raise ValueError("No pages selected for conversion")
+                
+                with recorder.stage('load'):
+                    cv.load_pages(pages=page_indexes)
+                
+                remaining = page_indexes
+                if resume is None:
+                    resume = len(page_indexes) > RESUME_MIN_PAGES
+                if resume:
+                    checkpoint_dir = output_path.with_name(output_path.name + '.checkpoint')
+                    checkpoint = ConversionCheckpoint(checkpoint_dir / MANIFEST_NAME,
+                                                      document_fingerprint(input_path),
+                                                      {'pages': page_indexes})
+                    with recorder.stage('restore'):
+                        remaining = self._restore_checkpoint(cv, checkpoint, page_indexes)
+                    recorder.count('pages_resumed', len(page_indexes) - len(remaining))
+                
+                workers = min(cpu_count or os.cpu_count() or 1, len(remaining))
+                with recorder.stage('parse'):
+                    if not remaining:
+                        pass
+                    elif multi_processing and workers > 1:
+                        self._parse_pages_parallel(cv, remaining, settings, workers, progress_callback,
+                                                   cancel_token, checkpoint)
+                    else:
+                        self._parse_pages_sequential(cv, settings, progress_callback, cancel_token,
+                                                     checkpoint, remaining)
+                recorder.count('pages', len(page_indexes))
+                
+                raise_if_cancelled(cancel_token)
+                if progress_callback:
+                    progress_callback(90, "Creating DOCX document")
+                with recorder.stage('docx_write'):
+                    cv.make_docx(str(output_path), **settings)
+                recorder.count_file(output_path)
+                
+                if checkpoint:
+                    checkpoint.close()
+                    shutil.rmtree(checkpoint.path.parent, ignore_errors=True)
+                    checkpoint = None
+                
+                if progress_callback:
+                    progress_callback(100, "PDF to DOCX conversion complete")
+                
+                return output_path
             
-            # Convert PDF to DOCX
-            cv.convert(str(output_path), start=0, end=None)
+            except Exception as e:
+                self.logger.error("PDF to DOCX conversion failed: %s", e)
+                raise
+            finally:
+                if checkpoint:
+                    checkpoint.close()
+                cv.close()
+
+    @staticmethod
+    def _split_pages(page_indexes: List[int], size: int) -> List[List[int]]:
+        return [page_indexes[i:i + size] for i in range(0, len(page_indexes), size)]
+
+    @staticmethod
+    def _chunk_key(chunk: List[int]) -> str:
+        return f"pages-{chunk[0] + 1}-{chunk[-1] + 1}"
+
+    def _restore_checkpoint(self,
+                            cv: Converter,
+                            checkpoint: ConversionCheckpoint,
+                            page_indexes: List[int]) -> List[int]:
+        """
+        Load the page chunks an earlier run finished into cv.
+        
+        Chunks are found by the pages they record, not by their boundaries,
+        so a run with another worker count still reuses them.
+        
+        Returns:
+            The page indexes that still have to be parsed
+        """
+        selected = set(page_indexes)
+        restored = set()
+        for key, part in checkpoint.completed_parts().items():
+            chunk = part.get('pages') or []
+            if not chunk or not selected.issuperset(chunk) or restored.intersection(chunk):
+                continue
+            try:
+                cv.deserialize(part['output'])
+            except Exception as e:
+                self.logger.warning("Re-parsing %s, its checkpoint is unreadable: %s", key, e)
+                continue
+            for index in chunk:
+                cv.pages[index].skip_parsing = True
+            restored.update(chunk)
+        remaining = [index for index in page_indexes if index not in restored]
+        parsed = len(restored)
+        if parsed:
+            self.logger.info("Resuming PDF to DOCX conversion: %d of %d pages already parsed",
+                             parsed, len(page_indexes))
+        return remaining
+
+    def _save_chunk(self, cv: Converter, checkpoint: ConversionCheckpoint, chunk: List[int]) -> None:
+        """
+        Serialize the parsed pages of a chunk, in pdf2docx's own format, and record it.
+        """
+        json_file = checkpoint.path.parent / f"{self._chunk_key(chunk)}.json"
+        data = {
+            'filename': os.path.basename(cv.filename_pdf),
+            'page_cnt': len(cv.fitz_doc),
+            'pages': [cv.pages[index].store() for index in chunk if cv.pages[index].finalized],
+        }
+        temp_file = json_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_file, json_file)
+        checkpoint.record(self._chunk_key(chunk), json_file, pages=chunk)
+
+    def _parse_pages_sequential(self,
+                                cv: Converter,
+                                settings: dict,
+                                progress_callback: Optional[Callable[[int, str], None]] = None,
+                                cancel_token: Optional[CancellationToken] = None,
+                                checkpoint: Optional[ConversionCheckpoint] = None,
+                                page_indexes: Optional[List[int]] = None) -> None:
+        """
+        Parse the loaded pages in this process, reporting progress after each page.
+        
+        With a checkpoint, page_indexes (the pages left to parse) are saved in
+        chunks of CHECKPOINT_PAGES, each once its last page is parsed.
+        """
+        cv.parse_document(**settings)
+        
+        chunk_ends = ({chunk[-1]: chunk for chunk in self._split_pages(page_indexes, CHECKPOINT_PAGES)}
+                      if checkpoint else {})
+        selected = [page for page in cv.pages if not page.skip_parsing]
+        total = len(selected)
+        for done, page in enumerate(selected, 1):
+            raise_if_cancelled(cancel_token)
+            try:
+                page.parse(**settings)
+            except Exception as e:
+                if not settings['ignore_page_error']:
+                    raise
+                self.logger.warning("Skipping page %d due to parsing error: %s", page.id + 1, e)
             
-            # Close the converter
-            cv.close()
+            if page.id in chunk_ends:
+                self._save_chunk(cv, checkpoint, chunk_ends[page.id])
             
-            # Optional progress tracking
             if progress_callback:
-                progress_callback(100, "PDF to DOCX conversion complete")
-            
-            return output_path
+                progress_callback(int(done / total * 90), f"Parsed page {page.id + 1} ({done}/{total})")
+
+    def _parse_pages_parallel(self,
+                              cv: Converter,
+                              page_indexes: List[int],
+                              settings: dict,
+                              workers: int,
+                              progress_callback: Optional[Callable[[int, str], None]] = None,
+                              cancel_token: Optional[CancellationToken] = None,
+                              checkpoint: Optional[ConversionCheckpoint] = None) -> None:
+        """
+        Parse page segments in worker processes and restore the results into cv.
         
-        except Exception as e:
-            self.logger.error(f"PDF to DOCX conversion failed: {e}")
-            raise
+        Cancelling the token terminates the worker processes right away. With
+        a checkpoint, segments are capped at CHECKPOINT_PAGES and each one's
+        result is written to the checkpoint directory and recorded as it finishes.
+        """
+        segment_size = -(-len(page_indexes) // workers)
+        if checkpoint:
+            segment_size = min(segment_size, CHECKPOINT_PAGES)
+        segments = self._split_pages(page_indexes, segment_size)
+        total = len(page_indexes)
+        done = 0
+        
+        with tempfile.TemporaryDirectory(prefix="pdf2docx_") as tmp_dir:
+            json_file_for = (lambda idx, segment: str(checkpoint.path.parent / f"{self._chunk_key(segment)}.json")
+                             if checkpoint else os.path.join(tmp_dir, f"pages-{idx}.json"))
+            processes = _WorkerProcesses()
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(segments)),
+                                           initializer=_report_pid, initargs=(processes.pid_queue,))
+            unregister = cancel_token.on_cancel(processes.terminate) if cancel_token else None
+            try:
+                futures = {
+                    executor.submit(
+                        _parse_page_segment,
+                        cv.filename_pdf,
+                        cv.password,
+                        segment,
+                        settings,
+                        json_file_for(idx, segment)
+                    ): segment
+                    for idx, segment in enumerate(segments)
+                }
+                for future in as_completed(futures, timeout=cancel_token.remaining() if cancel_token else None):
+                    try:
+                        json_file = future.result()
+                    except Exception:
+                        raise_if_cancelled(cancel_token)
+                        raise
+                    cv.deserialize(json_file)
+                    if checkpoint:
+                        checkpoint.record(self._chunk_key(futures[future]), json_file, pages=futures[future])
+                    
+                    done += len(futures[future])
+                    if progress_callback:
+                        progress_callback(int(done / total * 90), f"Parsed {done}/{total} pages")
+            except FutureTimeoutError:
+                processes.terminate()
+                raise_if_cancelled(cancel_token)
+                raise
+            finally:
+                if unregister:
+                    unregister()
+                executor.shutdown(wait=True, cancel_futures=True)
+                processes.close()
 
-    def _convert_docx_to_pdf(self, input_path: Path, output_path: Path) -> Path:
+    @staticmethod
+    def _parse_page_selection(pages: Optional[Union[str, Iterable[int]]], page_count: int) -> List[int]:
+        """
+        Translate a 1-based page selection into sorted 0-based page indexes.
+        
+        Args:
+            pages: None or 'all' for every page, a string such as '1-3,5',
+                   or an iterable of 1-based page numbers
+            page_count: Number of pages in the document
+        
+        Returns:
+            Sorted list of 0-based page indexes
+        """
+        if pages is None or (isinstance(pages, str) and pages.strip().lower() in ('', 'all')):
+            return list(range(page_count))
+        
+        numbers = set()
+        if isinstance(pages, str):
+            for part in pages.split(','):
+                part = part.strip()
+                if not part:
+                    continue
+                if '-' in part:
+                    first, last = part.split('-', 1)
+                    numbers.update(range(int(first), int(last) + 1))
+                else:
+                    numbers.add(int(part))
+        else:
+            numbers.update(int(p) for p in pages)
+        
+        invalid = [n for n in numbers if n < 1 or n > page_count]
+        if invalid:
+            raise ValueError(f"Page numbers out of range 1-{page_count}: {sorted(invalid)}")
+        
+        return sorted(n - 1 for n in numbers)
+
+    def _convert_docx_to_pdf(self, 
+                             input_path: Path, 
+                             output_path: Path, 
+                             timeout: Optional[float] = None,
+                             cancel_token: Optional[CancellationToken] = None) -> Path:
         """
         Convert DOCX to PDF with error handling.
         
         Args:
             input_path: Path to input DOCX
             output_path: Path to output PDF
+            timeout: Optional maximum seconds for the rendering job
+            cancel_token: Optional token that aborts the rendering job
         
         Returns:
             Path to the generated PDF file
         """
         try:
-            convert(str(input_path), str(output_path))
+            with instrument('DocxConverter.docx_to_pdf') as recorder:
+                with recorder.stage('render'):
+                    self.renderer.render_to_pdf(input_path, output_path, timeout=timeout, cancel_token=cancel_token)
+                recorder.count('documents')
+                recorder.count_file(output_path)
             return output_path
         except Exception as e:
-            self.logger.error(f"DOCX to PDF conversion failed: {e}")
-            raise
\ No newline at end of file
+            self.logger.error("DOCX to PDF conversion failed: %s", e)
+            raise
+
+
+def _parse_page_segment(pdf_file: str,
+                        password: Optional[str],
+                        page_indexes: List[int],
+                        settings: dict,
+                        json_file: str) -> str:
+    """
+    Parse a segment of pages in a worker process and serialize the result.
+    
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+    """
+    cv = Converter(pdf_file, password)
+    try:
+        cv.load_pages(pages=page_indexes)
+        cv.parse_document(**settings).parse_pages(**settings).serialize(json_file)
+    finally:
+        cv.close()
+    return json_file
+
+
+def _report_pid(pid_queue) -> None:
+    """
+    Worker process initializer: report the worker's PID to the parent.
+    """
+    pid_queue.put(os.getpid())
+
+
+class _WorkerProcesses:
+    """
+    Worker PIDs of a ProcessPoolExecutor, as reported by _report_pid().
+
+    Lets a cancelled job kill its workers without reaching into the
+    executor's private process table.
+    """
+
+    def __init__(self):
+        self.pid_queue = multiprocessing.Queue()
+        self._pids: Set[int] = set()
+
+    def terminate(self) -> None:
+        """
+        Kill the worker processes without waiting for running segments.
+        """
+        while True:
+            try:
+                self._pids.add(self.pid_queue.get_nowait())
+            except queue.Empty:
+                break
+        for pid in self._pids:
+            try:
+                os.kill(pid, signal.SIGTERM)  # TerminateProcess on Windows
+            except OSError:
+                pass  # Already exited
+
+    def close(self) -> None:
+        self.pid_queue.close()
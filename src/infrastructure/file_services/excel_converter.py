@@ -1,15 +1,30 @@
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import BinaryIO, Optional, Union, List
+import io
 import tabula
 import pandas as pd
 import fitz  # PyMuPDF
-from src.domain.interfaces.file_converter import FileConverter
+from src.domain.interfaces.file_converter import BinarySource, FileConverter
+from src.domain.models.cancellation import CancellationToken, OperationCancelledError, raise_if_cancelled
+from src.infrastructure.file_services.buffer_io import read_binary
+from src.infrastructure.monitoring.instrumentation import JobRecorder, instrument
 
 class PDFToExcelConverter(FileConverter):
     def convert(self, 
                 input_path: Union[str, Path], 
                 output_path: Optional[Union[str, Path]] = None,
+                *,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> str:
+        with instrument('PDFToExcelConverter.convert') as recorder:
+            return self._convert(input_path, output_path, cancel_token, recorder, **kwargs)
+    
+    def _convert(self,
+                 input_path: Union[str, Path],
+                 output_path: Optional[Union[str, Path]],
+                 cancel_token: Optional[CancellationToken],
+                 recorder: JobRecorder,
+                 **kwargs) -> str:
         input_path = Path(input_path)
         if not input_path.exists():
             raise FileNotFoundError(f"PDF file not found: {input_path}")
@@ -20,14 +35,64 @@ class PDFToExcelConverter(FileConverter):
         pages = kwargs.get('pages', 'all')
         output_path = self._get_output_path(input_path, output_path)
         
+        tables = self._extract_tables(input_path, pages, cancel_token, recorder)
+        try:
+            with recorder.stage('xlsx_write'):
+                self._write_tables(tables, output_path, cancel_token)
+            recorder.count_file(output_path)
+        except OperationCancelledError:
+            output_path.unlink(missing_ok=True)
+            raise
+        
+        return str(output_path)
+    
+    def convert_buffer(self,
+                       data: BinarySource,
+                       *,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> bytes:
+        """
+        Extract the tables of an in-memory PDF into an Excel workbook.
+        
+        Args:
+            data: PDF as bytes or a binary file object
+            cancel_token: Optional token checked between pages and sheets
+            **kwargs: pages: tabula page selection (default 'all')
+        
+        Returns:
+            The XLSX workbook
+        """
+        with instrument('PDFToExcelConverter.convert_buffer') as recorder:
+            tables = self._extract_tables(read_binary(data), kwargs.get('pages', 'all'), cancel_token, recorder)
+            with recorder.stage('xlsx_write'), io.BytesIO() as bio:
+                self._write_tables(tables, bio, cancel_token)
+                recorder.count('bytes_written', bio.tell())
+                return bio.getvalue()
+    
+    def _extract_tables(self,
+                        document: Union[Path, bytes],
+                        pages,
+                        cancel_token: Optional[CancellationToken],
+                        recorder: JobRecorder) -> List[pd.DataFrame]:
+        """
+        Find the tables of a PDF file or in-memory PDF with PyMuPDF, falling
+        back to tabula when PyMuPDF finds none.
+        """
+        in_memory = isinstance(document, bytes)
         tables: List[pd.DataFrame] = []
+        page_count = None
         
         # Try PyMuPDF first
         try:
-            pdf_doc = fitz.open(str(input_path))
+            pdf_doc = fitz.open(stream=document, filetype='pdf') if in_memory else fitz.open(str(document))
+            page_count = pdf_doc.page_count
             for page_num in range(pdf_doc.page_count):
+                if cancel_token is not None and cancel_token.cancelled:
+                    break
                 page = pdf_doc[page_num]
-                found_tables = page.get_tables()
+                with recorder.stage('pymupdf_tables'):
+                    found_tables = page.get_tables()
+                recorder.count('pages')
                 
                 if found_tables:
                     for table in found_tables:
@@ -38,27 +103,46 @@ class PDFToExcelConverter(FileConverter):
             pdf_doc.close()
         except Exception:
             pass
+        raise_if_cancelled(cancel_token)
 
         # If no tables found, try tabula as fallback
         if not tables:
-            try:
-                tables.extend(tabula.read_pdf(
-                    str(input_path),
-                    pages=pages,
-                    multiple_tables=True,
-                    guess=True,
-                    lattice=True,
-                    stream=True
-                ))
-            except Exception:
-                pass
+            if cancel_token is not None and page_count and pages == 'all':
+                # A single tabula call cannot be interrupted; go page by page
+                # so a cancellation takes effect between pages
+                tabula_pages = list(range(1, page_count + 1))
+            else:
+                tabula_pages = [pages]
+            
+            for tabula_page in tabula_pages:
+                raise_if_cancelled(cancel_token)
+                try:
+                    with recorder.stage('tabula_tables'):
+                        tables.extend(tabula.read_pdf(
+                            io.BytesIO(document) if in_memory else str(document),
+                            pages=tabula_page,
+                            multiple_tables=True,
+                            guess=True,
+                            lattice=True,
+                            stream=True
+                        ))
+                except Exception:
+                    pass
         
         if not tables:
             raise ValueError("No tables found in the PDF")
         
+        recorder.count('tables', len(tables))
+        return tables
+    
+    def _write_tables(self, 
+                      tables: List[pd.DataFrame], 
+                      output_path: Union[Path, BinaryIO],
+                      cancel_token: Optional[CancellationToken] = None) -> None:
         # Write tables to Excel with formatting
         with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
             for i, df in enumerate(tables, 1):
+                raise_if_cancelled(cancel_token)
                 sheet_name = f"Table_{i}"
                 df.to_excel(writer, sheet_name=sheet_name, index=False)
                 
@@ -70,8 +154,6 @@ class PDFToExcelConverter(FileConverter):
                         len(str(col))
                     )
                     worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
-        
-        return str(output_path)
     
     def _get_output_path(self, input_path: Path, output_path: Optional[Union[str, Path]]) -> Path:
         if output_path is None:
@@ -1,13 +1,19 @@
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Union
+import io
 import img2pdf
 from PIL import Image
-from src.domain.interfaces.file_converter import FileConverter
+from src.domain.interfaces.file_converter import BinarySource, FileConverter
+from src.domain.models.cancellation import CancellationToken, raise_if_cancelled
+from src.infrastructure.file_services.buffer_io import read_binary
+from src.infrastructure.monitoring.instrumentation import JobRecorder, instrument
 
 class ImagesToPDFConverter(FileConverter):
     def convert(self, 
                 input_path: Union[str, Path, List[str], List[Path]], 
                 output_path: Optional[Union[str, Path]] = None,
+                *,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> str:
         """
         Convert images to PDF.
@@ -15,6 +21,7 @@ class ImagesToPDFConverter(FileConverter):
         Args:
             input_path: Path to image file or list of image paths
             output_path: Optional output PDF path
+            cancel_token: Optional token checked between images
             **kwargs: Additional parameters
         
         Returns:
@@ -39,26 +46,76 @@ class ImagesToPDFConverter(FileConverter):
             output_path = input_paths[0].parent / f"{input_paths[0].stem}_combined.pdf"
         output_path = Path(output_path)
         
-        # Convert images to PDF
-        with open(str(output_path), "wb") as f:
-            # Convert images to RGB if necessary
-            image_files = []
-            for img_path in input_paths:
-                with Image.open(img_path) as img:
-                    if img.mode != 'RGB':
-                        rgb_img = img.convert('RGB')
-                        temp_path = img_path.parent / f"temp_{img_path.name}"
-                        rgb_img.save(temp_path)
-                        image_files.append(temp_path)
+        with instrument('ImagesToPDFConverter.convert') as recorder:
+            pdf = self._images_to_pdf(input_paths, cancel_token, recorder)
+            with recorder.stage('write'), open(str(output_path), "wb") as f:
+                f.write(pdf)
+            recorder.count_file(output_path)
+        
+        return str(output_path)
+    
+    def convert_buffer(self,
+                       data: Union[BinarySource, Sequence[Union[BinarySource, Image.Image]]],
+                       *,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> bytes:
+        """
+        Combine in-memory images into a PDF.
+        
+        Args:
+            data: One image, or a list of images, each as encoded bytes, a
+                  binary file object or a PIL image
+            cancel_token: Optional token checked between images
+            **kwargs: Additional parameters
+        
+        Returns:
+            The PDF document
+        """
+        sources = list(data) if isinstance(data, (list, tuple)) else [data]
+        if not sources:
+            raise ValueError("No images to convert")
+        with instrument('ImagesToPDFConverter.convert_buffer') as recorder:
+            pdf = self._images_to_pdf(sources, cancel_token, recorder)
+            recorder.count('bytes_written', len(pdf))
+        return pdf
+    
+    def _images_to_pdf(self,
+                       sources: Sequence[Union[Path, BinarySource, Image.Image]],
+                       cancel_token: Optional[CancellationToken],
+                       recorder: JobRecorder) -> bytes:
+        """
+        Build the PDF from image files, encoded images or PIL images.
+        
+        RGB files and buffers are embedded as they are (JPEGs without
+        re-encoding); other color modes are converted to RGB and encoded as
+        PNG in memory instead of through temporary files.
+        """
+        images: List[Union[str, bytes]] = []
+        for source in sources:
+            raise_if_cancelled(cancel_token)
+            with recorder.stage('decode_convert'):
+                if isinstance(source, Image.Image):
+                    img, original = source, None
+                elif isinstance(source, Path):
+                    img, original = Image.open(source), str(source)
+                else:
+                    original = read_binary(source)
+                    img = Image.open(io.BytesIO(original))
+                try:
+                    recorder.count('images')
+                    recorder.count_pixels(*img.size)
+                    if img.mode == 'RGB' and original is not None:
+                        images.append(original)
                     else:
-                        image_files.append(img_path)
-            
-            # Create PDF
-            f.write(img2pdf.convert([str(p) for p in image_files]))
-            
-            # Clean up temporary files
-            for path in image_files:
-                if path.name.startswith('temp_'):
-                    path.unlink()
+                        with io.BytesIO() as bio:
+                            (img if img.mode == 'RGB' else img.convert('RGB')).save(bio, format='PNG')
+                            images.append(bio.getvalue())
+                finally:
+                    if original is not None:
+                        img.close()
+        
+        raise_if_cancelled(cancel_token)
         
-        return str(output_path) 
\ No newline at end of file
+        # Create PDF
+        with recorder.stage('pdf_write'):
+            return img2pdf.convert(images)
\ No newline at end of file
@@ -0,0 +1,107 @@
+from pathlib import Path
+from typing import Union
+import io
+import os
+import tarfile
+import time
+import zipfile
+
+from PIL.TiffImagePlugin import AppendingTiffWriter
+
+# Archive format -> file extension
+ARCHIVE_FORMATS = {
+    'zip': 'zip',
+    'tar': 'tar',
+    'tiff': 'tif',
+}
+
+
+class PageArchiveWriter:
+    """
+    Streams encoded pages into one archive file as they are produced.
+
+    'zip' and 'tar' store every page as a member, uncompressed: PNG, JPEG
+    and WebP data is already compressed, so deflating it again costs time
+    for nothing. 'tiff' appends each page, which must itself be an encoded
+    single-page TIFF, as a frame of one multi-page TIFF.
+
+    The archive is written to '<name>.part' and renamed when closed, so an
+    interrupted run never leaves a truncated archive under the final name.
+    """
+
+    def __init__(self, path: Union[str, Path], archive_format: str):
+        """
+        Initialize the writer and create the partial file.
+
+        Args:
+            path: Final archive path
+            archive_format: 'zip', 'tar' or 'tiff'
+        """
+        archive_format = archive_format.lower().lstrip('.')
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unsupported archive format '{archive_format}'. "
+                             f"Choose from: {', '.join(ARCHIVE_FORMATS)}")
+        self.path = Path(path)
+        self.archive_format = archive_format
+        self._part_path = self.path.with_name(self.path.name + '.part')
+        # AppendingTiffWriter reads back the frames it has written
+        self._file = open(self._part_path, 'w+b')
+        if archive_format == 'zip':
+            self._archive = zipfile.ZipFile(self._file, 'w', zipfile.ZIP_STORED)
+        elif archive_format == 'tar':
+            self._archive = tarfile.open(fileobj=self._file, mode='w', format=tarfile.PAX_FORMAT)
+        else:
+            self._archive = AppendingTiffWriter(self._file, new=True)
+
+    def add(self, name: str, data: bytes) -> None:
+        """
+        Append one encoded page.
+
+        Args:
+            name: Member name (ignored for 'tiff')
+            data: Encoded page
+        """
+        if self.archive_format == 'zip':
+            info = zipfile.ZipInfo(name, time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            info.external_attr = 0o644 << 16
+            self._archive.writestr(info, data)
+        elif self.archive_format == 'tar':
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._archive.addfile(info, io.BytesIO(data))
+        else:
+            # AppendingTiffWriter relocates the page's offsets when the frame is closed
+            self._archive.write(data)
+            self._archive.newFrame()
+
+    def close(self) -> str:
+        """
+        Finish the archive and move it to its final name.
+
+        Returns:
+            The archive path
+        """
+        self._archive.close()
+        self._file.close()
+        os.replace(self._part_path, self.path)
+        return str(self.path)
+
+    def abort(self) -> None:
+        """
+        Discard the partial archive.
+        """
+        try:
+            self._archive.close()
+        except Exception:
+            pass
+        self._file.close()
+        self._part_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> 'PageArchiveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
@@ -0,0 +1,273 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+import hashlib
+import logging
+import os
+import struct
+import threading
+import zlib
+
+from src.domain.models.rendered_page import RenderedPage
+
+logger = logging.getLogger(__name__)
+
+# (document fingerprint, page index, dpi, colorspace)
+PageKey = Tuple[str, int, int, str]
+
+DEFAULT_MEMORY_MB = 256
+DEFAULT_DISK_MB = 1024
+
+# Magic, width, height, dpi, colorspace length; followed by the colorspace
+# name and the zlib-compressed samples
+_HEADER = struct.Struct('<4sIIIB')
+_MAGIC = b'HPG1'
+# Disk writes waiting in the background before further pages skip the disk
+_MAX_PENDING_WRITES = 4
+
+
+def default_cache_dir() -> Path:
+    """
+    Disk cache directory, overridable with HIEL_PAGE_CACHE_DIR.
+    """
+    env_value = os.environ.get('HIEL_PAGE_CACHE_DIR')
+    if env_value:
+        return Path(env_value)
+    base = os.environ.get('LOCALAPPDATA') or Path.home() / '.cache'
+    return Path(base) / 'hiel' / 'page_cache'
+
+
+def _megabytes(name: str, default: int) -> int:
+    return int(float(os.environ.get(name, default)) * 1024 * 1024)
+
+
+class PageRenderCache:
+    """
+    Two-level least-recently-used cache of rendered PDF pages.
+
+    Pages are keyed by document fingerprint, page, DPI and colorspace, so
+    the same document rendered again (also under another name, or in a later
+    session) is served from the cache instead of being rasterized again.
+    Recent pages stay in memory and are also written, compressed, to a disk
+    cache in the background. Disk writes never hold up rendering: while
+    _MAX_PENDING_WRITES writes are queued, further pages stay memory-only
+    (counted in skipped_writes). Both levels are bounded by bytes, and the
+    least recently used pages are evicted first.
+    """
+
+    def __init__(self,
+                 directory: Optional[Union[str, Path]] = None,
+                 memory_bytes: Optional[int] = None,
+                 disk_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Disk cache directory. Defaults to default_cache_dir()
+            memory_bytes: In-memory budget. Defaults to HIEL_PAGE_CACHE_MEMORY_MB (256)
+            disk_bytes: On-disk budget; 0 disables the disk cache.
+                        Defaults to HIEL_PAGE_CACHE_MB (1024)
+        """
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.memory_bytes = (memory_bytes if memory_bytes is not None
+                             else _megabytes('HIEL_PAGE_CACHE_MEMORY_MB', DEFAULT_MEMORY_MB))
+        self.disk_bytes = (disk_bytes if disk_bytes is not None
+                           else _megabytes('HIEL_PAGE_CACHE_MB', DEFAULT_DISK_MB))
+        self._memory: "OrderedDict[PageKey, RenderedPage]" = OrderedDict()
+        self._memory_used = 0
+        self._disk: "Optional[OrderedDict[str, int]]" = None  # File name -> size, oldest first
+        self._disk_used = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='hiel-page-cache')
+        self.hits = 0
+        self.misses = 0
+        self.skipped_writes = 0
+
+    def get(self, key: PageKey) -> Optional[RenderedPage]:
+        """
+        Return the cached page, or None.
+        """
+        with self._lock:
+            page = self._memory.get(key)
+            if page is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return page
+
+        page = self._read_disk(key)
+        with self._lock:
+            if page is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, page)
+        return page
+
+    def put(self, key: PageKey, page: RenderedPage) -> None:
+        """
+        Cache a page in memory and, unless the disk writer is backlogged, on disk.
+        """
+        with self._lock:
+            self._remember(key, page)
+            if self.disk_bytes <= 0:
+                return
+            if self._pending >= _MAX_PENDING_WRITES:
+                self.skipped_writes += 1
+                logger.debug("Page cache writer busy, keeping page %s in memory only", key[1:])
+                return
+            self._pending += 1
+        self._writer.submit(self._write_disk, key, page)
+
+    def clear(self) -> None:
+        """
+        Drop every cached page from memory and disk.
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_used = 0
+            self._load_disk_index()
+            for name in list(self._disk):
+                (self.directory / name).unlink(missing_ok=True)
+            self._disk.clear()
+            self._disk_used = 0
+
+    def _remember(self, key: PageKey, page: RenderedPage) -> None:
+        if key in self._memory:
+            self._memory_used -= self._memory.pop(key).nbytes
+        if page.nbytes > self.memory_bytes:
+            return
+        self._memory[key] = page
+        self._memory_used += page.nbytes
+        while self._memory_used > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_used -= evicted.nbytes
+
+    @staticmethod
+    def _file_name(key: PageKey) -> str:
+        fingerprint, page_index, dpi, colorspace = key
+        return f"{fingerprint}_{page_index}_{dpi}_{colorspace}.page"
+
+    def _load_disk_index(self) -> None:
+        # Caller holds the lock. The index is built once, oldest file first,
+        # from modification times, which are refreshed on every hit
+        if self._disk is not None:
+            return
+        self._disk = OrderedDict()
+        self._disk_used = 0
+        if not self.directory.is_dir():
+            return
+        entries = []
+        for path in self.directory.glob('*.page'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._disk[name] = size
+            self._disk_used += size
+
+    def _read_disk(self, key: PageKey) -> Optional[RenderedPage]:
+        if self.disk_bytes <= 0:
+            return None
+        name = self._file_name(key)
+        with self._lock:
+            self._load_disk_index()
+            if name not in self._disk:
+                return None
+            self._disk.move_to_end(name)
+        path = self.directory / name
+        try:
+            data = path.read_bytes()
+            magic, width, height, dpi, cs_length = _HEADER.unpack_from(data)
+            if magic != _MAGIC:
+                raise ValueError("not a page cache file")
+            offset = _HEADER.size + cs_length
+            colorspace = data[_HEADER.size:offset].decode('ascii')
+            samples = zlib.decompress(memoryview(data)[offset:])
+            os.utime(path)  # Most recently used
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            logger.debug("Dropping unreadable page cache file %s: %s", path, e)
+            with self._lock:
+                self._disk_used -= self._disk.pop(name, 0)
+            path.unlink(missing_ok=True)
+            return None
+        return RenderedPage(key[1], dpi, colorspace, width, height, samples)
+
+    def _write_disk(self, key: PageKey, page: RenderedPage) -> None:
+        try:
+            name = self._file_name(key)
+            colorspace = page.colorspace.encode('ascii')
+            # Level 1: rendered pages compress well even at the fastest setting
+            payload = (_HEADER.pack(_MAGIC, page.width, page.height, page.dpi, len(colorspace))
+                       + colorspace + zlib.compress(page.samples, 1))
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / name
+            temp = path.with_suffix('.tmp')
+            temp.write_bytes(payload)
+            os.replace(temp, path)  # Readers never see a half-written file
+
+            with self._lock:
+                self._load_disk_index()
+                self._disk_used += len(payload) - self._disk.pop(name, 0)
+                self._disk[name] = len(payload)
+                evicted = []
+                while self._disk_used > self.disk_bytes and len(self._disk) > 1:
+                    old_name, size = self._disk.popitem(last=False)
+                    self._disk_used -= size
+                    evicted.append(old_name)
+            for old_name in evicted:
+                (self.directory / old_name).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not write page cache file: %s", e)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+_fingerprints: Dict[Tuple[str, int, int], str] = {}
+_fingerprints_lock = threading.Lock()
+
+
+def document_fingerprint(source: Union[str, Path, bytes]) -> str:
+    """
+    Content hash identifying a document, independent of its file name.
+
+    Hashes of files are remembered for as long as their size and
+    modification time do not change, so they are computed once per version.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+    path = Path(source).resolve()
+    stat = path.stat()
+    version = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _fingerprints_lock:
+        cached = _fingerprints.get(version)
+    if cached:
+        return cached
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    fingerprint = digest.hexdigest()
+    with _fingerprints_lock:
+        _fingerprints[version] = fingerprint
+    return fingerprint
+
+
+_cache: Optional[PageRenderCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageRenderCache:
+    """
+    Return the process-wide page cache, creating it on first use.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PageRenderCache()
+        return _cache
@@ -0,0 +1,64 @@
+import math
+from typing import Optional
+
+import fitz  # PyMuPDF
+
+from src.infrastructure.file_services.page_renderer import INVISIBLE_TEXT
+
+MIN_DPI = 72
+MAX_DPI = 600
+# Text and line art stay crisp at print resolution...
+VECTOR_DPI = 300
+# ...unless the smallest text would end up fewer pixels tall than this
+_MIN_GLYPH_PIXELS = 24
+_DPI_STEP = 10
+
+
+def image_dpi(page: fitz.Page, xref: int, width: int, height: int) -> Optional[float]:
+    """
+    Highest resolution an embedded image is placed at on the page.
+
+    Args:
+        page: Page the image is drawn on
+        xref: The image's xref
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        Pixels per inch, or None if the image is not visible
+    """
+    best = None
+    for rect in page.get_image_rects(xref):
+        if rect.is_empty:
+            continue
+        # Compare long sides with long sides, so quarter-turned images measure right
+        dpi = max(width, height) / (max(rect.width, rect.height) / 72)
+        best = dpi if best is None else max(best, dpi)
+    return best
+
+
+def choose_dpi(page: fitz.Page) -> int:
+    """
+    Lowest DPI that keeps all the detail on a page.
+
+    Embedded images are rendered at their own resolution, so a 150-DPI scan
+    gives 150-DPI output; text and drawings get at least VECTOR_DPI, more
+    for very small text. Blank pages get MIN_DPI. The result is rounded up
+    to a multiple of 10 (so near-identical scans share page cache entries)
+    and clamped to MIN_DPI..MAX_DPI.
+    """
+    dpi = MIN_DPI
+    for xref, _, width, height, *_ in page.get_images(full=True):
+        placed = image_dpi(page, xref, width, height)
+        if placed is not None:
+            dpi = max(dpi, placed)
+
+    font_sizes = [span['size'] for span in page.get_texttrace()
+                  if span['type'] != INVISIBLE_TEXT and span['size'] > 0]
+    if font_sizes:
+        dpi = max(dpi, VECTOR_DPI, _MIN_GLYPH_PIXELS * 72 / min(font_sizes))
+    elif page.first_annot is not None or page.get_drawings():
+        dpi = max(dpi, VECTOR_DPI)
+
+    dpi = math.ceil(dpi / _DPI_STEP - 1e-6) * _DPI_STEP
+    return int(min(MAX_DPI, max(MIN_DPI, dpi)))
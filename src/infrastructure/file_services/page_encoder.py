@@ -0,0 +1,175 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import io
+import os
+import threading
+
+from PIL import Image
+
+from src.domain.models.rendered_page import RenderedPage
+from src.infrastructure.monitoring.instrumentation import JobRecorder
+
+# Format name -> (PIL format, file extension)
+PAGE_FORMATS = {
+    'png': ('PNG', 'png'),
+    'jpeg': ('JPEG', 'jpg'),
+    'jpg': ('JPEG', 'jpg'),
+    'webp': ('WEBP', 'webp'),
+    'tiff': ('TIFF', 'tif'),
+}
+
+
+def resolve_format(image_format: str) -> Tuple[str, str]:
+    """
+    Return the PIL format and file extension for a page format name.
+    """
+    image_format = image_format.lower().lstrip('.')
+    if image_format not in PAGE_FORMATS:
+        raise ValueError(f"Unsupported image format '{image_format}'. "
+                         f"Choose from: {', '.join(PAGE_FORMATS)}")
+    return PAGE_FORMATS[image_format]
+
+
+class PageEncoderPool:
+    """
+    Encodes rendered pages in parallel, off the render thread.
+
+    PNG deflate and JPEG/WebP compression run in PIL's C encoders, which
+    release the GIL, so while one page is being rasterized the previous ones
+    are encoded on other cores. At most `max_pending` pages wait or run in
+    the pool at once; submit() blocks beyond that, so a fast renderer cannot
+    pile up raw pages in memory.
+    """
+
+    def __init__(self,
+                 image_format: str = 'png',
+                 quality: int = 90,
+                 max_workers: Optional[int] = None,
+                 max_pending: Optional[int] = None,
+                 recorder: Optional[JobRecorder] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            image_format: 'png', 'jpeg' (or 'jpg'), 'webp' or 'tiff'
+            quality: JPEG/WebP quality (1-100); PNG and TIFF are lossless
+            max_workers: Encoder threads. Defaults to min(4, CPU count)
+            max_pending: Pages queued or encoding at once. Defaults to twice the workers
+            recorder: Optional recorder the encode time is added to; may also be set later
+        """
+        self.pil_format, self.extension = resolve_format(image_format)
+        if not 1 <= int(quality) <= 100:
+            raise ValueError("Quality must be between 1 and 100")
+        self.quality = int(quality)
+        workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hiel-encode')
+        self._slots = threading.BoundedSemaphore(max_pending or workers * 2)
+        self.recorder = recorder
+
+    def encode(self,
+               page: RenderedPage,
+               size: Optional[Tuple[int, int]] = None,
+               image_format: Optional[str] = None,
+               quality: Optional[int] = None) -> bytes:
+        """
+        Encode one page in the calling thread.
+
+        Args:
+            page: Rendered page
+            size: Optional smaller (width, height) to downsample to first
+            image_format: Format for this page instead of the pool's
+            quality: Quality for this page instead of the pool's
+        """
+        pil_format = resolve_format(image_format)[0] if image_format else self.pil_format
+        mode = 'L' if page.channels == 1 else 'RGB'
+        # Wraps the samples without copying them
+        img = Image.frombuffer(mode, (page.width, page.height), page.samples, 'raw', mode, 0, 1)
+        if size and tuple(size) != img.size:
+            # reducing_gap box-reduces by an integer factor before the Lanczos pass
+            img = img.resize(size, Image.LANCZOS, reducing_gap=3.0)
+        if pil_format == 'PNG':
+            options = {'optimize': False}
+        elif pil_format == 'TIFF':
+            options = {'compression': 'tiff_deflate'}  # Lossless, like PNG
+        else:
+            options = {'quality': quality or self.quality}
+        with io.BytesIO() as bio:
+            img.save(bio, format=pil_format, **options)
+            return bio.getvalue()
+
+    def submit(self,
+               page: RenderedPage,
+               output_path: Optional[Union[str, Path]] = None,
+               size: Optional[Tuple[int, int]] = None,
+               image_format: Optional[str] = None,
+               quality: Optional[int] = None) -> Future:
+        """
+        Queue a page for encoding, waiting while the pool is full.
+
+        Args:
+            page: Rendered page
+            output_path: Optional file to write the encoded page to
+            size, image_format, quality: As for encode()
+
+        Returns:
+            Future for the output path when output_path is given, else for the encoded bytes
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._run, page, output_path, size, image_format, quality)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def submit_encoded(self, data: bytes, output_path: Optional[Union[str, Path]] = None) -> Future:
+        """
+        Queue already encoded image data, e.g. an extracted scan, in order with
+        the rendered pages.
+
+        Returns:
+            Future for the output path when output_path is given, else for data
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._write, data, output_path)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def close(self, cancel: bool = False) -> None:
+        """
+        Wait for running encodes; with cancel, drop the queued ones.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self) -> 'PageEncoderPool':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(cancel=exc_type is not None)
+
+    def _run(self,
+             page: RenderedPage,
+             output_path: Optional[Union[str, Path]],
+             size: Optional[Tuple[int, int]],
+             image_format: Optional[str],
+             quality: Optional[int]) -> Union[str, bytes]:
+        if self.recorder:
+            with self.recorder.stage('encode'):
+                data = self.encode(page, size, image_format, quality)
+        else:
+            data = self.encode(page, size, image_format, quality)
+        return self._write(data, output_path)
+
+    @staticmethod
+    def _write(data: bytes, output_path: Optional[Union[str, Path]]) -> Union[str, bytes]:
+        if output_path is None:
+            return data
+        with open(output_path, 'wb') as f:
+            f.write(data)
+        return str(output_path)
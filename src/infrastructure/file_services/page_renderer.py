@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import fitz  # PyMuPDF
+
+from src.domain.models.rendered_page import RenderedPage
+from src.infrastructure.file_services.page_cache import PageRenderCache, document_fingerprint, get_page_cache
+from src.infrastructure.monitoring.instrumentation import JobRecorder
+
+COLORSPACES = {'rgb': fitz.csRGB, 'gray': fitz.csGRAY}
+# Text span type of invisible text (render mode 3), as written by OCR into "searchable" scans
+INVISIBLE_TEXT = 3
+
+
+def open_document(source: Union[str, Path, bytes]) -> Tuple[fitz.Document, str]:
+    """
+    Open a PDF file or in-memory PDF and return it with its fingerprint.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype='pdf'), document_fingerprint(source)
+    return fitz.open(str(source)), document_fingerprint(source)
+
+
+def to_pixmap(page: RenderedPage) -> fitz.Pixmap:
+    """
+    Wrap rendered samples in a PyMuPDF pixmap, e.g. to save it.
+    """
+    return fitz.Pixmap(COLORSPACES[page.colorspace], page.width, page.height, page.samples, False)
+
+
+class PageRenderer:
+    """
+    Rasterizes PDF pages, serving repeated renders from the page cache.
+    """
+
+    def __init__(self, cache: Optional[PageRenderCache] = None, use_cache: bool = True):
+        """
+        Initialize the renderer.
+
+        Args:
+            cache: Page cache. Defaults to the process-wide cache
+            use_cache: Set to False to always render
+        """
+        self._cache = cache
+        self.use_cache = use_cache
+
+    @property
+    def cache(self) -> PageRenderCache:
+        if self._cache is None:
+            self._cache = get_page_cache()
+        return self._cache
+
+    def render(self,
+               document: fitz.Document,
+               fingerprint: str,
+               page_index: int,
+               dpi: int,
+               colorspace: str = 'rgb',
+               recorder: Optional[JobRecorder] = None) -> RenderedPage:
+        """
+        Render one page, or return it from the cache.
+
+        Args:
+            document: Open document
+            fingerprint: The document's fingerprint (see open_document())
+            page_index: 0-based page number
+            dpi: Resolution
+            colorspace: 'rgb' or 'gray'
+            recorder: Optional recorder for the render time and cache counters
+
+        Returns:
+            The page's pixels
+        """
+        if colorspace not in COLORSPACES:
+            raise ValueError(f"Unsupported colorspace '{colorspace}'. Choose from: {', '.join(COLORSPACES)}")
+        key = (fingerprint, page_index, int(dpi), colorspace)
+        if self.use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if recorder:
+                    recorder.count('cache_hits')
+                return cached
+
+        if recorder:
+            with recorder.stage('render'):
+                page = self._render(document, page_index, int(dpi), colorspace)
+            recorder.count('cache_misses')
+        else:
+            page = self._render(document, page_index, int(dpi), colorspace)
+        if self.use_cache:
+            self.cache.put(key, page)
+        return page
+
+    @staticmethod
+    def _render(document: fitz.Document, page_index: int, dpi: int, colorspace: str) -> RenderedPage:
+        pix = document[page_index].get_pixmap(matrix=fitz.Matrix(dpi / 72, dpi / 72),
+                                              colorspace=COLORSPACES[colorspace], alpha=False)
+        # MuPDF pixmap rows are packed (stride == width * channels)
+        return RenderedPage(page_index, dpi, colorspace, pix.width, pix.height, pix.samples)
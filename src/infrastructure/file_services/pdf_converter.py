@@ -1,57 +1,629 @@
 from pathlib import Path
-from typing import List, Optional, Union, Callable
-import fitz  # PyMuPDF
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import os
+from typing import Dict, List, Optional, Sequence, Tuple, Union, Callable
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, as_completed, wait
+from functools import partial
 import sys
+import math
+import re
 import shutil
-from src.domain.interfaces.file_converter import FileConverter
+import threading
+from src.domain.interfaces.file_converter import BinarySource, FileConverter
+from src.domain.models.cancellation import CancellationToken, OperationCancelledError, raise_if_cancelled
+from src.domain.models.page_image import PageImage
+from src.domain.models.rendition_spec import RenditionSpec
+from src.infrastructure.file_services.buffer_io import read_binary
+from src.infrastructure.file_services.checkpoint import MANIFEST_NAME, ConversionCheckpoint
+from src.infrastructure.file_services.page_archive import ARCHIVE_FORMATS, PageArchiveWriter
+from src.infrastructure.file_services.page_dpi import choose_dpi
+from src.infrastructure.file_services.page_encoder import PageEncoderPool, resolve_format
+from src.infrastructure.file_services.page_renderer import PageRenderer, open_document
+from src.infrastructure.file_services.scan_extractor import extract_scan_image
+from src.infrastructure.monitoring.instrumentation import JobRecorder, instrument
+
+DEFAULT_DPI = 300
+
+
+def parse_renditions(text: str) -> List[RenditionSpec]:
+    """
+    Parse a rendition list.
+
+    Renditions are separated by ',' and written NAME:SIZE[:FORMAT[:QUALITY]],
+    where SIZE is a DPI ('300dpi') or the longer side in pixels ('1024px'), e.g.
+    'full:300dpi,preview:1024px:jpeg:85,thumb:256px:webp:80'.
+    """
+    specs = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        fields = [field.strip() for field in part.split(':')]
+        if len(fields) < 2 or len(fields) > 4:
+            raise ValueError(f"Invalid rendition '{part}', expected NAME:SIZE[:FORMAT[:QUALITY]]")
+        name, size = fields[0], fields[1].lower()
+        match = re.fullmatch(r'(\d+)(dpi|px)', size)
+        if not name or not match:
+            raise ValueError(f"Invalid rendition '{part}', size must be like 300dpi or 1024px")
+        value = int(match.group(1))
+        specs.append(RenditionSpec(
+            name,
+            dpi=value if match.group(2) == 'dpi' else None,
+            max_size=value if match.group(2) == 'px' else None,
+            fmt=fields[2] if len(fields) > 2 else 'png',
+            quality=int(fields[3]) if len(fields) > 3 else 90
+        ))
+    return specs
 
 class PDFToImageConverter(FileConverter):
-    def __init__(self):
-        pass
+    def __init__(self, renderer: Optional[PageRenderer] = None):
+        """
+        Initialize PDFToImageConverter.
+        
+        Args:
+            renderer: Optional page renderer, used when use_cache is set.
+                      Defaults to one backed by the process-wide page cache
+        """
+        self.renderer = renderer or PageRenderer()
 
     def convert(self, 
                 input_path: Union[str, Path], 
                 output_path: Optional[Union[str, Path]] = None,
+                *,
                 progress_callback: Optional[Callable[[int], None]] = None,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> List[str]:
+        """
+        Render every page of a PDF to an image file.
+        
+        Args:
+            input_path: Path to the PDF
+            output_path: Optional output directory. Defaults to '<name>_images'
+            progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked between pages
+            **kwargs: Additional parameters, see convert_pages(). With
+                      renditions (see convert_renditions()), every rendition
+                      is written to its own subdirectory. With archive
+                      ('zip', 'tar' or 'tiff', see convert_archive()), all
+                      pages go into one archive file instead. The two cannot
+                      be combined
+        
+        Returns:
+            Paths of the page images, in page order (rendition by rendition),
+            or the path of the archive
+
+        Raises:
+            ValueError: If both archive and renditions are given
+        """
+        archive = kwargs.pop('archive', None)
+        if archive and kwargs.get('renditions'):
+            raise ValueError("archive and renditions cannot be combined; "
+                             "convert each rendition to its own archive instead")
+        if archive:
+            archive_path, _ = self.convert_archive(input_path, archive, output_path,
+                                                   progress_callback=progress_callback,
+                                                   cancel_token=cancel_token, **kwargs)
+            return [archive_path]
+        renditions = kwargs.pop('renditions', None)
+        if renditions:
+            results = self.convert_renditions(input_path, renditions, output_path,
+                                              progress_callback=progress_callback,
+                                              cancel_token=cancel_token, **kwargs)
+            return [page.output for pages in results.values() for page in pages]
+        pages = self.convert_pages(input_path, output_path, progress_callback=progress_callback,
+                                   cancel_token=cancel_token, **kwargs)
+        return [page.output for page in pages]
+
+    def convert_pages(self,
+                      input_path: Union[str, Path],
+                      output_path: Optional[Union[str, Path]] = None,
+                      *,
+                      progress_callback: Optional[Callable[[int], None]] = None,
+                      cancel_token: Optional[CancellationToken] = None,
+                      **kwargs) -> List[PageImage]:
+        """
+        Render every page of a PDF to an image file, reporting how each page was produced.
+        
+        Args:
+            input_path: Path to the PDF
+            output_path: Optional output directory. Defaults to '<name>_images'
+            progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked between pages
+            **kwargs: Additional parameters including:
+                     - dpi: Render resolution (default 300), or 'auto' to pick
+                       the lowest DPI that keeps each page's detail: scans at
+                       their own resolution, text and drawings at 300 or more
+                     - fmt: 'png' (default), 'jpeg' or 'webp'
+                     - quality: JPEG/WebP quality (default 90)
+                     - encode_workers: Parallel encoder threads
+                     - use_cache: Read and fill the page render cache (default
+                       False). Encoding dominates a one-off conversion, so
+                       caching every page costs more than it saves
+                     - extract_images: Save pages that are a single scanned
+                       image as that image instead of rendering them (default
+                       True). Such pages keep the scan's resolution and format
+                       (.jpg for JPEG scans, else .png) regardless of fmt
+                     - resume: Keep a checkpoint manifest in the output
+                       directory while converting, and reuse the pages an
+                       interrupted run with the same PDF and options already
+                       wrote (default True). The manifest is removed once
+                       every page is done
+        
+        Returns:
+            One PageImage per page, in page order, with its path and DPI
+        """
+        converted_images = []
+        created_dir = None
+        checkpoint = None
         try:
             input_path = Path(input_path)
             if not input_path.exists():
                 raise FileNotFoundError(f"PDF file not found: {input_path}")
             
-            # Simplified: Use a single default DPI
-            dpi = 300
-            fmt = kwargs.get('fmt', 'png')
-            thread_count = min(os.cpu_count() or 1, 4)
+            encoder = self._create_encoder(kwargs)
             
             if output_path is None:
                 output_path = input_path.parent / f"{input_path.stem}_images"
             output_path = Path(output_path)
+            if not output_path.exists():
+                created_dir = output_path
             output_path.mkdir(parents=True, exist_ok=True)
 
-            pdf_document = fitz.open(str(input_path))
-            total_pages = pdf_document.page_count
-            converted_images = []
+            def output_for(page_num: int, extension: str) -> Path:
+                output_filename = output_path / f"page_{page_num + 1}.{extension}"
+                converted_images.append(str(output_filename))
+                return output_filename
 
-            for page_num in range(total_pages):
-                page = pdf_document[page_num]
-                pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72))
-                
-                # Generate output filename
-                output_filename = output_path / f"page_{page_num + 1}.{fmt}"
-                
-                # Save the image
-                pix.save(str(output_filename))
+            with instrument('PDFToImageConverter.convert') as recorder:
+                with recorder.stage('open'):
+                    pdf_document, fingerprint = open_document(input_path)
+                if kwargs.get('resume', True):
+                    params = {name: kwargs.get(name, default) for name, default in
+                              (('dpi', DEFAULT_DPI), ('fmt', 'png'), ('quality', 90),
+                               ('extract_images', True))}
+                    checkpoint = ConversionCheckpoint(output_path / MANIFEST_NAME, fingerprint, params)
+                pages = self._convert_pages(pdf_document, fingerprint, encoder, output_for,
+                                            progress_callback, cancel_token, recorder, kwargs,
+                                            checkpoint=checkpoint)
+                for page in pages:
+                    recorder.count_file(page.output)
+            
+            if checkpoint:
+                checkpoint.discard()
+            return pages
+
+        except OperationCancelledError:
+            # Pages from earlier runs stay, so the manifest still lets a later run resume
+            if checkpoint:
+                checkpoint.close()
+            self._remove_partial_output(converted_images, created_dir)
+            raise
+        except Exception as e:
+            if checkpoint:
+                checkpoint.close()
+            raise RuntimeError(f"PDF to Images conversion failed: {e}")
+
+    def convert_archive(self,
+                        input_path: Union[str, Path],
+                        archive_format: str,
+                        output_path: Optional[Union[str, Path]] = None,
+                        *,
+                        progress_callback: Optional[Callable[[int], None]] = None,
+                        cancel_token: Optional[CancellationToken] = None,
+                        **kwargs) -> Tuple[str, List[PageImage]]:
+        """
+        Render every page of a PDF straight into one archive file.
+        
+        Pages are appended in page order as soon as they are encoded; no
+        per-page files are created.
+        
+        Args:
+            input_path: Path to the PDF
+            archive_format: 'zip' or 'tar' (pages stored uncompressed, as
+                            'page_<n>.<ext>'), or 'tiff' (one multi-page TIFF,
+                            deflate-compressed; fmt and extract_images are ignored)
+            output_path: Optional archive path or existing directory. A path
+                         without a suffix gets the format's extension.
+                         Defaults to '<name>_images.<ext>' next to the PDF
+            progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked between pages
+            **kwargs: Additional parameters as for convert_pages()
+        
+        Returns:
+            The archive path, and one PageImage per page whose output is its
+            member name
+        """
+        try:
+            input_path = Path(input_path)
+            if not input_path.exists():
+                raise FileNotFoundError(f"PDF file not found: {input_path}")
+            
+            archive_format = archive_format.lower().lstrip('.')
+            if archive_format not in ARCHIVE_FORMATS:
+                raise ValueError(f"Unsupported archive format '{archive_format}'. "
+                                 f"Choose from: {', '.join(ARCHIVE_FORMATS)}")
+            options = dict(kwargs)
+            if archive_format == 'tiff':
+                # TIFF frames are encoded by the pool; extracted JPEGs cannot be appended
+                options.update(fmt='tiff', extract_images=False)
+            encoder = self._create_encoder(options)
+            
+            archive_name = f"{input_path.stem}_images.{ARCHIVE_FORMATS[archive_format]}"
+            if output_path is None:
+                output_path = input_path.parent / archive_name
+            output_path = Path(output_path)
+            if output_path.is_dir():
+                output_path = output_path / archive_name
+            elif not output_path.suffix:
+                output_path = output_path.with_name(f"{output_path.name}.{ARCHIVE_FORMATS[archive_format]}")
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with instrument('PDFToImageConverter.convert_archive') as recorder:
+                with recorder.stage('open'):
+                    pdf_document, fingerprint = open_document(input_path)
+                with PageArchiveWriter(output_path, archive_format) as writer:
+                    def add_page(page_num: int, extension: str, data: bytes) -> str:
+                        name = f"page_{page_num + 1}.{extension}"
+                        with recorder.stage('write'):
+                            writer.add(name, data)
+                        return name
+
+                    pages = self._convert_pages(pdf_document, fingerprint, encoder, None,
+                                                progress_callback, cancel_token, recorder, options,
+                                                sink=add_page)
+                    archive_path = writer.close()
+                recorder.count_file(archive_path)
+            
+            return archive_path, pages
+
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"PDF to Images conversion failed: {e}")
+
+    def convert_renditions(self,
+                           input_path: Union[str, Path],
+                           renditions: Union[str, Sequence[RenditionSpec]],
+                           output_path: Optional[Union[str, Path]] = None,
+                           *,
+                           progress_callback: Optional[Callable[[int], None]] = None,
+                           cancel_token: Optional[CancellationToken] = None,
+                           **kwargs) -> Dict[str, List[PageImage]]:
+        """
+        Produce several image sizes of every page from a single render per page.
+        
+        Args:
+            input_path: Path to the PDF
+            renditions: RenditionSpecs, or a description for parse_renditions(),
+                        e.g. 'full:300dpi,preview:1024px:jpeg:85,thumb:256px:webp:80'
+            output_path: Optional output directory. Defaults to '<name>_images'.
+                         Each rendition goes to a subdirectory named after it
+            progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked between pages
+            **kwargs: encode_workers and use_cache, as for convert_pages().
+                      Each page is rendered once and shared by all renditions
+                      in memory, so the cache only helps repeated runs
+        
+        Returns:
+            The pages of each rendition, keyed by rendition name
+        """
+        converted_images = []
+        created_dir = None
+        try:
+            input_path = Path(input_path)
+            if not input_path.exists():
+                raise FileNotFoundError(f"PDF file not found: {input_path}")
+            
+            specs = parse_renditions(renditions) if isinstance(renditions, str) else list(renditions)
+            self._validate_renditions(specs)
+            encoder = PageEncoderPool(specs[0].fmt, specs[0].quality,
+                                      max_workers=kwargs.get('encode_workers'))
+            
+            if output_path is None:
+                output_path = input_path.parent / f"{input_path.stem}_images"
+            output_path = Path(output_path)
+            if not output_path.exists():
+                created_dir = output_path
+            for spec in specs:
+                (output_path / spec.name).mkdir(parents=True, exist_ok=True)
+
+            def output_for(spec: RenditionSpec, page_num: int) -> Path:
+                extension = resolve_format(spec.fmt)[1]
+                output_filename = output_path / spec.name / f"page_{page_num + 1}.{extension}"
                 converted_images.append(str(output_filename))
-                
-                # Update progress if callback is provided
-                if progress_callback:
-                    progress_callback(int((page_num + 1) / total_pages * 100))
+                return output_filename
+
+            with instrument('PDFToImageConverter.convert_renditions') as recorder:
+                with recorder.stage('open'):
+                    pdf_document, fingerprint = open_document(input_path)
+                results = self._render_renditions(pdf_document, fingerprint, specs, encoder, output_for,
+                                                  progress_callback, cancel_token, recorder,
+                                                  kwargs.get('use_cache', False))
+                for pages in results.values():
+                    for page in pages:
+                        recorder.count_file(page.output)
             
-            pdf_document.close()
-            return converted_images
+            return results
 
+        except OperationCancelledError:
+            self._remove_partial_output(converted_images, created_dir)
+            raise
         except Exception as e:
-            raise RuntimeError(f"PDF to Images conversion failed: {e}")
\ No newline at end of file
+            raise RuntimeError(f"PDF to Images conversion failed: {e}")
+
+    def convert_buffer(self,
+                       data: BinarySource,
+                       *,
+                       progress_callback: Optional[Callable[[int], None]] = None,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> List[bytes]:
+        """
+        Render the pages of an in-memory PDF to encoded images.
+        
+        Args:
+            data: PDF as bytes or a binary file object
+            progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked between pages
+            **kwargs: dpi, fmt, quality, encode_workers, use_cache and
+                      extract_images, as for convert_pages()
+        
+        Returns:
+            One encoded image per page, in page order. Extracted scans keep
+            their own format
+        """
+        try:
+            encoder = self._create_encoder(kwargs)
+            with instrument('PDFToImageConverter.convert_buffer') as recorder:
+                with recorder.stage('open'):
+                    pdf_document, fingerprint = open_document(read_binary(data))
+                pages = self._convert_pages(pdf_document, fingerprint, encoder, None,
+                                            progress_callback, cancel_token, recorder, kwargs)
+                images = [page.output for page in pages]
+                recorder.count('bytes_written', sum(len(image) for image in images))
+            
+            return images
+
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"PDF to Images conversion failed: {e}")
+
+    @staticmethod
+    def _validate_renditions(specs: List[RenditionSpec]) -> None:
+        if not specs:
+            raise ValueError("At least one rendition is required")
+        names = [spec.name for spec in specs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Rendition names must be unique: {', '.join(names)}")
+        for spec in specs:
+            if (spec.dpi is None) == (spec.max_size is None):
+                raise ValueError(f"Rendition '{spec.name}' needs either a DPI or a maximum size")
+            if (spec.dpi or spec.max_size) <= 0:
+                raise ValueError(f"Rendition '{spec.name}' has a non-positive size")
+            resolve_format(spec.fmt)
+            if not 1 <= spec.quality <= 100:
+                raise ValueError(f"Rendition '{spec.name}': quality must be between 1 and 100")
+
+    @staticmethod
+    def _create_encoder(options: dict) -> PageEncoderPool:
+        dpi = options.get('dpi', DEFAULT_DPI)
+        # Checked here so bad options fail before any output directory is created
+        if dpi != 'auto' and not (isinstance(dpi, int) and dpi > 0):
+            raise ValueError(f"DPI must be a positive number or 'auto', got {dpi!r}")
+        return PageEncoderPool(options.get('fmt', 'png'), options.get('quality', 90),
+                               max_workers=options.get('encode_workers'))
+
+    def _convert_pages(self,
+                       pdf_document,
+                       fingerprint: str,
+                       encoder: PageEncoderPool,
+                       output_for: Optional[Callable[[int, str], Path]],
+                       progress_callback: Optional[Callable[[int], None]],
+                       cancel_token: Optional[CancellationToken],
+                       recorder: JobRecorder,
+                       options: dict,
+                       sink: Optional[Callable[[int, str, bytes], str]] = None,
+                       checkpoint: Optional[ConversionCheckpoint] = None) -> List[PageImage]:
+        """
+        Render every page (or take it from the page cache) on this thread and
+        encode the raw samples in the encoder pool, so page N+1 rasterizes
+        while page N compresses. Pages that are one scanned image skip both
+        steps and have their embedded image written as is. Closes the
+        document and the pool.
+        
+        Args:
+            sink: Optional callback receiving (page, extension, encoded page)
+                  on this thread, in page order, as soon as each page is
+                  ready; its return value becomes the page's output
+            checkpoint: Optional manifest; pages it lists as intact are
+                        reused, and every page written is recorded in it
+        
+        Returns:
+            Pages with output paths when output_for is given, sink outputs
+            with a sink, else with encoded images, in page order
+        """
+        dpi = options.get('dpi', DEFAULT_DPI)
+        extract_images = options.get('extract_images', True)
+        renderer = self.renderer if options.get('use_cache', False) else PageRenderer(use_cache=False)
+        encoder.recorder = recorder
+        futures: List[Optional[Future]] = []
+        pages: List[Tuple[int, bool, str]] = []  # (dpi, extracted, extension) per page
+        streamed: List[str] = []
+        
+        def track(future: Future, page_num: int, page_dpi: int, extracted: bool, extension: str) -> None:
+            if checkpoint:
+                future.add_done_callback(
+                    partial(self._record_page, checkpoint, page_num, page_dpi, extracted))
+            future.add_done_callback(page_encoded)
+            futures.append(future)
+            pages.append((page_dpi, extracted, extension))
+            if sink:
+                stream_ready()
+        
+        def stream_ready() -> None:
+            # Hand finished pages to the sink in page order, releasing their data
+            while len(streamed) < len(futures) and futures[len(streamed)].done():
+                index = len(streamed)
+                streamed.append(sink(index, pages[index][2], futures[index].result()))
+                futures[index] = None
+        
+        try:
+            with encoder:
+                total_pages = pdf_document.page_count
+                page_encoded = self._progress_counter(total_pages, progress_callback)
+
+                for page_num in range(total_pages):
+                    raise_if_cancelled(cancel_token)
+                    
+                    resumed = checkpoint.completed(str(page_num)) if checkpoint else None
+                    if resumed is not None:
+                        recorder.count('pages_resumed')
+                        future = Future()
+                        future.set_result(resumed['output'])
+                        future.add_done_callback(page_encoded)
+                        futures.append(future)
+                        pages.append((resumed['dpi'], resumed['extracted'], Path(resumed['output']).suffix[1:]))
+                        continue
+                    
+                    if extract_images:
+                        with recorder.stage('extract'):
+                            scan = extract_scan_image(pdf_document, page_num)
+                        if scan is not None:
+                            extension, data, scan_dpi = scan
+                            recorder.count('pages')
+                            recorder.count('pages_extracted')
+                            future = encoder.submit_encoded(
+                                data, output_for(page_num, extension) if output_for else None)
+                            track(future, page_num, scan_dpi, True, extension)
+                            continue
+                    
+                    if dpi == 'auto':
+                        with recorder.stage('choose_dpi'):
+                            page_dpi = choose_dpi(pdf_document[page_num])
+                    else:
+                        page_dpi = dpi
+                    rendered = renderer.render(pdf_document, fingerprint, page_num, page_dpi, recorder=recorder)
+                    recorder.count('pages')
+                    recorder.count_pixels(rendered.width, rendered.height)
+                    
+                    future = encoder.submit(rendered,
+                                            output_for(page_num, encoder.extension) if output_for else None)
+                    track(future, page_num, page_dpi, False, encoder.extension)
+                
+                if sink:
+                    for data in self._wait_for_encodes(futures[len(streamed):], cancel_token, recorder):
+                        index = len(streamed)
+                        streamed.append(sink(index, pages[index][2], data))
+                    outputs = streamed
+                else:
+                    outputs = self._wait_for_encodes(futures, cancel_token, recorder)
+                return [PageImage(page_num, page_dpi, output, extracted)
+                        for page_num, (output, (page_dpi, extracted, _)) in enumerate(zip(outputs, pages))]
+        finally:
+            pdf_document.close()
+
+    def _render_renditions(self,
+                           pdf_document,
+                           fingerprint: str,
+                           specs: List[RenditionSpec],
+                           encoder: PageEncoderPool,
+                           output_for: Callable[[RenditionSpec, int], Path],
+                           progress_callback: Optional[Callable[[int], None]],
+                           cancel_token: Optional[CancellationToken],
+                           recorder: JobRecorder,
+                           use_cache: bool = False) -> Dict[str, List[PageImage]]:
+        """
+        Render each page once, at the highest resolution any rendition needs,
+        and encode every rendition from that render; smaller ones are
+        downsampled on the encoder threads. Closes the document and the pool.
+        """
+        renderer = self.renderer if use_cache else PageRenderer(use_cache=False)
+        encoder.recorder = recorder
+        futures: List[Future] = []
+        pages: List[Tuple[str, int, int]] = []  # (rendition, page, dpi) per output
+        
+        try:
+            with encoder:
+                total_pages = pdf_document.page_count
+                page_encoded = self._progress_counter(total_pages * len(specs), progress_callback)
+
+                for page_num in range(total_pages):
+                    raise_if_cancelled(cancel_token)
+                    
+                    # Resolution each rendition needs; max_size is in pixels of the longer side
+                    page_rect = pdf_document[page_num].rect
+                    long_side = max(page_rect.width, page_rect.height)
+                    targets = [spec.dpi or spec.max_size * 72 / long_side for spec in specs]
+                    render_dpi = math.ceil(max(targets) - 1e-6)
+                    rendered = renderer.render(pdf_document, fingerprint, page_num, render_dpi, recorder=recorder)
+                    recorder.count('pages')
+                    recorder.count_pixels(rendered.width, rendered.height)
+                    
+                    for spec, target in zip(specs, targets):
+                        scale = min(1.0, target / render_dpi)
+                        size = (max(1, round(rendered.width * scale)), max(1, round(rendered.height * scale)))
+                        future = encoder.submit(rendered, output_for(spec, page_num), size,
+                                                spec.fmt, spec.quality)
+                        future.add_done_callback(page_encoded)
+                        futures.append(future)
+                        pages.append((spec.name, page_num, round(render_dpi * scale)))
+                
+                outputs = self._wait_for_encodes(futures, cancel_token, recorder)
+                results = {spec.name: [] for spec in specs}
+                for output, (name, page_num, page_dpi) in zip(outputs, pages):
+                    results[name].append(PageImage(page_num, page_dpi, output))
+                return results
+        finally:
+            pdf_document.close()
+
+    @staticmethod
+    def _record_page(checkpoint: ConversionCheckpoint,
+                     page_num: int,
+                     page_dpi: int,
+                     extracted: bool,
+                     future: Future) -> None:
+        # Done-callback on an encoder thread; only pages fully written count
+        if not future.cancelled() and future.exception() is None:
+            checkpoint.record(str(page_num), future.result(), dpi=page_dpi, extracted=extracted)
+
+    @staticmethod
+    def _progress_counter(total: int,
+                          progress_callback: Optional[Callable[[int], None]]) -> Callable[[Future], None]:
+        """
+        Future done-callback reporting the share of finished encodes.
+        """
+        lock = threading.Lock()
+        finished = [0]
+        
+        def encoded(_) -> None:
+            # Runs on an encoder thread
+            with lock:
+                finished[0] += 1
+                done = finished[0]
+            if progress_callback:
+                progress_callback(int(done / total * 100))
+        
+        return encoded
+
+    @staticmethod
+    def _wait_for_encodes(futures: List[Future],
+                          cancel_token: Optional[CancellationToken],
+                          recorder: JobRecorder) -> List[Union[str, bytes]]:
+        """
+        Wait for the queued encodes, still honouring cancellation, and return
+        their results in submission order.
+        """
+        pending = set(futures)
+        with recorder.stage('encode_wait'):
+            while pending:
+                raise_if_cancelled(cancel_token)
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    if future.exception() is not None:
+                        raise future.exception()
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _remove_partial_output(files: List[str], created_dir: Optional[Path]) -> None:
+        for file_path in files:
+            Path(file_path).unlink(missing_ok=True)
+        if created_dir is not None:
+            shutil.rmtree(created_dir, ignore_errors=True)
\ No newline at end of file
@@ -1,14 +1,37 @@
 from pathlib import Path
-from typing import Optional, Union
-import comtypes.client
-import win32com.client
+from typing import Callable, List, Optional, Sequence, Union
 from pptx import Presentation
-from src.domain.interfaces.file_converter import FileConverter
+from src.domain.interfaces.file_converter import BinarySource, FileConverter
+from src.domain.interfaces.office_renderer import OfficeRenderer
+from src.domain.models.cancellation import CancellationToken
+from src.domain.models.conversion_result import ConversionResult
+from src.infrastructure.file_services.batch_runner import run_batch
+from src.infrastructure.file_services.buffer_io import read_binary, sniff_suffix, spill_to_file
+from src.infrastructure.monitoring.instrumentation import instrument
+from src.infrastructure.office_services.renderer_factory import get_office_renderer
 
 class PPTConverter(FileConverter):
+    def __init__(self, renderer: Optional[OfficeRenderer] = None):
+        """
+        Initialize PPTConverter.
+        
+        Args:
+            renderer: Optional backend for PPT/PPTX to PDF rendering. Defaults to
+                      the shared renderer selected for this host
+        """
+        self._renderer = renderer
+    
+    @property
+    def renderer(self) -> OfficeRenderer:
+        if self._renderer is None:
+            self._renderer = get_office_renderer()
+        return self._renderer
+    
     def convert(self, 
                 input_path: Union[str, Path], 
                 output_path: Optional[Union[str, Path]] = None,
+                *,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> str:
         """
         Convert between PPT/PPTX and PDF formats.
@@ -16,7 +39,9 @@ class PPTConverter(FileConverter):
         Args:
             input_path: Path to the input file (PPT/PPTX or PDF)
             output_path: Optional output file path
-            **kwargs: Additional parameters
+            cancel_token: Optional token that aborts the rendering job
+            **kwargs: Additional parameters including:
+                     - timeout: Maximum seconds for PPT/PPTX to PDF rendering
         
         Returns:
             Path to the converted file
@@ -42,16 +67,89 @@ class PPTConverter(FileConverter):
         
         if is_to_pdf:
             # PPT/PPTX to PDF
-            powerpoint = win32com.client.Dispatch("Powerpoint.Application")
-            try:
-                deck = powerpoint.Presentations.Open(str(input_path.absolute()))
-                deck.SaveAs(str(output_path.absolute()), 32)  # 32 is the PDF format code
-                deck.Close()
-            finally:
-                powerpoint.Quit()
+            with instrument('PPTConverter.convert') as recorder:
+                with recorder.stage('render'):
+                    self.renderer.render_to_pdf(input_path, output_path, 
+                                                timeout=kwargs.get('timeout'), 
+                                                cancel_token=cancel_token)
+                recorder.count('documents')
+                recorder.count_file(output_path)
         else:
             # PDF to PPTX (Note: This is a placeholder as direct PDF to PPT conversion
             # is complex and might require OCR or third-party services)
             raise NotImplementedError("PDF to PPT conversion not yet implemented")
         
-        return str(output_path) 
\ No newline at end of file
+        return str(output_path)
+    
+    def convert_buffer(self,
+                       data: BinarySource,
+                       *,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> bytes:
+        """
+        Convert an in-memory presentation to PDF.
+        
+        The rendering application only opens files, so the presentation is
+        written to a private temporary directory that is removed afterwards.
+        
+        Args:
+            data: PPT/PPTX as bytes or a binary file object
+            cancel_token: Optional token that aborts the rendering job
+            **kwargs: As for convert(), plus input_format ('.ppt' or '.pptx'),
+                      detected from the content when omitted
+        
+        Returns:
+            The PDF document
+        """
+        content = read_binary(data)
+        input_format = kwargs.pop('input_format', None)
+        input_format = f".{input_format.lstrip('.').lower()}" if input_format else sniff_suffix(content)
+        if input_format not in ('.ppt', '.pptx', '.pdf'):
+            raise ValueError("Cannot detect the input format; pass input_format='.ppt' or '.pptx'")
+        
+        with spill_to_file(content, input_format) as input_path:
+            output_path = self.convert(input_path, None, cancel_token=cancel_token, **kwargs)
+            return Path(output_path).read_bytes()
+    
+    def convert_batch(self,
+                      input_paths: Sequence[Union[str, Path]],
+                      output_dir: Optional[Union[str, Path]] = None,
+                      progress_callback: Optional[Callable[[int], None]] = None,
+                      max_workers: Optional[int] = None,
+                      cancel_token: Optional[CancellationToken] = None,
+                      **kwargs) -> List[ConversionResult]:
+        """
+        Convert many presentations to PDF with a single rendering application.
+        
+        The renderer is started once and reused for every file. A file that
+        fails is reported in its result without aborting the batch.
+        
+        Args:
+            input_paths: Presentations to convert
+            output_dir: Optional directory for all outputs. Defaults to each input's directory
+            progress_callback: Optional callback for overall progress (0-100)
+            max_workers: Files converted concurrently. Defaults to the renderer's pool size
+            cancel_token: Optional token; files not started when it is cancelled
+                          are reported as cancelled
+            **kwargs: Conversion parameters passed to convert()
+        
+        Returns:
+            One ConversionResult per input, in input order
+        """
+        if max_workers is None:
+            max_workers = getattr(self.renderer, 'size', 1)
+        
+        output_path_for = None
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            output_path_for = lambda p: output_dir / f"{p.stem}.pdf"
+        
+        return run_batch(
+            lambda p, out: self.convert(p, out, cancel_token=cancel_token, **kwargs),
+            input_paths,
+            output_path_for,
+            progress_callback,
+            max_workers,
+            cancel_token
+        )
@@ -0,0 +1,66 @@
+from typing import Optional, Tuple
+
+import fitz  # PyMuPDF
+
+from src.infrastructure.file_services.page_renderer import INVISIBLE_TEXT
+
+# The image must cover this share of the page to count as a full-page scan
+_MIN_COVERAGE = 0.95
+
+
+def extract_scan_image(document: fitz.Document, page_index: int) -> Optional[Tuple[str, bytes, int]]:
+    """
+    Return the embedded image of a page that is nothing but one scanned image.
+
+    JPEG streams are returned byte-for-byte, without decoding. Other
+    encodings (JBIG2, CCITT fax, Flate, JPEG with CMYK or a Decode array) are
+    decoded at their native resolution and returned as PNG, which is lossless
+    and still skips rasterizing the page.
+
+    Args:
+        document: Open document
+        page_index: 0-based page number
+
+    Returns:
+        (file extension, image data, the scan's DPI on the page), or None if
+        the page has to be rendered:
+        more or less than one image, visible text, vector drawings,
+        annotations, a transparency mask, or an image that is rotated,
+        mirrored or does not fill the page
+    """
+    page = document[page_index]
+    images = page.get_images(full=True)
+    if len(images) != 1:
+        return None
+    xref, smask, width, height, _, colorspace_name = images[0][:6]
+    if smask or not colorspace_name or page.rotation or page.first_annot is not None:
+        return None
+    if any(span['type'] != INVISIBLE_TEXT for span in page.get_texttrace()):
+        return None
+    if page.get_drawings():
+        return None
+
+    placements = page.get_image_rects(xref, transform=True)
+    if len(placements) != 1:
+        return None
+    rect, matrix = placements[0]
+    # Upright, unmirrored placement only; anything else would need rendering
+    if abs(matrix.b) > 1e-6 or abs(matrix.c) > 1e-6 or matrix.a <= 0 or matrix.d <= 0:
+        return None
+    page_area = page.rect.get_area()
+    if not page_area or (rect & page.rect).get_area() < _MIN_COVERAGE * page_area:
+        return None
+
+    dpi = round(max(width, height) / (max(rect.width, rect.height) / 72))
+
+    extracted = document.extract_image(xref)
+    if (extracted and extracted['ext'] == 'jpeg' and extracted['colorspace'] in (1, 3)
+            and document.xref_get_key(xref, 'Decode')[0] == 'null'):
+        return 'jpg', extracted['image'], dpi
+
+    pix = fitz.Pixmap(document, xref)
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)
+    if pix.n not in (1, 3):
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    return 'png', pix.tobytes('png'), dpi
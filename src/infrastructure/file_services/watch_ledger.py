@@ -0,0 +1,110 @@
+from pathlib import Path
+from typing import List, Optional, Union
+import sqlite3
+import threading
+import time
+
+from src.domain.models.conversion_result import ConversionResult
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed (
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    tool TEXT NOT NULL,
+    output TEXT,
+    error TEXT,
+    seconds REAL,
+    processed_at REAL NOT NULL,
+    PRIMARY KEY (path, size, mtime_ns, tool)
+)
+"""
+
+
+class WatchLedger:
+    """
+    Persistent record of the files a folder watcher has handled.
+
+    A file is identified by its path, size and modification time, so a file
+    that is replaced with new content is converted again while an unchanged
+    one is skipped across restarts. Failures are recorded too, so a broken
+    file is not retried in a loop.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) the ledger database.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Shared by the watcher's worker threads; access is serialized by the lock
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(_SCHEMA)
+
+    def contains(self, path: Path, tool: str, include_failed: bool = True) -> bool:
+        """
+        Whether this version of the file was already handled by the tool.
+
+        Args:
+            path: Input file
+            tool: Conversion name
+            include_failed: Count failed attempts as handled
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        query = ('SELECT 1 FROM processed WHERE path = ? AND size = ? AND mtime_ns = ? AND tool = ?'
+                 + ('' if include_failed else ' AND error IS NULL'))
+        with self._lock:
+            row = self._db.execute(query, (str(path.resolve()), stat.st_size, stat.st_mtime_ns, tool)).fetchone()
+        return row is not None
+
+    def record(self, path: Path, tool: str, result: ConversionResult) -> None:
+        """
+        Record the outcome of converting this version of the file.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return  # Removed while converting; nothing to skip next time
+        output = result.output_path
+        if output is not None and not isinstance(output, str):
+            output = repr(output)
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO processed VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (str(path.resolve()), stat.st_size, stat.st_mtime_ns, tool,
+                 output, result.error, result.seconds, time.time())
+            )
+
+    def failures(self, limit: Optional[int] = None) -> List[ConversionResult]:
+        """
+        Most recent failed conversions, newest first.
+        """
+        query = 'SELECT path, error, seconds FROM processed WHERE error IS NOT NULL ORDER BY processed_at DESC'
+        if limit:
+            query += f' LIMIT {int(limit)}'
+        with self._lock:
+            rows = self._db.execute(query).fetchall()
+        return [ConversionResult(path, None, seconds or 0.0, error) for path, error, seconds in rows]
+
+    def forget_failures(self) -> int:
+        """
+        Drop failed entries so those files are tried again.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._db:
+            return self._db.execute('DELETE FROM processed WHERE error IS NOT NULL').rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -1,8 +1,9 @@
-from PIL import Image
 from pathlib import Path
-import os
 from typing import Union, Optional, Dict, Tuple
 
+from src.domain.models.cancellation import CancellationToken, OperationCancelledError
+from src.infrastructure.image_services.icon_bundle import IconBundleGenerator, android_manifest
+
 
 class AndroidLogoGenerator:
     """
@@ -26,7 +27,8 @@ class AndroidLogoGenerator:
     def generate_icons(self, 
                       input_path: Union[str, Path],
                       output_base_dir: Optional[Union[str, Path]] = None,
-                      progress_callback: Optional[callable] = None) -> Dict[str, str]:
+                      progress_callback: Optional[callable] = None,
+                      cancel_token: Optional[CancellationToken] = None) -> Dict[str, str]:
         """
         Generate Android app icons in various densities.
         
@@ -34,6 +36,7 @@ class AndroidLogoGenerator:
             input_path: Path to the input image
             output_base_dir: Optional base directory for output. If None, uses input file's directory
             progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked before each size and encode
             
         Returns:
             Dictionary mapping density folders to generated icon paths
@@ -48,35 +51,24 @@ class AndroidLogoGenerator:
                 output_base_dir = input_path.parent / f"{input_path.stem}_android_res"
             output_base_dir = Path(output_base_dir)
             
-            # Create output directory
-            output_base_dir.mkdir(parents=True, exist_ok=True)
-            
-            generated_paths = {}
-            total_sizes = len(self.ANDROID_SIZES)
+            # Determine output filename based on resource type
+            manifest = android_manifest(
+                self.ANDROID_SIZES,
+                lambda folder: 'ic_launcher.png' if folder.startswith('mipmap') else 'ic_launcher_foreground.png'
+            )
             
-            # Open and process image
-            with Image.open(input_path) as img:
-                for idx, (folder, size) in enumerate(self.ANDROID_SIZES.items(), 1):
-                    # Create density-specific folder
-                    folder_path = output_base_dir / folder
-                    folder_path.mkdir(parents=True, exist_ok=True)
-                    
-                    # Determine output filename based on resource type
-                    output_filename = 'ic_launcher.png' if folder.startswith('mipmap') else 'ic_launcher_foreground.png'
-                    output_path = folder_path / output_filename
-                    
-                    # Resize and save
-                    resized_img = img.resize(size, Image.Resampling.LANCZOS)
-                    resized_img.save(str(output_path), 'PNG')
-                    
-                    generated_paths[folder] = str(output_path)
-                    
-                    # Update progress
-                    if progress_callback:
-                        progress = int((idx / total_sizes) * 100)
-                        progress_callback(progress)
+            # Each size is resized once and encoded once, even where mipmap and
+            # drawable folders share it
+            generated = IconBundleGenerator().render(
+                input_path, manifest.targets, output_base_dir,
+                progress_callback=progress_callback,
+                cancel_token=cancel_token,
+                service='AndroidLogoGenerator.generate_icons'
+            )
             
-            return generated_paths
+            return {Path(relative).parent.name: path for relative, path in generated.items()}
             
+        except OperationCancelledError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Failed to generate Android icons: {str(e)}")
@@ -1,20 +1,87 @@
 from pathlib import Path
 from typing import Optional, Union, Tuple, Callable
-from rembg import remove, new_session
+from rembg import remove
 from PIL import Image
 import io
-from src.domain.interfaces.image_processor import ImageProcessor
+from src.domain.interfaces.image_processor import ImageProcessor, ImageSource
+from src.domain.models.cancellation import CancellationToken, raise_if_cancelled
+from src.infrastructure.image_services.image_codecs import apply_alpha, encode_image, load_image
+from src.infrastructure.image_services.model_manager import get_model_manager
+from src.infrastructure.monitoring.instrumentation import JobRecorder, instrument
 
 class BackgroundRemover(ImageProcessor):
-    def __init__(self):
-        self.session = new_session("u2net")  # Cache the model for better performance
+    def __init__(self, model_name: str = 'u2net'):
+        # The session is loaded (or preloaded at startup) by the shared model
+        # manager, so constructing the service is cheap and never blocks the GUI
+        self.model_name = model_name
+    
+    @property
+    def sessions(self):
+        """
+        Pool of rembg sessions for the model (see onnx_sessions.RembgSessionPool).
+        """
+        return get_model_manager().get(self.model_name)
+    
+    def remove_image(self,
+                     img: Image.Image,
+                     cancel_token: Optional[CancellationToken] = None,
+                     recorder: Optional[JobRecorder] = None,
+                     **kwargs) -> Image.Image:
+        """
+        Remove the background of an already decoded image.
+        
+        Args:
+            img: RGBA image. With alpha matting off, its alpha channel is
+                 replaced in place and the same image is returned
+            cancel_token: Optional token checked before inference
+            recorder: Optional recorder the model wait and inference are timed in
+            **kwargs: alpha_matting, foreground_threshold, background_threshold, erode_size
+        
+        Returns:
+            RGBA image with a transparent background
+        """
+        recorder = recorder or JobRecorder('BackgroundRemover.remove_image')
+        raise_if_cancelled(cancel_token)
+        
+        # Waits only if the model is still being preloaded
+        with recorder.stage('model_load'):
+            sessions = self.sessions
+        
+        # Apply background removal with additional options
+        with sessions.session() as session, recorder.stage('inference'):
+            if kwargs.get('alpha_matting', True):
+                return remove(
+                    img,
+                    session=session,
+                    alpha_matting=True,
+                    alpha_matting_foreground_threshold=kwargs.get('foreground_threshold', 240),
+                    alpha_matting_background_threshold=kwargs.get('background_threshold', 10),
+                    alpha_matting_erode_size=kwargs.get('erode_size', 10)
+                )
+            # Only the mask is needed; writing it into the decoded image's
+            # alpha channel avoids rembg's full-frame composite copies
+            mask = remove(img, session=session, only_mask=True)
+            return apply_alpha(img, mask)
     
     def process(self, 
                 input_path: Union[str, Path],
                 output_path: Optional[Union[str, Path]] = None,
                 size: Optional[Tuple[int, int]] = None,
+                *,
                 progress_callback: Optional[Callable[[int], None]] = None,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> str:
+        with instrument('BackgroundRemover.process') as recorder:
+            return self._process(input_path, output_path, size, progress_callback, cancel_token, recorder, **kwargs)
+    
+    def _process(self,
+                 input_path: Union[str, Path],
+                 output_path: Optional[Union[str, Path]],
+                 size: Optional[Tuple[int, int]],
+                 progress_callback: Optional[Callable[[int], None]],
+                 cancel_token: Optional[CancellationToken],
+                 recorder: JobRecorder,
+                 **kwargs) -> str:
         input_path = Path(input_path)
         if not input_path.exists():
             raise FileNotFoundError(f"Image file not found: {input_path}")
@@ -29,39 +96,73 @@ class BackgroundRemover(ImageProcessor):
         # Load and preprocess image
         with Image.open(input_path) as input_img:
             # Convert to RGBA if needed
-            if input_img.mode != 'RGBA':
-                input_img = input_img.convert('RGBA')
-            
-            if progress_callback:
-                progress_callback(30)  # Image preprocessing
-            
-            # Apply background removal with additional options
-            output_img = remove(
-                input_img,
-                session=self.session,
-                alpha_matting=kwargs.get('alpha_matting', True),
-                alpha_matting_foreground_threshold=kwargs.get('foreground_threshold', 240),
-                alpha_matting_background_threshold=kwargs.get('background_threshold', 10),
-                alpha_matting_erode_size=kwargs.get('erode_size', 10)
-            )
-            
-            if progress_callback:
-                progress_callback(80)  # Background removal complete
-            
-            # Post-process and save
-            if size:
-                output_img = output_img.resize(size, Image.Resampling.LANCZOS)
+            with recorder.stage('decode'):
+                input_img.load()
+                if input_img.mode != 'RGBA':
+                    input_img = input_img.convert('RGBA')
             
-            # Optimize output
-            with io.BytesIO() as bio:
-                output_img.save(bio, 
-                              format='PNG',
-                              optimize=True,
-                              quality=kwargs.get('quality', 95))
-                with open(output_path, 'wb') as f:
-                    f.write(bio.getvalue())
+            with self._remove_encoded(input_img, size, progress_callback, cancel_token, recorder, **kwargs) as bio:
+                with recorder.stage('write'), open(output_path, 'wb') as f:
+                    # getbuffer() exposes the encoded bytes without copying them
+                    f.write(bio.getbuffer())
+                recorder.count('bytes_written', bio.tell())
             
             if progress_callback:
                 progress_callback(100)
             
-            return str(output_path)
\ No newline at end of file
+            return str(output_path)
+    
+    def process_buffer(self,
+                       source: ImageSource,
+                       size: Optional[Tuple[int, int]] = None,
+                       *,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> bytes:
+        """
+        Remove the background of an in-memory image.
+        
+        Args:
+            source: Encoded image bytes, a binary file object or a PIL image
+            size: Optional output (width, height)
+            cancel_token: Optional token checked before and after inference
+            **kwargs: As for process(), plus format (default 'png'; formats
+                      without transparency are flattened onto white)
+        
+        Returns:
+            Encoded output image
+        """
+        with instrument('BackgroundRemover.process_buffer') as recorder:
+            with recorder.stage('decode'):
+                img = load_image(source, 'RGBA')
+            with self._remove_encoded(img, size, None, cancel_token, recorder, **kwargs) as bio:
+                return bio.getvalue()
+    
+    def _remove_encoded(self,
+                        img: Image.Image,
+                        size: Optional[Tuple[int, int]],
+                        progress_callback: Optional[Callable[[int], None]],
+                        cancel_token: Optional[CancellationToken],
+                        recorder: JobRecorder,
+                        **kwargs) -> io.BytesIO:
+        recorder.count('images')
+        recorder.count_pixels(*img.size)
+        
+        if progress_callback:
+            progress_callback(30)  # Image preprocessing
+        
+        raise_if_cancelled(cancel_token)
+        
+        output_img = self.remove_image(img, recorder=recorder, **kwargs)
+        
+        if progress_callback:
+            progress_callback(80)  # Background removal complete
+        
+        raise_if_cancelled(cancel_token)
+        
+        # Post-process and encode
+        if size:
+            with recorder.stage('resize'):
+                output_img = output_img.resize(size, Image.Resampling.LANCZOS)
+        
+        with recorder.stage('encode'):
+            return encode_image(output_img, kwargs.get('format', 'png'), kwargs.get('quality', 95))
\ No newline at end of file
@@ -0,0 +1,379 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+import io
+import json
+import logging
+import os
+
+from PIL import Image
+
+from src.domain.models.cancellation import CancellationToken, OperationCancelledError, raise_if_cancelled
+from src.domain.models.icon_manifest import IconManifest, IconTarget, Size
+from src.infrastructure.monitoring.instrumentation import JobRecorder, instrument
+
+logger = logging.getLogger(__name__)
+
+WINDOWS_ICO_SIZES = ((256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (24, 24), (16, 16))
+FAVICON_ICO_SIZES = ((48, 48), (32, 32), (16, 16))
+
+ANDROID_DENSITIES = {'mdpi': 48, 'hdpi': 72, 'xhdpi': 96, 'xxhdpi': 144, 'xxxhdpi': 192}
+
+# (point size, scale, idiom) entries of a classic Xcode AppIcon set
+IOS_APP_ICONS = [
+    (20, 2, 'iphone'), (20, 3, 'iphone'), (29, 2, 'iphone'), (29, 3, 'iphone'),
+    (40, 2, 'iphone'), (40, 3, 'iphone'), (60, 2, 'iphone'), (60, 3, 'iphone'),
+    (20, 1, 'ipad'), (20, 2, 'ipad'), (29, 1, 'ipad'), (29, 2, 'ipad'),
+    (40, 1, 'ipad'), (40, 2, 'ipad'), (76, 1, 'ipad'), (76, 2, 'ipad'),
+    (83.5, 2, 'ipad'), (1024, 1, 'ios-marketing')
+]
+
+WHITE = (255, 255, 255)
+
+
+def android_manifest(folders: Dict[str, Size],
+                     filename_for: Callable[[str], str] = lambda folder: 'ic_launcher.png',
+                     name: str = 'android') -> IconManifest:
+    """
+    Build an Android manifest from resource folders and their icon sizes.
+    
+    Args:
+        folders: Resource folder -> size, e.g. {'mipmap-mdpi': (48, 48)}
+        filename_for: Maps a folder to the icon file name inside it
+        name: Manifest name
+    """
+    return IconManifest(name, [IconTarget(f"{folder}/{filename_for(folder)}", size)
+                               for folder, size in folders.items()])
+
+
+def _ios_manifest() -> IconManifest:
+    targets = []
+    images = []
+    for points, scale, idiom in IOS_APP_ICONS:
+        pixels = int(points * scale)
+        label = f"{points:g}" + (f"@{scale}x" if scale > 1 else '')
+        filename = f"Icon-{label}.png"
+        if idiom == 'ipad':
+            filename = f"Icon-iPad-{label}.png"
+        targets.append(IconTarget(f"AppIcon.appiconset/{filename}", (pixels, pixels), background=WHITE))
+        images.append({'size': f"{points:g}x{points:g}", 'idiom': idiom,
+                       'filename': filename, 'scale': f"{scale}x"})
+    contents = json.dumps({'images': images, 'info': {'version': 1, 'author': 'xcode'}}, indent=2)
+    return IconManifest('ios', targets, {'AppIcon.appiconset/Contents.json': contents})
+
+
+def _favicon_manifest() -> IconManifest:
+    web_manifest = json.dumps({
+        'icons': [
+            {'src': 'android-chrome-192x192.png', 'sizes': '192x192', 'type': 'image/png'},
+            {'src': 'android-chrome-512x512.png', 'sizes': '512x512', 'type': 'image/png'}
+        ]
+    }, indent=2)
+    return IconManifest('favicon', [
+        IconTarget('favicon.ico', (48, 48), 'ico', FAVICON_ICO_SIZES),
+        IconTarget('favicon-16x16.png', (16, 16)),
+        IconTarget('favicon-32x32.png', (32, 32)),
+        IconTarget('favicon-96x96.png', (96, 96)),
+        IconTarget('android-chrome-192x192.png', (192, 192)),
+        IconTarget('android-chrome-512x512.png', (512, 512))
+    ], {'site.webmanifest': web_manifest})
+
+
+# iOS fills transparent pixels with black, so Apple touch icons are flattened
+APPLE_TOUCH_MANIFEST = IconManifest('apple_touch', [
+    IconTarget('apple-touch-icon.png', (180, 180), background=WHITE),
+    IconTarget('apple-touch-icon-167x167.png', (167, 167), background=WHITE),
+    IconTarget('apple-touch-icon-152x152.png', (152, 152), background=WHITE),
+    IconTarget('apple-touch-icon-120x120.png', (120, 120), background=WHITE)
+])
+
+MANIFESTS: Dict[str, IconManifest] = {
+    'android': android_manifest(
+        {**{f"mipmap-{d}": (s, s) for d, s in ANDROID_DENSITIES.items()}, 'playstore': (512, 512)},
+        lambda folder: 'ic_launcher-playstore.png' if folder == 'playstore' else 'ic_launcher.png'
+    ),
+    'ios': _ios_manifest(),
+    'windows': IconManifest('windows', [IconTarget('{stem}.ico', (256, 256), 'ico', WINDOWS_ICO_SIZES)]),
+    'favicon': _favicon_manifest(),
+    'apple_touch': APPLE_TOUCH_MANIFEST
+}
+
+# Shorthand names that expand to several manifests
+MANIFEST_GROUPS = {
+    'web': ['favicon', 'apple_touch'],
+    'all': ['android', 'ios', 'windows', 'favicon', 'apple_touch']
+}
+
+
+def resolve_manifests(manifests: Union[str, Iterable[Union[str, IconManifest]]]) -> List[IconManifest]:
+    """
+    Turn manifest names (or a comma-separated string of names) into manifests.
+    """
+    if isinstance(manifests, str):
+        manifests = [m.strip() for m in manifests.split(',') if m.strip()]
+    resolved = []
+    for manifest in manifests:
+        if isinstance(manifest, IconManifest):
+            resolved.append(manifest)
+        elif manifest in MANIFEST_GROUPS:
+            resolved.extend(MANIFESTS[name] for name in MANIFEST_GROUPS[manifest])
+        elif manifest in MANIFESTS:
+            resolved.append(MANIFESTS[manifest])
+        else:
+            known = sorted(list(MANIFESTS) + list(MANIFEST_GROUPS))
+            raise ValueError(f"Unknown icon manifest '{manifest}'. Choose from: {', '.join(known)}")
+    return resolved
+
+
+def build_size_pyramid(image: Image.Image,
+                       sizes: Iterable[Size],
+                       cancel_token: Optional[CancellationToken] = None) -> Dict[Size, Image.Image]:
+    """
+    Resize an image to several sizes, largest first, deriving each size from the
+    previous level instead of from the full-resolution source.
+    
+    Each step only reduces by a small factor, so the total LANCZOS work is close
+    to that of the largest size alone rather than one full-source pass per size.
+    Sizes larger than the source are upscaled from the source.
+    
+    Args:
+        image: Source image
+        sizes: Target (width, height) sizes; duplicates are computed once
+        cancel_token: Optional CancellationToken checked before each size
+    
+    Returns:
+        Mapping of size to resized image
+    """
+    levels: Dict[Size, Image.Image] = {}
+    previous = image
+    for size in sorted(set(sizes), key=lambda s: s[0] * s[1], reverse=True):
+        raise_if_cancelled(cancel_token)
+        if size == image.size:
+            levels[size] = image
+            continue
+        base = previous if previous.width >= size[0] and previous.height >= size[1] else image
+        levels[size] = base.resize(size, Image.Resampling.LANCZOS)
+        previous = levels[size]
+    return levels
+
+
+class IconBundleGenerator:
+    """
+    Generates icon files for any set of platform manifests in one pass.
+    
+    The source is decoded once and padded to a square, every distinct size is
+    resized once into a shared pyramid, targets with identical content are
+    encoded once, and the distinct encodes run in parallel.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the generator.
+        
+        Args:
+            max_workers: Parallel encoder threads. Defaults to min(8, CPU count)
+        """
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+    
+    def generate(self,
+                 input_path: Union[str, Path],
+                 output_dir: Optional[Union[str, Path]] = None,
+                 manifests: Union[str, Iterable[Union[str, IconManifest]]] = 'all',
+                 progress_callback: Optional[Callable[[int], None]] = None,
+                 cancel_token: Optional[CancellationToken] = None) -> Dict[str, str]:
+        """
+        Generate the icons of one or more manifests.
+        
+        Args:
+            input_path: Source image
+            output_dir: Bundle directory. Defaults to '<name>_icon_bundle' next to the input
+            manifests: Manifest names or IconManifest objects, e.g. ['android', 'ios'],
+                       'web' or 'all'
+            progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked before each size and encode
+        
+        Returns:
+            Mapping of output path (relative to the bundle directory) to absolute path
+        """
+        input_path = Path(input_path)
+        if output_dir is None:
+            output_dir = input_path.parent / f"{input_path.stem}_icon_bundle"
+        
+        targets: List[IconTarget] = []
+        files: Dict[str, str] = {}
+        for manifest in resolve_manifests(manifests):
+            targets.extend(manifest.targets)
+            files.update(manifest.files)
+        
+        return self.render(input_path, targets, output_dir, files, progress_callback, cancel_token)
+    
+    def render(self,
+               input_path: Union[str, Path],
+               targets: Sequence[IconTarget],
+               output_dir: Union[str, Path],
+               files: Optional[Dict[str, str]] = None,
+               progress_callback: Optional[Callable[[int], None]] = None,
+               cancel_token: Optional[CancellationToken] = None,
+               service: str = 'IconBundleGenerator.render') -> Dict[str, str]:
+        """
+        Generate an explicit list of icon targets.
+        
+        Args:
+            input_path: Source image
+            targets: Icon files to generate
+            output_dir: Directory relative target paths are resolved against
+            files: Extra text files to write (relative path -> content)
+            progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked before each size and encode
+            service: Name the run is recorded under in the performance metrics
+        
+        Returns:
+            Mapping of target path to absolute output path
+        """
+        input_path = Path(input_path)
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        
+        with instrument(service) as recorder:
+            with recorder.stage('decode'):
+                with Image.open(input_path) as img:
+                    source = img.convert('RGBA')
+            return self._render(source, targets, Path(output_dir), input_path.stem, files,
+                                progress_callback, cancel_token, recorder)
+    
+    def render_image(self,
+                     image: Image.Image,
+                     targets: Sequence[IconTarget],
+                     output_dir: Union[str, Path],
+                     stem: str = 'icon',
+                     files: Optional[Dict[str, str]] = None,
+                     progress_callback: Optional[Callable[[int], None]] = None,
+                     cancel_token: Optional[CancellationToken] = None,
+                     service: str = 'IconBundleGenerator.render_image') -> Dict[str, str]:
+        """
+        Generate icon targets from an already decoded image.
+        
+        Args:
+            image: Source image
+            stem: Replaces '{stem}' in target paths
+            (other arguments as for render())
+        
+        Returns:
+            Mapping of target path to absolute output path
+        """
+        with instrument(service) as recorder:
+            source = image if image.mode == 'RGBA' else image.convert('RGBA')
+            return self._render(source, targets, Path(output_dir), stem, files,
+                                progress_callback, cancel_token, recorder)
+    
+    def _render(self,
+                source: Image.Image,
+                targets: Sequence[IconTarget],
+                output_dir: Path,
+                stem: str,
+                files: Optional[Dict[str, str]],
+                progress_callback: Optional[Callable[[int], None]],
+                cancel_token: Optional[CancellationToken],
+                recorder: JobRecorder) -> Dict[str, str]:
+        groups: Dict[tuple, List[IconTarget]] = {}
+        for target in targets:
+            groups.setdefault(target.encode_key, []).append(target)
+        
+        written: Dict[str, str] = {}
+        try:
+            source = self._square(source)
+            recorder.count_pixels(*source.size)
+            
+            with recorder.stage('resize'):
+                levels = build_size_pyramid(
+                    source, {size for target in targets for size in target.sizes}, cancel_token
+                )
+            
+            with recorder.stage('encode_write'):
+                self._encode_groups(groups, levels, stem, output_dir,
+                                    written, progress_callback, cancel_token)
+                for relative, content in (files or {}).items():
+                    path = output_dir / relative
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(content, encoding='utf-8')
+                    written[relative] = str(path)
+            
+            recorder.count('icons', len(targets))
+            recorder.count('encodes', len(groups))
+            for path in written.values():
+                recorder.count_file(path)
+        except OperationCancelledError:
+            for path in written.values():
+                Path(path).unlink(missing_ok=True)
+            raise
+        
+        logger.info("Generated %d icon files (%d distinct encodes) for %s",
+                    len(written), len(groups), stem)
+        return written
+    
+    def _encode_groups(self,
+                       groups: Dict[tuple, List[IconTarget]],
+                       levels: Dict[Size, Image.Image],
+                       stem: str,
+                       output_dir: Path,
+                       written: Dict[str, str],
+                       progress_callback: Optional[Callable[[int], None]],
+                       cancel_token: Optional[CancellationToken]) -> None:
+        def encode(group: List[IconTarget]) -> List[str]:
+            raise_if_cancelled(cancel_token)
+            data = self._encode(group[0], levels)
+            paths = []
+            for target in group:
+                relative = target.path.format(stem=stem)
+                path = output_dir / relative
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+                written[relative] = str(path)
+                paths.append(str(path))
+            return paths
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(encode, group) for group in groups.values()]
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    if progress_callback:
+                        progress_callback(int(done / len(futures) * 100))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    @staticmethod
+    def _encode(target: IconTarget, levels: Dict[Size, Image.Image]) -> bytes:
+        images = [IconBundleGenerator._flatten(levels[size], target.background)
+                  for size in sorted(target.sizes, key=lambda s: s[0] * s[1], reverse=True)]
+        with io.BytesIO() as bio:
+            if target.format == 'ico':
+                # The largest size is the primary image; the others are embedded as-is
+                images[0].save(bio, format='ICO', sizes=[im.size for im in images],
+                               append_images=images[1:], optimize=True)
+            else:
+                images[0].save(bio, format='PNG', optimize=True)
+            return bio.getvalue()
+    
+    @staticmethod
+    def _flatten(image: Image.Image, background) -> Image.Image:
+        if background is None:
+            return image
+        flattened = Image.new('RGB', image.size, background)
+        flattened.paste(image, (0, 0), image)
+        return flattened
+    
+    @staticmethod
+    def _square(image: Image.Image) -> Image.Image:
+        """
+        Center a non-square source on a transparent square canvas so icons
+        keep the logo's aspect ratio.
+        """
+        if image.width == image.height:
+            return image
+        side = max(image.size)
+        canvas = Image.new('RGBA', (side, side), (0, 0, 0, 0))
+        canvas.paste(image, ((side - image.width) // 2, (side - image.height) // 2))
+        return canvas
@@ -0,0 +1,170 @@
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import io
+import logging
+import os
+import tempfile
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from src.infrastructure.image_services.image_codecs import IMAGE_FORMATS, encode_image
+
+logger = logging.getLogger(__name__)
+
+# Intermediates larger than this are backed by a temporary file instead of RAM.
+# Overridable with HIEL_MEMMAP_THRESHOLD_MB.
+DEFAULT_MEMMAP_THRESHOLD = 512 * 1024 * 1024
+
+# Suffixes OpenCV can encode straight from a BGR array
+_CV2_ENCODABLE = {'.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tif', '.tiff'}
+
+# PIL modes whose pixel layout Image.frombuffer can share without copying
+_SHARED_MODES = {'L': 1, 'RGBA': 4, 'RGBX': 4}
+
+
+def memmap_threshold() -> int:
+    """
+    Byte size above which allocate_image() uses a memory-mapped temporary file.
+    """
+    env_value = os.environ.get('HIEL_MEMMAP_THRESHOLD_MB')
+    if env_value:
+        return int(float(env_value) * 1024 * 1024)
+    return DEFAULT_MEMMAP_THRESHOLD
+
+
+def allocate_image(shape: Tuple[int, ...],
+                   dtype=np.uint8,
+                   threshold: Optional[int] = None) -> np.ndarray:
+    """
+    Allocate an uninitialized image array, memory-mapped when it is very large.
+
+    A 4x upscale of a 12 MP photo is over half a gigabyte; backing such
+    buffers with a temporary file lets the OS page them out instead of the
+    process running out of memory. The file is deleted as soon as the
+    array is released.
+
+    Args:
+        shape: Array shape, e.g. (height, width, 3)
+        dtype: Element type
+        threshold: Byte size above which the array is memory-mapped.
+                   Defaults to memmap_threshold()
+
+    Returns:
+        A numpy array (an np.memmap for large sizes)
+    """
+    threshold = memmap_threshold() if threshold is None else threshold
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    if nbytes <= threshold:
+        return np.empty(shape, dtype=dtype)
+
+    logger.debug("Memory-mapping %.0f MiB image buffer", nbytes / 2**20)
+    # The mapping keeps its own handle, so the file can be closed (and is
+    # removed) right away
+    with tempfile.TemporaryFile(prefix='hiel_buffer_') as fh:
+        return np.memmap(fh, dtype=dtype, mode='w+', shape=shape)
+
+
+def swap_red_blue(array: np.ndarray) -> np.ndarray:
+    """
+    Swap RGB <-> BGR (or RGBA <-> BGRA) in place and return the same array.
+    """
+    code = cv2.COLOR_RGBA2BGRA if array.shape[2] == 4 else cv2.COLOR_RGB2BGR
+    cv2.cvtColor(array, code, dst=array)
+    return array
+
+
+def read_bgr(path: Union[str, Path]) -> np.ndarray:
+    """
+    Decode an image file straight into an 8-bit BGR array.
+
+    OpenCV decodes directly into the layout its models expect, so no PIL
+    image, RGB copy or color conversion copy is made. Formats OpenCV cannot
+    read fall back to PIL, converted with one copy and an in-place swap.
+    EXIF orientation is ignored, as it is when PIL opens the file.
+    """
+    # np.fromfile + imdecode instead of imread so non-ASCII paths work on Windows
+    return decode_bgr(np.fromfile(str(path), dtype=np.uint8))
+
+
+def decode_bgr(data: Union[bytes, np.ndarray]) -> np.ndarray:
+    """
+    Decode encoded image bytes into an 8-bit BGR array (see read_bgr()).
+    """
+    buffer = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+    img = cv2.imdecode(buffer, cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+    if img is not None:
+        return img
+
+    with Image.open(io.BytesIO(buffer)) as pil_img:
+        if pil_img.mode != 'RGB':
+            pil_img = pil_img.convert('RGB')
+        return swap_red_blue(np.array(pil_img))
+
+
+def write_bgr(array: np.ndarray, path: Union[str, Path], quality: int = 95) -> int:
+    """
+    Encode a BGR array to a file without converting it back to a PIL image.
+
+    Formats OpenCV cannot write are handed to PIL after an in-place channel
+    swap, so the array's contents are RGB afterwards in that case.
+
+    Args:
+        array: 8-bit BGR image
+        path: Output path; the suffix selects the format
+        quality: JPEG/WebP quality (1-100)
+
+    Returns:
+        Number of bytes written
+    """
+    path = Path(path)
+    encoded = encode_bgr(array, path.suffix, quality)
+    with open(path, 'wb') as f:
+        f.write(encoded)
+    return encoded.nbytes
+
+
+def encode_bgr(array: np.ndarray, suffix: str, quality: int = 95) -> memoryview:
+    """
+    Encode a BGR array in memory (see write_bgr()).
+
+    Args:
+        array: 8-bit BGR image
+        suffix: Output format as a file extension, e.g. '.png'
+        quality: JPEG/WebP quality (1-100)
+
+    Returns:
+        The encoder's buffer, exposed without copying it to bytes
+    """
+    suffix = suffix.lower() if suffix.startswith('.') else f".{suffix.lower()}"
+    if suffix in _CV2_ENCODABLE:
+        params = []
+        if suffix in ('.jpg', '.jpeg'):
+            params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+        elif suffix == '.webp':
+            params = [cv2.IMWRITE_WEBP_QUALITY, quality]
+        ok, encoded = cv2.imencode(suffix, array, params)
+        if ok:
+            return encoded.data
+
+    image_format = IMAGE_FORMATS.get(suffix[1:])
+    if image_format is None:
+        raise ValueError(f"Unsupported image format: {suffix}")
+    return encode_image(array_to_pil(swap_red_blue(array), 'RGB'), image_format, quality).getbuffer()
+
+
+def array_to_pil(array: np.ndarray, mode: str) -> Image.Image:
+    """
+    Wrap an array as a PIL image, sharing its memory where PIL allows it.
+
+    L, RGBA and RGBX images share the array's buffer through Image.frombuffer,
+    so the array must outlive the image and must not be modified while the
+    image is in use. Other modes are copied once.
+    """
+    array = np.ascontiguousarray(array)
+    height, width = array.shape[:2]
+    if mode in _SHARED_MODES and (array.ndim == 2 or array.shape[2] == _SHARED_MODES[mode]):
+        return Image.frombuffer(mode, (width, height), array, 'raw', mode, 0, 1)
+    img = Image.fromarray(array)
+    return img if img.mode == mode else img.convert(mode)
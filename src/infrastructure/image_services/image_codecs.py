@@ -0,0 +1,70 @@
+import io
+
+from PIL import Image
+
+from src.domain.interfaces.image_processor import ImageSource
+from src.infrastructure.file_services.buffer_io import read_binary
+
+# Output format names accepted by the buffer-based methods -> PIL format
+IMAGE_FORMATS = {'png': 'PNG', 'jpg': 'JPEG', 'jpeg': 'JPEG', 'webp': 'WEBP', 'bmp': 'BMP', 'tiff': 'TIFF'}
+
+
+def load_image(source: ImageSource, mode: str = 'RGBA') -> Image.Image:
+    """
+    Decode an in-memory source into a PIL image of the given mode.
+
+    Args:
+        source: Encoded image bytes, a binary file object or a PIL image.
+                A PIL image is copied, so the caller's image is never modified
+        mode: PIL mode of the returned image
+
+    Returns:
+        Loaded image owned by the caller
+    """
+    if isinstance(source, Image.Image):
+        return source.convert(mode)  # Always a copy, even when the mode matches
+    img = Image.open(io.BytesIO(read_binary(source)))
+    img.load()
+    return img if img.mode == mode else img.convert(mode)
+
+
+def encode_image(img: Image.Image,
+                 image_format: str = 'PNG',
+                 quality: int = 95,
+                 optimize: bool = True) -> io.BytesIO:
+    """
+    Encode an image into a new in-memory stream, positioned at its end.
+
+    JPEG and BMP cannot store transparency, so RGBA images are flattened
+    onto white for them.
+
+    Args:
+        img: Image to encode
+        image_format: Format name, e.g. 'png' or 'JPEG'
+        quality: JPEG/WebP quality (1-100)
+        optimize: Let the encoder spend extra time on a smaller file
+    """
+    pil_format = IMAGE_FORMATS.get(image_format.lower(), image_format.upper())
+    if pil_format not in IMAGE_FORMATS.values():
+        raise ValueError(f"Unsupported image format '{image_format}'. Choose from: {', '.join(IMAGE_FORMATS)}")
+    if pil_format in ('JPEG', 'BMP') and img.mode in ('RGBA', 'LA', 'P'):
+        flattened = Image.new('RGB', img.size, (255, 255, 255))
+        rgba = img if img.mode == 'RGBA' else img.convert('RGBA')
+        flattened.paste(rgba, (0, 0), rgba)
+        img = flattened
+    bio = io.BytesIO()
+    img.save(bio, format=pil_format, quality=quality, optimize=optimize)
+    return bio
+
+
+def apply_alpha(img: Image.Image, mask: Image.Image) -> Image.Image:
+    """
+    Use a grayscale mask as an RGBA image's alpha channel, in place.
+
+    Cheaper than compositing onto a transparent canvas, which allocates two
+    more full-size RGBA frames.
+    """
+    if mask.size != img.size:
+        mask = mask.resize(img.size, Image.Resampling.LANCZOS)
+    img.putalpha(mask.convert('L') if mask.mode != 'L' else mask)
+    return img
@@ -0,0 +1,233 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+import logging
+import re
+
+from PIL import Image, ImageChops
+
+from src.domain.models.cancellation import CancellationToken, OperationCancelledError, raise_if_cancelled
+from src.domain.models.pipeline_step import PipelineStep
+from src.infrastructure.image_services.icon_bundle import IconBundleGenerator, resolve_manifests
+from src.infrastructure.image_services.image_codecs import encode_image
+from src.infrastructure.monitoring.instrumentation import JobRecorder, instrument
+
+logger = logging.getLogger(__name__)
+
+# Operations that change the image and pass it on to the next step
+TRANSFORMS = ['remove_background', 'trim', 'resize', 'upscale']
+# Operations that encode and write the current image
+OUTPUTS = ['save', 'icon_bundle']
+OPERATIONS = TRANSFORMS + OUTPUTS
+# Operations that run an ML model (scheduled on the model queue)
+MODEL_OPERATIONS = {'remove_background', 'upscale'}
+
+
+def parse_steps(text: str) -> List[PipelineStep]:
+    """
+    Parse a pipeline description.
+
+    Steps are separated by '>', parameters follow the operation after ':'
+    and are separated by ';', e.g.
+    'remove_background>trim:padding=8>resize:size=512x512>icon_bundle:manifests=android,ios'.
+    """
+    steps = []
+    for part in text.split('>'):
+        part = part.strip()
+        if not part:
+            continue
+        operation, _, arguments = part.partition(':')
+        params = {}
+        for argument in arguments.split(';'):
+            if not argument.strip():
+                continue
+            key, sep, value = argument.partition('=')
+            if not sep:
+                raise ValueError(f"Invalid parameter '{argument.strip()}' in step '{part}', expected KEY=VALUE")
+            params[key.strip()] = _parse_value(value.strip())
+        steps.append(PipelineStep(operation.strip(), params))
+    return steps
+
+
+def _parse_value(value: str):
+    lowered = value.lower()
+    if lowered in ('true', 'yes', 'on'):
+        return True
+    if lowered in ('false', 'no', 'off'):
+        return False
+    size = re.fullmatch(r'(\d+)x(\d+)', lowered)
+    if size:
+        return int(size.group(1)), int(size.group(2))
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def uses_model(steps: Iterable[PipelineStep]) -> bool:
+    return any(step.operation in MODEL_OPERATIONS for step in steps)
+
+
+class ImagePipeline:
+    """
+    Runs a chain of image operations on one decoded image.
+
+    The input is decoded once and every transform hands its result to the
+    next step in memory, so a chain such as remove background -> trim ->
+    resize -> icon bundle never writes or re-decodes an intermediate PNG.
+    Only output steps ('save', 'icon_bundle') encode and write files, and
+    they can appear anywhere in the chain to keep intermediate renditions.
+    """
+
+    def __init__(self):
+        # Services are created on first use so a pipeline without a model
+        # step never imports rembg
+        self._remover = None
+        self._resizer = None
+        self._upscaler = None
+        self._icons = IconBundleGenerator()
+
+    def run(self,
+            input_path: Union[str, Path],
+            output_path: Optional[Union[str, Path]] = None,
+            steps: Union[str, Sequence[PipelineStep]] = 'remove_background>trim',
+            progress_callback: Optional[Callable[[int], None]] = None,
+            cancel_token: Optional[CancellationToken] = None) -> Dict[str, str]:
+        """
+        Run the pipeline on one image.
+
+        Args:
+            input_path: Source image
+            output_path: Output directory. Defaults to '<name>_pipeline' next to the input
+            steps: PipelineStep list or a description for parse_steps(). A final
+                   PNG 'save' is added when no step writes output
+            progress_callback: Optional callback for progress updates (0-100)
+            cancel_token: Optional token checked between steps
+
+        Returns:
+            Mapping of output name to absolute output path
+        """
+        steps = parse_steps(steps) if isinstance(steps, str) else list(steps)
+        if not steps:
+            raise ValueError("The pipeline has no steps")
+        for step in steps:
+            if step.operation not in OPERATIONS:
+                raise ValueError(f"Unknown pipeline operation '{step.operation}'. "
+                                 f"Choose from: {', '.join(OPERATIONS)}")
+        if not any(step.operation in OUTPUTS for step in steps):
+            steps.append(PipelineStep('save'))
+
+        input_path = Path(input_path)
+        if not input_path.exists():
+            raise FileNotFoundError(f"Image file not found: {input_path}")
+        output_dir = Path(output_path) if output_path else input_path.parent / f"{input_path.stem}_pipeline"
+
+        outputs: Dict[str, str] = {}
+        with instrument('ImagePipeline.run') as recorder:
+            with recorder.stage('decode'):
+                with Image.open(input_path) as img:
+                    image = img.convert('RGBA')
+            recorder.count_pixels(*image.size)
+
+            try:
+                for index, step in enumerate(steps):
+                    raise_if_cancelled(cancel_token)
+                    with recorder.stage(step.operation):
+                        if step.operation in TRANSFORMS:
+                            image = getattr(self, f"_{step.operation}")(
+                                image, cancel_token, recorder, **step.params)
+                        else:
+                            outputs.update(getattr(self, f"_{step.operation}")(
+                                image, output_dir, input_path.stem, index, cancel_token, **step.params))
+                    if progress_callback:
+                        progress_callback(int((index + 1) * 100 / len(steps)))
+            except OperationCancelledError:
+                for path in outputs.values():
+                    Path(path).unlink(missing_ok=True)
+                raise
+
+            recorder.count('steps', len(steps))
+            for path in outputs.values():
+                recorder.count_file(path)
+
+        logger.info("Pipeline %s on %s wrote %d file(s)",
+                    ' > '.join(step.operation for step in steps), input_path, len(outputs))
+        return outputs
+
+    # Transforms: (image, cancel_token, recorder, **params) -> image
+
+    def _remove_background(self, image: Image.Image, cancel_token, recorder: JobRecorder, **params) -> Image.Image:
+        if self._remover is None:
+            from src.infrastructure.image_services.background_remover import BackgroundRemover
+            self._remover = BackgroundRemover()
+        return self._remover.remove_image(image, cancel_token, recorder, **params)
+
+    def _trim(self, image: Image.Image, cancel_token, recorder: JobRecorder,
+              padding: int = 0, threshold: int = 0) -> Image.Image:
+        """
+        Crop transparent borders, or uniform borders matching the top-left
+        pixel when the image has no transparency, then add `padding` pixels.
+        """
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')  # e.g. after an upscale of an opaque image
+        alpha = image.getchannel('A')
+        if alpha.getextrema()[0] < 255:
+            mask = alpha.point(lambda a: 255 if a > threshold else 0)
+        else:
+            background = Image.new('RGB', image.size, image.getpixel((0, 0))[:3])
+            difference = ImageChops.difference(image.convert('RGB'), background).convert('L')
+            mask = difference.point(lambda d: 255 if d > threshold else 0)
+        box = mask.getbbox()
+        if box is None:
+            return image  # Blank image; nothing to keep
+        cropped = image.crop(box)
+        if padding <= 0:
+            return cropped
+        canvas = Image.new('RGBA', (cropped.width + 2 * padding, cropped.height + 2 * padding), (0, 0, 0, 0))
+        canvas.paste(cropped, (padding, padding))
+        return canvas
+
+    def _resize(self, image: Image.Image, cancel_token, recorder: JobRecorder,
+                size=(512, 512), maintain_aspect: bool = True, resample: str = 'lanczos') -> Image.Image:
+        if isinstance(size, int):
+            size = (size, size)
+        if self._resizer is None:
+            from src.infrastructure.image_services.image_resizer import ImageResizer
+            self._resizer = ImageResizer()
+        return self._resizer.resize_image(image, tuple(size), maintain_aspect, resample)
+
+    def _upscale(self, image: Image.Image, cancel_token, recorder: JobRecorder,
+                 scale_factor: int = 2, tile_size: int = 512) -> Image.Image:
+        if self._upscaler is None:
+            from src.infrastructure.image_services.image_upscaler import ImageUpscaler
+            self._upscaler = ImageUpscaler()
+        alpha = image.getchannel('A') if image.mode == 'RGBA' else None
+        upscaled = self._upscaler.upscale_image(image, scale_factor, tile_size, cancel_token, recorder)
+        if alpha is not None and alpha.getextrema()[0] < 255:
+            # The model only sees RGB; carry transparency over at the new size
+            upscaled.putalpha(alpha.resize(upscaled.size, Image.Resampling.LANCZOS))
+        return upscaled
+
+    # Outputs: (image, output_dir, stem, index, cancel_token, **params) -> {name: path}
+
+    def _save(self, image: Image.Image, output_dir: Path, stem: str, index: int, cancel_token,
+              name: Optional[str] = None, format: str = 'png', quality: int = 95) -> Dict[str, str]:
+        path = output_dir / (name or f"{stem}.{str(format).lower()}")
+        encoded = encode_image(image, str(format), quality)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(encoded.getbuffer())
+        return {path.name: str(path)}
+
+    def _icon_bundle(self, image: Image.Image, output_dir: Path, stem: str, index: int, cancel_token,
+                     manifests='all', folder: str = 'icons') -> Dict[str, str]:
+        if isinstance(manifests, (list, tuple)):
+            manifests = ','.join(manifests)
+        targets = []
+        files: Dict[str, str] = {}
+        for manifest in resolve_manifests(manifests):
+            targets.extend(manifest.targets)
+            files.update(manifest.files)
+        written = self._icons.render_image(image, targets, output_dir / folder, stem, files,
+                                           cancel_token=cancel_token)
+        return {f"{folder}/{relative}": path for relative, path in written.items()}
@@ -2,8 +2,11 @@ from pathlib import Path
 from typing import Optional, Union, Tuple, Dict, Callable
 from PIL import Image
 import io
-from concurrent.futures import ThreadPoolExecutor
-from src.domain.interfaces.image_processor import ImageProcessor
+from src.domain.interfaces.image_processor import ImageProcessor, ImageSource
+from src.domain.models.cancellation import CancellationToken, raise_if_cancelled
+from src.infrastructure.image_services.icon_bundle import IconBundleGenerator, android_manifest
+from src.infrastructure.image_services.image_codecs import encode_image, load_image
+from src.infrastructure.monitoring.instrumentation import JobRecorder, instrument
 
 class ImageResizer(ImageProcessor):
     ANDROID_ICON_SIZES = {
@@ -19,8 +22,23 @@ class ImageResizer(ImageProcessor):
                 input_path: Union[str, Path],
                 output_path: Optional[Union[str, Path]] = None,
                 size: Optional[Tuple[int, int]] = None,
+                *,
                 progress_callback: Optional[Callable[[int], None]] = None,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> Union[str, Dict[str, str]]:
+        if kwargs.get('android_mode', False):
+            return self._create_android_icons(Path(input_path), progress_callback, cancel_token)
+        with instrument('ImageResizer.process') as recorder:
+            return self._process(input_path, output_path, size, progress_callback, cancel_token, recorder, **kwargs)
+    
+    def _process(self,
+                 input_path: Union[str, Path],
+                 output_path: Optional[Union[str, Path]],
+                 size: Optional[Tuple[int, int]],
+                 progress_callback: Optional[Callable[[int], None]],
+                 cancel_token: Optional[CancellationToken],
+                 recorder: JobRecorder,
+                 **kwargs) -> Union[str, Dict[str, str]]:
         input_path = Path(input_path)
         if not input_path.exists():
             raise FileNotFoundError(f"Image file not found: {input_path}")
@@ -29,36 +47,90 @@ class ImageResizer(ImageProcessor):
         with Image.open(input_path) as img:
             # Convert color mode based on requirements
             color_mode = kwargs.get('color_mode', 'RGBA')
-            if img.mode != color_mode:
-                img = img.convert(color_mode)
-            
-            # Apply optimizations
-            quality = kwargs.get('quality', 95)
-            optimize = kwargs.get('optimize', True)
+            with recorder.stage('decode'):
+                img.load()
+                if img.mode != color_mode:
+                    img = img.convert(color_mode)
+            recorder.count('images')
+            recorder.count_pixels(*img.size)
             
-            if kwargs.get('android_mode', False):
-                return self._create_android_icons(
-                    img, input_path, progress_callback, quality, optimize
-                )
-            
-            if size is None:
-                raise ValueError("Size must be specified for regular resizing")
-            
-            maintain_aspect = kwargs.get('maintain_aspect', True)
-            resample = self._get_resample_mode(kwargs.get('resample', 'lanczos'))
-            resized_img = self._resize_image(img, size, maintain_aspect, resample)
+            resized = self._resize_encoded(img, size, cancel_token, recorder, **kwargs)
             
             if output_path is None:
                 output_path = input_path.parent / f"{input_path.stem}_resized{input_path.suffix}"
             output_path = Path(output_path)
             
-            # Save with optimizations
-            self._save_optimized(resized_img, output_path, quality, optimize, color_mode)
+            with recorder.stage('write'), open(output_path, 'wb') as f:
+                f.write(resized.getbuffer())
+            recorder.count_file(output_path)
             if progress_callback:
                 progress_callback(100)
                 
             return str(output_path)
     
+    def process_buffer(self,
+                       source: ImageSource,
+                       size: Optional[Tuple[int, int]] = None,
+                       *,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> bytes:
+        """
+        Resize an in-memory image.
+        
+        Args:
+            source: Encoded image bytes, a binary file object or a PIL image
+            size: Target (width, height)
+            cancel_token: Optional token checked after resizing
+            **kwargs: As for process() (android_mode is not supported, as it
+                      produces several files), plus format. Without format,
+                      RGBA images are encoded as PNG and others as JPEG
+        
+        Returns:
+            Encoded output image
+        """
+        if kwargs.get('android_mode', False):
+            raise ValueError("Android mode writes several files; use process() or IconBundleGenerator")
+        with instrument('ImageResizer.process_buffer') as recorder:
+            with recorder.stage('decode'):
+                img = load_image(source, kwargs.get('color_mode', 'RGBA'))
+            recorder.count('images')
+            recorder.count_pixels(*img.size)
+            return self._resize_encoded(img, size, cancel_token, recorder, **kwargs).getvalue()
+    
+    def _resize_encoded(self,
+                        img: Image.Image,
+                        size: Optional[Tuple[int, int]],
+                        cancel_token: Optional[CancellationToken],
+                        recorder: JobRecorder,
+                        **kwargs) -> io.BytesIO:
+        if size is None:
+            raise ValueError("Size must be specified for regular resizing")
+        
+        maintain_aspect = kwargs.get('maintain_aspect', True)
+        resample = self._get_resample_mode(kwargs.get('resample', 'lanczos'))
+        with recorder.stage('resize'):
+            resized_img = self._resize_image(img, size, maintain_aspect, resample)
+        raise_if_cancelled(cancel_token)
+        
+        # Encode with optimizations
+        color_mode = kwargs.get('color_mode', 'RGBA')
+        image_format = kwargs.get('format') or ('png' if color_mode == 'RGBA' else 'jpeg')
+        with recorder.stage('encode'):
+            return encode_image(resized_img, image_format, kwargs.get('quality', 95), kwargs.get('optimize', True))
+    
+    def resize_image(self,
+                     img: Image.Image,
+                     size: Tuple[int, int],
+                     maintain_aspect: bool = True,
+                     resample: str = 'lanczos') -> Image.Image:
+        """
+        Resize an already decoded image.
+        
+        With maintain_aspect the image is shrunk in place to fit within size
+        (and returned); otherwise a new image of exactly size is returned.
+        """
+        return self._resize_image(img, size, maintain_aspect, self._get_resample_mode(resample))
+    
     def _resize_image(self, 
                      img: Image.Image, 
                      size: Tuple[int, int], 
@@ -80,53 +152,20 @@ class ImageResizer(ImageProcessor):
         }
         return modes.get(mode.lower(), Image.Resampling.LANCZOS)
     
-    def _save_optimized(self, 
-                       img: Image.Image, 
-                       output_path: Path,
-                       quality: int = 95,
-                       optimize: bool = True,
-                       color_mode: str = 'RGBA') -> None:
-        # Use BytesIO for memory efficiency
-        with io.BytesIO() as bio:
-            img.save(bio, 
-                    format='PNG' if color_mode == 'RGBA' else 'JPEG',
-                    quality=quality,
-                    optimize=optimize)
-            with open(output_path, 'wb') as f:
-                f.write(bio.getvalue())
-    
     def _create_android_icons(self, 
-                            img: Image.Image, 
                             input_path: Path,
                             progress_callback: Optional[Callable[[int], None]] = None,
-                            quality: int = 95,
-                            optimize: bool = True) -> Dict[str, str]:
-        output_paths = {}
+                            cancel_token: Optional[CancellationToken] = None) -> Dict[str, str]:
+        if not input_path.exists():
+            raise FileNotFoundError(f"Image file not found: {input_path}")
         base_dir = input_path.parent / f"{input_path.stem}_android_icons"
-        base_dir.mkdir(exist_ok=True)
-        
-        total_icons = len(self.ANDROID_ICON_SIZES)
-        completed = 0
-        
-        def process_icon(args):
-            density, size = args
-            density_dir = base_dir / density
-            density_dir.mkdir(exist_ok=True)
-            
-            resized = self._resize_image(img.copy(), size)
-            output_path = density_dir / f"ic_launcher.png"
-            self._save_optimized(resized, output_path, quality, optimize)
-            
-            nonlocal completed
-            completed += 1
-            if progress_callback:
-                progress_callback(int((completed / total_icons) * 100))
-            
-            return density, str(output_path)
-        
-        # Process icons in parallel
-        with ThreadPoolExecutor() as executor:
-            results = executor.map(process_icon, self.ANDROID_ICON_SIZES.items())
-            output_paths = dict(results)
         
-        return output_paths
\ No newline at end of file
+        # The shared icon engine decodes once, resizes each size once and
+        # removes what it wrote if the job is cancelled
+        generated = IconBundleGenerator().render(
+            input_path, android_manifest(self.ANDROID_ICON_SIZES).targets, base_dir,
+            progress_callback=progress_callback,
+            cancel_token=cancel_token,
+            service='ImageResizer.android_icons'
+        )
+        return {Path(relative).parent.name: path for relative, path in generated.items()}
@@ -1,15 +1,21 @@
 from pathlib import Path
 from typing import Optional, Union, Tuple
-import cv2
 import numpy as np
 from PIL import Image
-from src.domain.interfaces.image_processor import ImageProcessor
+from src.domain.interfaces.image_processor import ImageProcessor, ImageSource
+from src.domain.models.cancellation import CancellationToken, raise_if_cancelled
+from src.infrastructure.file_services.buffer_io import read_binary
+from src.infrastructure.image_services.image_buffers import allocate_image, decode_bgr, encode_bgr, read_bgr, swap_red_blue, write_bgr
+from src.infrastructure.image_services.model_manager import get_model_manager
+from src.infrastructure.monitoring.instrumentation import JobRecorder, instrument
 
 class ImageUpscaler(ImageProcessor):
     def process(self, 
                 input_path: Union[str, Path],
                 output_path: Optional[Union[str, Path]] = None,
                 size: Optional[Tuple[int, int]] = None,
+                *,
+                cancel_token: Optional[CancellationToken] = None,
                 **kwargs) -> str:
         """
         Upscale an image using super-resolution.
@@ -18,49 +24,178 @@ class ImageUpscaler(ImageProcessor):
             input_path: Path to the input image
             output_path: Optional output image path
             size: Not used (scale factor is used instead)
+            cancel_token: Optional token checked between tiles
             **kwargs: Additional parameters including:
                      - scale_factor: Upscaling factor (2 or 4)
+                     - tile_size: Tile edge in source pixels (default 512)
+                     - quality: JPEG/WebP output quality (default 95)
         
         Returns:
             Path to the processed image
         """
+        with instrument('ImageUpscaler.process') as recorder:
+            return self._process(input_path, output_path, cancel_token, recorder, **kwargs)
+    
+    def _process(self,
+                 input_path: Union[str, Path],
+                 output_path: Optional[Union[str, Path]],
+                 cancel_token: Optional[CancellationToken],
+                 recorder: JobRecorder,
+                 **kwargs) -> str:
         input_path = Path(input_path)
         if not input_path.exists():
             raise FileNotFoundError(f"Image file not found: {input_path}")
         
-        # Get scale factor
         scale_factor = kwargs.get('scale_factor', 2)
-        if scale_factor not in [2, 4]:
-            raise ValueError("Scale factor must be 2 or 4")
+        self._check_scale(scale_factor)
         
         # Create output path if not specified
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_upscaled{input_path.suffix}"
         output_path = Path(output_path)
         
-        # Load image with PIL and convert to RGB
-        pil_img = Image.open(input_path)
-        if pil_img.mode != 'RGB':
-            pil_img = pil_img.convert('RGB')
+        # Decode straight into the BGR layout the model takes
+        with recorder.stage('decode'):
+            img = read_bgr(input_path)
+        recorder.count('images')
+        recorder.count_pixels(img.shape[1], img.shape[0])
+        
+        upscaled = self._upscale_bgr(img, scale_factor, kwargs.get('tile_size', 512), cancel_token, recorder)
+        
+        # Encode the BGR result directly, without a round trip through PIL
+        with recorder.stage('encode_write'):
+            write_bgr(upscaled, output_path, kwargs.get('quality', 95))
+        recorder.count_file(output_path)
+        
+        return str(output_path)
+    
+    def process_buffer(self,
+                       source: ImageSource,
+                       size: Optional[Tuple[int, int]] = None,
+                       *,
+                       cancel_token: Optional[CancellationToken] = None,
+                       **kwargs) -> bytes:
+        """
+        Upscale an in-memory image.
+        
+        Args:
+            source: Encoded image bytes, a binary file object or a PIL image
+            size: Not used (scale factor is used instead)
+            cancel_token: Optional token checked between tiles
+            **kwargs: As for process(), plus format (default 'png')
         
-        # Convert to OpenCV format
-        img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+        Returns:
+            Encoded output image
+        """
+        scale_factor = kwargs.get('scale_factor', 2)
+        self._check_scale(scale_factor)
         
-        # Create super resolution model
-        if scale_factor == 2:
-            sr = cv2.dnn_superres.DnnSuperResImpl_create()
-            sr.readModel("models/EDSR_x2.pb")
-            sr.setModel("edsr", 2)
-        else:  # scale_factor == 4
-            sr = cv2.dnn_superres.DnnSuperResImpl_create()
-            sr.readModel("models/EDSR_x4.pb")
-            sr.setModel("edsr", 4)
+        with instrument('ImageUpscaler.process_buffer') as recorder:
+            with recorder.stage('decode'):
+                if isinstance(source, Image.Image):
+                    img = swap_red_blue(np.array(source.convert('RGB')))
+                else:
+                    img = decode_bgr(read_binary(source))
+            recorder.count('images')
+            recorder.count_pixels(img.shape[1], img.shape[0])
+            
+            upscaled = self._upscale_bgr(img, scale_factor, kwargs.get('tile_size', 512), cancel_token, recorder)
+            
+            with recorder.stage('encode'):
+                return bytes(encode_bgr(upscaled, kwargs.get('format', 'png'), kwargs.get('quality', 95)))
+    
+    def upscale_image(self,
+                      img: Image.Image,
+                      scale_factor: int = 2,
+                      tile_size: int = 512,
+                      cancel_token: Optional[CancellationToken] = None,
+                      recorder: Optional[JobRecorder] = None) -> Image.Image:
+        """
+        Upscale an already decoded image.
         
-        # Upscale image
-        upscaled = sr.upsample(img)
+        Args:
+            img: Source image; alpha is dropped
+            scale_factor: Upscaling factor (2 or 4)
+            tile_size: Tile edge in source pixels
+            cancel_token: Optional token checked between tiles
+            recorder: Optional recorder the model wait and inference are timed in
+        
+        Returns:
+            Upscaled RGB image
+        """
+        self._check_scale(scale_factor)
+        recorder = recorder or JobRecorder('ImageUpscaler.upscale_image')
+        bgr = swap_red_blue(np.array(img.convert('RGB') if img.mode != 'RGB' else img))
+        upscaled = self._upscale_bgr(bgr, scale_factor, tile_size, cancel_token, recorder)
+        return Image.fromarray(swap_red_blue(upscaled))
+    
+    @staticmethod
+    def _check_scale(scale_factor: int) -> None:
+        if scale_factor not in [2, 4]:
+            raise ValueError("Scale factor must be 2 or 4")
+    
+    def _upscale_bgr(self,
+                     img: np.ndarray,
+                     scale_factor: int,
+                     tile_size: int,
+                     cancel_token: Optional[CancellationToken],
+                     recorder: JobRecorder) -> np.ndarray:
+        # The EDSR model is loaded once per process and shared; this only
+        # waits if it is still being preloaded
+        models = get_model_manager()
+        with recorder.stage('model_load'):
+            models.get(f"edsr_x{scale_factor}")
+        
+        # Upscale image tile by tile
+        with models.use(f"edsr_x{scale_factor}") as sr, recorder.stage('inference'):
+            upscaled = self._upsample_tiled(sr, img, scale_factor, tile_size, cancel_token)
+        raise_if_cancelled(cancel_token)
+        return upscaled
+    
+    def _upsample_tiled(self,
+                        sr,
+                        img: np.ndarray,
+                        scale: int,
+                        tile_size: int = 512,
+                        cancel_token: Optional[CancellationToken] = None,
+                        pad: int = 16) -> np.ndarray:
+        """
+        Upsample an image in overlapping tiles.
+        
+        Each tile is padded with neighbouring pixels so the model sees context
+        across tile borders; only the unpadded centre is kept. Tiling bounds the
+        model's working memory and gives a cancellation point between tiles.
+        The output buffer is memory-mapped when it is very large.
+        
+        Args:
+            sr: Configured DnnSuperResImpl instance
+            img: BGR source image
+            scale: Upscaling factor
+            tile_size: Tile edge in source pixels
+            cancel_token: Optional token checked before each tile
+            pad: Context pixels added around each tile
+        
+        Returns:
+            Upscaled BGR image
+        """
+        height, width = img.shape[:2]
+        if height <= tile_size and width <= tile_size:
+            raise_if_cancelled(cancel_token)
+            return sr.upsample(img)
         
-        # Convert back to PIL and save
-        upscaled_rgb = cv2.cvtColor(upscaled, cv2.COLOR_BGR2RGB)
-        Image.fromarray(upscaled_rgb).save(output_path)
+        output = allocate_image((height * scale, width * scale, img.shape[2]), img.dtype)
+        for y in range(0, height, tile_size):
+            for x in range(0, width, tile_size):
+                raise_if_cancelled(cancel_token)
+                
+                y0, x0 = max(0, y - pad), max(0, x - pad)
+                y1, x1 = min(height, y + tile_size + pad), min(width, x + tile_size + pad)
+                tile = sr.upsample(img[y0:y1, x0:x1])
+                
+                tile_h = (min(y + tile_size, height) - y) * scale
+                tile_w = (min(x + tile_size, width) - x) * scale
+                top, left = (y - y0) * scale, (x - x0) * scale
+                output[y * scale:y * scale + tile_h, x * scale:x * scale + tile_w] = \
+                    tile[top:top + tile_h, left:left + tile_w]
         
-        return str(output_path) 
\ No newline at end of file
+        return output
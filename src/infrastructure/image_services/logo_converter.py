@@ -1,15 +1,15 @@
 import logging
-import os
 from pathlib import Path
-from PIL import Image
-import sys
+from typing import Dict, Optional, Sequence, Tuple
+
+from src.domain.models.cancellation import OperationCancelledError
+from src.domain.models.icon_manifest import IconTarget
+from src.infrastructure.image_services.icon_bundle import (
+    FAVICON_ICO_SIZES, WINDOWS_ICO_SIZES, IconBundleGenerator, resolve_manifests
+)
+
+logger = logging.getLogger(__name__)
 
-# Configure logging with absolute path
-log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'logo_converter_debug.log')
-logging.basicConfig(level=logging.DEBUG, 
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    filename=log_path,
-                    filemode='w')
 
 class LogoConverter:
     """
@@ -18,106 +18,106 @@ class LogoConverter:
     Supports:
     - Converting PNG to multi-size ICO for Windows and Web
     - Specific icon sizes for different use cases
+    - Web favicon and Apple touch icon sets generated from a single decode
     """
     
+    # Windows icon sizes (largest first) followed by favicon sizes
+    ICO_SIZES = list(WINDOWS_ICO_SIZES)
+    
+    FAVICON_ICO_SIZES = list(FAVICON_ICO_SIZES)
+    
+    # Bundle target -> icon bundle manifest
+    BUNDLE_TARGETS = {'ico': 'windows', 'favicon': 'favicon', 'apple_touch': 'apple_touch'}
+    
     @staticmethod
-    def convert_logo(input_path, output_path=None):
+    def convert_logo(input_path, output_path=None, cancel_token=None, sizes: Optional[Sequence[Tuple[int, int]]] = None):
         """
         Convert PNG to ICO with specific Windows and Favicon sizes.
         
         Args:
             input_path: Path to the input PNG file
             output_path: Optional output ICO path
+            cancel_token: Optional CancellationToken checked before each size
+            sizes: Optional icon sizes. Defaults to ICO_SIZES
         
         Raises:
             ValueError: If input is not a PNG
             FileNotFoundError: If input file does not exist
         """
-        input_path = Path(input_path)
-        if not input_path.exists():
-            logging.error(f"Input file not found: {input_path}")
-            print(f"ERROR: Input file not found: {input_path}", file=sys.stderr)
-            raise FileNotFoundError(f"Logo file not found: {input_path}")
-        
-        # Validate input is PNG
-        if input_path.suffix.lower() != '.png':
-            logging.error(f"Invalid input format: {input_path.suffix}")
-            print(f"ERROR: Invalid input format: {input_path.suffix}", file=sys.stderr)
-            raise ValueError("Input must be a PNG file")
+        input_path = LogoConverter._validate_input(input_path)
         
         # Determine output path
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_icon.ico"
         output_path = Path(output_path)
         
+        icon_sizes = tuple(sizes or LogoConverter.ICO_SIZES)
+        target = IconTarget(str(output_path.absolute()), max(icon_sizes), 'ico', icon_sizes)
+        
         try:
-            # Open the image and prepare for conversion
-            with Image.open(input_path) as logo:
-                logging.info(f"Original image size: {logo.size}")
-                print(f"Original image size: {logo.size}")
-                logging.info(f"Original image mode: {logo.mode}")
-                print(f"Original image mode: {logo.mode}")
-                
-                # Convert to RGBA to handle transparency
-                logo = logo.convert('RGBA')
-                
-                # Specific icon sizes for Windows and Favicon
-                # Prioritize larger sizes, especially for Windows
-                icon_sizes = [
-                    # Windows icon sizes (largest first)
-                    (256, 256),  # Very high DPI Windows icon
-                    (128, 128),  # High DPI Windows icon
-                    (64, 64),    # Large Windows icon
-                    (48, 48),    # Standard Windows icon
-                    
-                    # Favicon sizes
-                    (32, 32),    # Standard favicon
-                    (24, 24),    # Small favicon
-                    (16, 16)     # Smallest favicon
-                ]
-                
-                # Prepare icon images
-                icon_images = []
-                for width, height in icon_sizes:
-                    logging.debug(f"Processing icon size: {width}x{height}")
-                    print(f"Processing icon size: {width}x{height}")
-                    
-                    # Create a new image with transparent background
-                    icon = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-                    
-                    # Resize and center the logo
-                    resized_logo = logo.copy()
-                    
-                    # Use resize instead of thumbnail to ensure exact size
-                    resized_logo = resized_logo.resize((width, height), Image.LANCZOS)
-                    logging.debug(f"Resized logo size: {resized_logo.size}")
-                    print(f"Resized logo size: {resized_logo.size}")
-                    
-                    # Paste the resized logo onto the transparent icon
-                    icon.paste(resized_logo, (0, 0), resized_logo)
-                    icon_images.append(icon)
-                
-                logging.info(f"Total icon images generated: {len(icon_images)}")
-                print(f"Total icon images generated: {len(icon_images)}")
-                logging.info(f"Icon sizes: {[im.size for im in icon_images]}")
-                print(f"Icon sizes: {[im.size for im in icon_images]}")
-                
-                # Save multi-size ICO
-                # Ensure the largest size (256x256) is the primary image
-                icon_images[0].save(
-                    output_path,
-                    format='ICO',
-                    sizes=[(im.width, im.height) for im in icon_images],
-                    append_images=icon_images[1:],
-                    optimize=True
-                )
-                
-                logging.info(f"ICO file saved: {output_path}")
-                print(f"ICO file saved: {output_path}")
-            
+            IconBundleGenerator().render(input_path, [target], output_path.parent,
+                                         cancel_token=cancel_token, service='LogoConverter.convert_logo')
+            logger.info("ICO file saved: %s", output_path)
             return str(output_path)
         
+        except OperationCancelledError:
+            logger.info("Logo conversion cancelled")
+            raise
         except Exception as e:
-            logging.error(f"Logo conversion failed: {e}", exc_info=True)
-            print(f"Logo conversion failed: {e}", file=sys.stderr)
+            logger.error("Logo conversion failed: %s", e, exc_info=True)
             raise RuntimeError(f"Logo conversion failed: {e}")
+    
+    @staticmethod
+    def convert_logo_bundle(input_path,
+                            output_dir=None,
+                            cancel_token=None,
+                            targets: Sequence[str] = tuple(BUNDLE_TARGETS)) -> Dict[str, str]:
+        """
+        Generate an application ICO, a web favicon set and Apple touch icons
+        from one decode of the source PNG.
+        
+        Args:
+            input_path: Path to the input PNG file
+            output_dir: Optional output directory. Defaults to '<name>_icons'
+                        next to the input
+            cancel_token: Optional CancellationToken checked before each size
+            targets: Any of 'ico' (app ICO), 'favicon' (favicon.ico, PNGs and a
+                     web app manifest) and 'apple_touch' (opaque PNGs), or any
+                     other icon bundle manifest name such as 'android' or 'ios'
+        
+        Returns:
+            Mapping of output file name to path
+        """
+        input_path = LogoConverter._validate_input(input_path)
+        if isinstance(targets, str):
+            targets = [t.strip() for t in targets.split(',') if t.strip()]
+        manifests = resolve_manifests([LogoConverter.BUNDLE_TARGETS.get(t, t) for t in targets])
+        
+        if output_dir is None:
+            output_dir = input_path.parent / f"{input_path.stem}_icons"
+        
+        try:
+            outputs = IconBundleGenerator().generate(input_path, output_dir, manifests,
+                                                     cancel_token=cancel_token)
+            logger.info("Icon bundle saved: %s (%d files)", output_dir, len(outputs))
+            return outputs
+        
+        except OperationCancelledError:
+            logger.info("Icon bundle generation cancelled")
+            raise
+        except Exception as e:
+            logger.error("Icon bundle generation failed: %s", e, exc_info=True)
+            raise RuntimeError(f"Icon bundle generation failed: {e}")
+    
+    @staticmethod
+    def _validate_input(input_path) -> Path:
+        input_path = Path(input_path)
+        if not input_path.exists():
+            logger.error("Input file not found: %s", input_path)
+            raise FileNotFoundError(f"Logo file not found: {input_path}")
+        
+        # Validate input is PNG
+        if input_path.suffix.lower() != '.png':
+            logger.error("Invalid input format: %s", input_path.suffix)
+            raise ValueError("Input must be a PNG file")
+        return input_path
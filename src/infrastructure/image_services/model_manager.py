@@ -0,0 +1,271 @@
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+import logging
+import os
+import threading
+import time
+
+from src.domain.models.model_status import ModelState, ModelStatus
+
+logger = logging.getLogger(__name__)
+
+# Models loaded in the background at startup, overridable with HIEL_PRELOAD_MODELS
+# (comma-separated names, or 'none')
+DEFAULT_PRELOAD = ('u2net', 'edsr_x2', 'edsr_x4')
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """
+    How to load and warm up one model.
+
+    Attributes:
+        name: Model name used by the services
+        description: Human-readable name for the UI
+        load: Creates the model object
+        warm_up: Runs a small dummy inference so lazy initialization (graph
+                 optimization, memory arenas, kernel selection) happens before
+                 the first real request
+        requires: Model file that must exist, relative to the working directory
+        thread_safe: Whether concurrent inferences on the shared object are safe;
+                     if not, use() serializes them
+    """
+    name: str
+    description: str
+    load: Callable[[], Any]
+    warm_up: Optional[Callable[[Any], None]] = None
+    requires: Optional[str] = None
+    thread_safe: bool = True
+
+
+class _Entry:
+    def __init__(self, spec: ModelSpec):
+        self.spec = spec
+        self.future: Optional[Future] = None
+        self.lock = threading.Lock()
+        self.status = ModelStatus(spec.name, spec.description, ModelState.NOT_LOADED)
+
+
+class ModelManager:
+    """
+    Loads ML models once per process and shares them between callers.
+
+    Models can be preloaded on a background thread after startup. A caller
+    that needs a model still being preloaded waits for that load instead of
+    starting a second one; a caller that needs a model nobody has started
+    loads it on its own thread.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[ModelStatus], None]] = []
+
+    def register(self, spec: ModelSpec) -> None:
+        with self._lock:
+            self._entries[spec.name] = _Entry(spec)
+
+    def add_listener(self, callback: Callable[[ModelStatus], None]) -> None:
+        """
+        Call `callback` with the new status whenever a model changes state.
+        Called from the loading thread.
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[ModelStatus], None]) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def statuses(self) -> List[ModelStatus]:
+        with self._lock:
+            return [entry.status for entry in self._entries.values()]
+
+    def status(self, name: str) -> ModelStatus:
+        return self._entry(name).status
+
+    def get(self, name: str, timeout: Optional[float] = None) -> Any:
+        """
+        Return a loaded model, loading it first if needed.
+
+        Args:
+            name: Model name
+            timeout: Maximum seconds to wait for a load started by another thread
+
+        Raises:
+            FileNotFoundError: If the model file is not installed
+            Exception: The loader's error if the model failed to load
+        """
+        entry = self._entry(name)
+        with self._lock:
+            future = entry.future
+            owner = future is None
+            if owner:
+                future = entry.future = Future()
+                future.set_running_or_notify_cancel()
+        if owner:
+            self._load(entry, future)
+        return future.result(timeout)
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[Any]:
+        """
+        Borrow a model for one inference, serializing callers of models that
+        are not thread-safe.
+        """
+        model = self.get(name)
+        entry = self._entry(name)
+        if entry.spec.thread_safe:
+            yield model
+            return
+        with entry.lock:
+            yield model
+
+    def preload(self, names: Optional[Sequence[str]] = None) -> threading.Thread:
+        """
+        Load and warm up models on a background thread.
+
+        Args:
+            names: Models to load. Defaults to HIEL_PRELOAD_MODELS or DEFAULT_PRELOAD.
+                   Models whose file is not installed are reported as missing
+                   instead of failing
+
+        Returns:
+            The (daemon) loading thread
+        """
+        if names is None:
+            names = preload_names()
+
+        def run():
+            for name in names:
+                entry = self._entry(name)
+                if entry.spec.requires and not Path(entry.spec.requires).exists():
+                    self._set_status(entry, ModelState.MISSING,
+                                     error=f"Model file not found: {entry.spec.requires}")
+                    continue
+                try:
+                    self.get(name)
+                except Exception:
+                    pass  # Recorded in the model's status
+
+        thread = threading.Thread(target=run, name='hiel-model-preload', daemon=True)
+        thread.start()
+        return thread
+
+    def release(self, name: str) -> None:
+        """
+        Drop a loaded model so its memory can be reclaimed; it is reloaded on next use.
+        """
+        entry = self._entry(name)
+        with self._lock:
+            if entry.future is not None and entry.future.done():
+                entry.future = None
+        self._set_status(entry, ModelState.NOT_LOADED)
+
+    def _entry(self, name: str) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"Unknown model '{name}'")
+        return entry
+
+    def _load(self, entry: _Entry, future: Future) -> None:
+        spec = entry.spec
+        self._set_status(entry, ModelState.LOADING)
+        started = time.perf_counter()
+        try:
+            if spec.requires and not Path(spec.requires).exists():
+                raise FileNotFoundError(f"Model file not found: {spec.requires}")
+            model = spec.load()
+            if spec.warm_up is not None:
+                spec.warm_up(model)
+        except Exception as e:
+            state = ModelState.MISSING if isinstance(e, FileNotFoundError) else ModelState.FAILED
+            self._set_status(entry, state, error=str(e))
+            logger.warning("Could not load model %s: %s", spec.name, e)
+            # Let a later call try again, e.g. after the model file was installed
+            with self._lock:
+                entry.future = None
+            future.set_exception(e)
+            return
+
+        seconds = time.perf_counter() - started
+        logger.info("Loaded model %s in %.2fs", spec.name, seconds)
+        self._set_status(entry, ModelState.READY, load_seconds=seconds)
+        future.set_result(model)
+
+    def _set_status(self, entry: _Entry, state: ModelState,
+                    load_seconds: Optional[float] = None, error: Optional[str] = None) -> None:
+        status = ModelStatus(entry.spec.name, entry.spec.description, state, load_seconds, error)
+        with self._lock:
+            entry.status = status
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(status)
+            except Exception:
+                logger.exception("Model status listener failed")
+
+
+def preload_names() -> List[str]:
+    """
+    Models to preload, from HIEL_PRELOAD_MODELS ('none' disables preloading).
+    """
+    env_value = os.environ.get('HIEL_PRELOAD_MODELS')
+    if env_value is None:
+        return list(DEFAULT_PRELOAD)
+    if env_value.strip().lower() in ('', 'none'):
+        return []
+    return [name.strip() for name in env_value.split(',') if name.strip()]
+
+
+def _load_rembg(model_name: str):
+    # Session count and ONNX Runtime options come from HIEL_ONNX_PROFILE
+    from src.infrastructure.image_services.onnx_sessions import RembgSessionPool
+    return RembgSessionPool(model_name)
+
+
+def _load_edsr(scale: int):
+    import cv2
+    sr = cv2.dnn_superres.DnnSuperResImpl_create()
+    sr.readModel(f"models/EDSR_x{scale}.pb")
+    sr.setModel("edsr", scale)
+    return sr
+
+
+def _warm_up_edsr(sr) -> None:
+    import numpy as np
+    sr.upsample(np.zeros((32, 32, 3), dtype=np.uint8))
+
+
+def _default_specs() -> List[ModelSpec]:
+    return [
+        ModelSpec('u2net', 'Background removal (U2-Net)',
+                  lambda: _load_rembg('u2net'), lambda pool: pool.warm_up()),
+        # cv2.dnn networks keep per-call state, so inferences are serialized
+        ModelSpec('edsr_x2', 'Upscaler 2x (EDSR)', lambda: _load_edsr(2), _warm_up_edsr,
+                  requires='models/EDSR_x2.pb', thread_safe=False),
+        ModelSpec('edsr_x4', 'Upscaler 4x (EDSR)', lambda: _load_edsr(4), _warm_up_edsr,
+                  requires='models/EDSR_x4.pb', thread_safe=False),
+    ]
+
+
+_manager: Optional[ModelManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_model_manager() -> ModelManager:
+    """
+    Return the process-wide model manager, creating it on first use.
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ModelManager()
+            for spec in _default_specs():
+                _manager.register(spec)
+        return _manager
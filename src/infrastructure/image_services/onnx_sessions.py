@@ -0,0 +1,170 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+import os
+import queue
+
+logger = logging.getLogger(__name__)
+
+GRAPH_OPTIMIZATION_LEVELS = ('disabled', 'basic', 'extended', 'all')
+
+
+@dataclass(frozen=True)
+class SessionProfile:
+    """
+    ONNX Runtime settings for the sessions of one model.
+
+    Attributes:
+        name: Profile name
+        intra_op_threads: Threads used inside one operator (0 = ONNX Runtime default,
+                          one per physical core)
+        inter_op_threads: Threads running independent operators in parallel
+                          (0 = default); only used with parallel execution
+        sessions: Number of sessions in the pool, i.e. images processed at once
+        parallel_execution: Run independent graph branches concurrently
+        graph_optimization: 'disabled', 'basic', 'extended' or 'all'
+        cpu_mem_arena: Keep freed tensors in a per-session arena for reuse.
+                       Faster, but each session's arena grows to its peak usage
+        mem_pattern: Pre-plan allocations from the first run's shapes
+        allow_spinning: Let idle intra-op threads busy-wait for work. Lowers
+                        latency but burns CPU that other sessions could use
+    """
+    name: str
+    intra_op_threads: int = 0
+    inter_op_threads: int = 0
+    sessions: int = 1
+    parallel_execution: bool = False
+    graph_optimization: str = 'all'
+    cpu_mem_arena: bool = True
+    mem_pattern: bool = True
+    allow_spinning: bool = True
+
+    def session_options(self):
+        """
+        Build onnxruntime.SessionOptions for this profile.
+        """
+        import onnxruntime as ort
+        if self.graph_optimization not in GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(f"Unknown graph optimization level '{self.graph_optimization}'. "
+                             f"Choose from: {', '.join(GRAPH_OPTIMIZATION_LEVELS)}")
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_threads
+        options.inter_op_num_threads = self.inter_op_threads
+        options.execution_mode = (ort.ExecutionMode.ORT_PARALLEL if self.parallel_execution
+                                  else ort.ExecutionMode.ORT_SEQUENTIAL)
+        options.graph_optimization_level = {
+            'disabled': ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+            'basic': ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+            'extended': ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+            'all': ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        }[self.graph_optimization]
+        options.enable_cpu_mem_arena = self.cpu_mem_arena
+        options.enable_mem_pattern = self.mem_pattern
+        options.add_session_config_entry('session.intra_op.allow_spinning',
+                                         '1' if self.allow_spinning else '0')
+        return options
+
+
+def default_profiles() -> Dict[str, SessionProfile]:
+    """
+    Built-in profiles, sized for this host's CPU count.
+    """
+    cpus = os.cpu_count() or 1
+    return {
+        # ONNX Runtime's own defaults, as rembg's new_session() uses them
+        'default': SessionProfile('default'),
+        # One image at a time, as fast as possible: every core works inside each operator
+        'latency': SessionProfile('latency', intra_op_threads=cpus, sessions=1),
+        # Many images at once: single-threaded sessions that each own a core.
+        # Arenas are off so memory does not grow with every extra session
+        'throughput': SessionProfile('throughput', intra_op_threads=1, inter_op_threads=1,
+                                     sessions=max(1, min(4, cpus // 2)),
+                                     cpu_mem_arena=False, allow_spinning=False)
+    }
+
+
+def session_profile(name: Optional[str] = None) -> SessionProfile:
+    """
+    Look up a profile by name.
+
+    Args:
+        name: Profile name. Defaults to HIEL_ONNX_PROFILE or 'default'.
+              HIEL_ONNX_SESSIONS overrides the profile's session count
+
+    Raises:
+        ValueError: If the profile does not exist
+    """
+    name = name or os.environ.get('HIEL_ONNX_PROFILE', 'default')
+    profiles = default_profiles()
+    if name not in profiles:
+        raise ValueError(f"Unknown ONNX session profile '{name}'. Choose from: {', '.join(profiles)}")
+    profile = profiles[name]
+    sessions = os.environ.get('HIEL_ONNX_SESSIONS')
+    if sessions:
+        profile = replace(profile, sessions=max(1, int(sessions)))
+    return profile
+
+
+def create_rembg_session(model_name: str, profile: SessionProfile):
+    """
+    Create a rembg session with the profile's ONNX Runtime options.
+
+    rembg's new_session() always builds default options, so the session
+    class is instantiated directly.
+    """
+    from rembg.sessions import sessions_class
+    for session_class in sessions_class:
+        if session_class.name() == model_name:
+            return session_class(model_name, profile.session_options())
+    raise ValueError(f"Unknown rembg model '{model_name}'")
+
+
+class RembgSessionPool:
+    """
+    Fixed set of rembg sessions for one model, each used by one caller at a time.
+    """
+
+    def __init__(self, model_name: str, profile: Optional[SessionProfile] = None):
+        """
+        Create the pool's sessions.
+
+        Args:
+            model_name: rembg model name, e.g. 'u2net'
+            profile: Session settings. Defaults to session_profile()
+        """
+        self.model_name = model_name
+        self.profile = profile or session_profile()
+        self._all: List[Any] = [create_rembg_session(model_name, self.profile)
+                                for _ in range(self.profile.sessions)]
+        self._idle: queue.Queue = queue.Queue()
+        for session in self._all:
+            self._idle.put(session)
+        logger.debug("Created %d %s session(s) with the %s profile",
+                     len(self._all), model_name, self.profile.name)
+
+    @property
+    def size(self) -> int:
+        return len(self._all)
+
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        """
+        Borrow a session, waiting for one to become free.
+        """
+        session = self._idle.get()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def warm_up(self) -> None:
+        """
+        Run one dummy inference per session so graph optimization and
+        allocations happen before the first real image.
+        """
+        from PIL import Image
+        dummy = Image.new('RGB', (320, 320))
+        for session in self._all:
+            session.predict(dummy)
@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+import logging
+import os
+import threading
+import time
+
+from src.domain.interfaces.metrics_sink import MetricsSink
+from src.domain.models.job_metrics import JobMetrics
+from src.infrastructure.monitoring.metrics_sinks import JsonFileMetricsSink, LogMetricsSink
+
+logger = logging.getLogger(__name__)
+
+
+class JobRecorder:
+    """
+    Collects stage timings and counters for one instrumented call.
+    
+    Stages with the same name accumulate, so a per-page loop can time each page
+    under 'render' and report the total. Safe to use from the worker threads of
+    a single job.
+    """
+
+    def __init__(self, service: str):
+        self.metrics = JobMetrics(service=service, started_at=time.time())
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.metrics.stages[name] = self.metrics.stages.get(name, 0.0) + seconds
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.metrics.counters[name] = self.metrics.counters.get(name, 0) + value
+
+    def count_pixels(self, width: int, height: int) -> None:
+        """
+        Add an image's size to the 'megapixels' counter.
+        """
+        self.count('megapixels', width * height / 1_000_000)
+
+    def count_file(self, path) -> None:
+        """
+        Add a written file's size to the 'bytes_written' counter.
+        """
+        try:
+            self.count('bytes_written', os.path.getsize(path))
+        except OSError:
+            pass
+
+
+_sinks: List[MetricsSink] = [LogMetricsSink()]
+_sinks_lock = threading.Lock()
+
+if os.environ.get('HIEL_METRICS_FILE'):
+    _sinks.append(JsonFileMetricsSink(os.environ['HIEL_METRICS_FILE']))
+
+
+def add_sink(sink: MetricsSink) -> None:
+    with _sinks_lock:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: MetricsSink) -> None:
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+@contextmanager
+def instrument(service: str) -> Iterator[JobRecorder]:
+    """
+    Time a service call and send its metrics to every registered sink.
+    
+    Example:
+        with instrument('PDFToImageConverter.convert') as recorder:
+            with recorder.stage('render'):
+                ...
+            recorder.count('pages')
+    
+    Args:
+        service: Name of the service and operation
+    
+    Yields:
+        JobRecorder for stage timings and counters
+    """
+    recorder = JobRecorder(service)
+    started = time.perf_counter()
+    try:
+        yield recorder
+    except BaseException as e:
+        recorder.metrics.error = str(e) or type(e).__name__
+        raise
+    finally:
+        recorder.metrics.seconds = time.perf_counter() - started
+        with _sinks_lock:
+            sinks = list(_sinks)
+        for sink in sinks:
+            try:
+                sink.emit(recorder.metrics)
+            except Exception:
+                logger.exception("Metrics sink %r failed", sink)
@@ -0,0 +1,89 @@
+from collections import deque
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+import json
+import logging
+import threading
+
+from src.domain.interfaces.metrics_sink import MetricsSink
+from src.domain.models.job_metrics import JobMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class LogMetricsSink(MetricsSink):
+    """
+    Writes one summary line per job to a logger.
+    """
+
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self._log = log or logger
+        self._level = level
+
+    def emit(self, metrics: JobMetrics) -> None:
+        if not self._log.isEnabledFor(self._level):
+            return
+        parts = [f"{name}={value:.3f}s" for name, value in metrics.stages.items()]
+        parts += [f"{name}={value:.2f}" for name, value in metrics.rates.items()]
+        if metrics.error:
+            parts.append(f"error={metrics.error}")
+        self._log.log(self._level, "%s %.3fs %s", metrics.service, metrics.seconds, ' '.join(parts))
+
+
+class JsonFileMetricsSink(MetricsSink):
+    """
+    Appends one JSON object per job to a file (JSON Lines).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def emit(self, metrics: JobMetrics) -> None:
+        line = json.dumps(metrics.to_dict())
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class MemoryMetricsSink(MetricsSink):
+    """
+    Keeps the metrics of the last N jobs in memory, e.g. for the GUI.
+    
+    Listeners are called on the job's thread after each emit.
+    """
+
+    def __init__(self, capacity: int = 50):
+        self._records: deque = deque(maxlen=capacity)
+        self._listeners: List[Callable[[JobMetrics], None]] = []
+        self._lock = threading.Lock()
+
+    def emit(self, metrics: JobMetrics) -> None:
+        with self._lock:
+            self._records.append(metrics)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(metrics)
+
+    def records(self) -> List[JobMetrics]:
+        """
+        Return the stored metrics, oldest first.
+        """
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def add_listener(self, listener: Callable[[JobMetrics], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
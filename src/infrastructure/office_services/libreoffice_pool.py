@@ -0,0 +1,401 @@
+from pathlib import Path
+from typing import Optional, Union, List
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from src.domain.interfaces.office_renderer import OfficeRenderer
+from src.domain.models.cancellation import CancellationToken, raise_if_cancelled
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:  # LibreOffice's Python bridge is optional
+    uno = None
+    PropertyValue = None
+
+logger = logging.getLogger(__name__)
+
+_fallback_logged = False
+
+# PDF export filters per LibreOffice application
+PDF_EXPORT_FILTERS = {
+    '.doc': 'writer_pdf_Export',
+    '.docx': 'writer_pdf_Export',
+    '.odt': 'writer_pdf_Export',
+    '.rtf': 'writer_pdf_Export',
+    '.ppt': 'impress_pdf_Export',
+    '.pptx': 'impress_pdf_Export',
+    '.odp': 'impress_pdf_Export',
+    '.xls': 'calc_pdf_Export',
+    '.xlsx': 'calc_pdf_Export',
+    '.ods': 'calc_pdf_Export'
+}
+
+
+class OfficeTimeoutError(TimeoutError):
+    """Raised when a rendering job exceeds its timeout."""
+
+
+def find_soffice() -> Optional[str]:
+    """
+    Locate the LibreOffice ``soffice`` executable.
+
+    Returns:
+        Path to soffice, or None if LibreOffice is not installed
+    """
+    env_path = os.environ.get('HIEL_SOFFICE_PATH')
+    if env_path and os.path.exists(env_path):
+        return env_path
+
+    for name in ('soffice', 'libreoffice'):
+        found = shutil.which(name)
+        if found:
+            return found
+
+    candidates = []
+    if sys.platform == 'win32':
+        for base in (os.environ.get('PROGRAMFILES'), os.environ.get('PROGRAMFILES(X86)')):
+            if base:
+                candidates.append(os.path.join(base, 'LibreOffice', 'program', 'soffice.exe'))
+    elif sys.platform == 'darwin':
+        candidates.append('/Applications/LibreOffice.app/Contents/MacOS/soffice')
+    else:
+        candidates.extend(['/usr/lib/libreoffice/program/soffice', '/opt/libreoffice/program/soffice'])
+
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+class _SofficeWorker:
+    """
+    One headless LibreOffice instance with its own user profile.
+
+    When the UNO bridge is importable the instance is kept running and jobs are
+    sent over a named pipe. Otherwise each job runs ``soffice --convert-to`` against
+    the worker's persistent profile, which still avoids re-creating the profile.
+    """
+
+    def __init__(self, index: int, soffice_path: str, start_timeout: float):
+        self.index = index
+        self._soffice = soffice_path
+        self._start_timeout = start_timeout
+        self._profile_dir = tempfile.mkdtemp(prefix=f"hiel_lo_profile_{index}_")
+        self._pipe_name = f"hiel_lo_{os.getpid()}_{index}"
+        self._process: Optional[subprocess.Popen] = None
+        self._desktop = None
+        self._cli_process: Optional[subprocess.Popen] = None
+        self._timed_out = False
+
+    @property
+    def profile_url(self) -> str:
+        return Path(self._profile_dir).as_uri()
+
+    @property
+    def persistent(self) -> bool:
+        """
+        Whether the worker keeps a LibreOffice process running between jobs.
+        """
+        return uno is not None
+
+    def is_alive(self) -> bool:
+        """
+        Whether the worker's LibreOffice process is running. Always False
+        without the UNO bridge, where no process outlives a job.
+        """
+        return self._process is not None and self._process.poll() is None and self._desktop is not None
+
+    def start(self) -> None:
+        if uno is None:
+            return
+
+        self._process = subprocess.Popen(
+            [
+                self._soffice,
+                '--headless', '--invisible', '--nologo', '--nodefault',
+                '--norestore', '--nolockcheck',
+                f'-env:UserInstallation={self.profile_url}',
+                f'--accept=pipe,name={self._pipe_name};urp;StarOffice.ComponentContext'
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            'com.sun.star.bridge.UnoUrlResolver', local_context
+        )
+        deadline = time.monotonic() + self._start_timeout
+        while True:
+            try:
+                context = resolver.resolve(
+                    f'uno:pipe,name={self._pipe_name};urp;StarOffice.ComponentContext'
+                )
+                self._desktop = context.ServiceManager.createInstanceWithContext(
+                    'com.sun.star.frame.Desktop', context
+                )
+                logger.debug("LibreOffice worker %d started (pid %d)", self.index, self._process.pid)
+                return
+            except Exception:
+                if self._process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError(f"LibreOffice worker {self.index} failed to start")
+                time.sleep(0.2)
+
+    def stop(self) -> None:
+        if self._desktop is not None:
+            try:
+                self._desktop.terminate()
+            except Exception:
+                pass
+            self._desktop = None
+
+        if self._process is not None:
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+
+    def restart(self) -> None:
+        logger.warning("Restarting LibreOffice worker %d", self.index)
+        self._kill()
+        self.stop()
+        self.start()
+
+    def dispose(self) -> None:
+        self.stop()
+        shutil.rmtree(self._profile_dir, ignore_errors=True)
+
+    def convert(self, input_path: Path, output_path: Path, timeout: Optional[float]) -> None:
+        if uno is None:
+            self._convert_with_cli(input_path, output_path, timeout)
+        else:
+            self._convert_with_uno(input_path, output_path, timeout)
+
+    def abort(self) -> None:
+        """
+        Kill the LibreOffice process serving the current job.
+        """
+        for process in (self._process, self._cli_process):
+            if process is not None and process.poll() is None:
+                process.kill()
+
+    def _kill(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self._timed_out = True
+            self._process.kill()
+
+    def _convert_with_uno(self, input_path: Path, output_path: Path, timeout: Optional[float]) -> None:
+        filter_name = PDF_EXPORT_FILTERS.get(input_path.suffix.lower(), 'writer_pdf_Export')
+
+        self._timed_out = False
+        watchdog = threading.Timer(timeout, self._kill) if timeout else None
+        if watchdog:
+            watchdog.daemon = True
+            watchdog.start()
+
+        document = None
+        try:
+            document = self._desktop.loadComponentFromURL(
+                input_path.absolute().as_uri(), '_blank', 0,
+                (self._property('Hidden', True), self._property('ReadOnly', True))
+            )
+            if document is None:
+                raise RuntimeError(f"LibreOffice could not open {input_path}")
+            document.storeToURL(
+                output_path.absolute().as_uri(),
+                (self._property('FilterName', filter_name),)
+            )
+        except Exception as e:
+            if self._timed_out:
+                raise OfficeTimeoutError(f"Rendering {input_path.name} exceeded {timeout}s")
+            raise RuntimeError(f"LibreOffice rendering failed: {e}")
+        finally:
+            if watchdog:
+                watchdog.cancel()
+            if document is not None and not self._timed_out:
+                try:
+                    document.close(True)
+                except Exception:
+                    pass
+
+    def _convert_with_cli(self, input_path: Path, output_path: Path, timeout: Optional[float]) -> None:
+        with tempfile.TemporaryDirectory(prefix="hiel_lo_out_") as out_dir:
+            self._cli_process = subprocess.Popen(
+                [
+                    self._soffice,
+                    '--headless', '--norestore', '--nolockcheck',
+                    f'-env:UserInstallation={self.profile_url}',
+                    '--convert-to', 'pdf',
+                    '--outdir', out_dir,
+                    str(input_path.absolute())
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            try:
+                _, stderr = self._cli_process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self._cli_process.kill()
+                self._cli_process.communicate()
+                raise OfficeTimeoutError(f"Rendering {input_path.name} exceeded {timeout}s")
+            finally:
+                returncode = self._cli_process.returncode
+                self._cli_process = None
+
+            rendered = Path(out_dir) / f"{input_path.stem}.pdf"
+            if returncode != 0 or not rendered.exists():
+                message = stderr.decode(errors='replace').strip()
+                raise RuntimeError(f"LibreOffice rendering failed: {message or 'no output produced'}")
+
+            shutil.move(str(rendered), str(output_path))
+
+    @staticmethod
+    def _property(name: str, value) -> 'PropertyValue':
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        return prop
+
+
+class LibreOfficePool(OfficeRenderer):
+    """
+    Pool of warm headless LibreOffice instances.
+
+    Jobs wait in a queue for a free instance. An instance that times out or
+    crashes is restarted before it is handed to the next job, and a job that hit
+    a crashed instance is retried once on a fresh one.
+    """
+
+    def __init__(self,
+                 size: int = 2,
+                 soffice_path: Optional[str] = None,
+                 job_timeout: Optional[float] = 300.0,
+                 start_timeout: float = 60.0):
+        """
+        Initialize the pool. Instances are started lazily on first use.
+
+        Args:
+            size: Number of LibreOffice instances
+            soffice_path: Optional path to the soffice executable
+            job_timeout: Default per-job timeout in seconds (None disables it)
+            start_timeout: Maximum seconds to wait for an instance to start
+        """
+        self._soffice = soffice_path or find_soffice()
+        if self._soffice is None:
+            raise RuntimeError("LibreOffice (soffice) was not found. Install LibreOffice "
+                               "or set HIEL_SOFFICE_PATH.")
+
+        self.job_timeout = job_timeout
+        self._start_timeout = start_timeout
+        self._size = max(1, size)
+        self._workers: List[_SofficeWorker] = []
+        self._idle: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        _log_fallback_mode()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def render_to_pdf(self,
+                      input_path: Union[str, Path],
+                      output_path: Union[str, Path],
+                      timeout: Optional[float] = None,
+                      cancel_token: Optional[CancellationToken] = None) -> str:
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        if not input_path.exists():
+            raise FileNotFoundError(f"File not found: {input_path}")
+
+        raise_if_cancelled(cancel_token)
+        timeout = timeout if timeout is not None else self.job_timeout
+        remaining = cancel_token.remaining() if cancel_token else None
+        if remaining is not None:
+            timeout = min(timeout, remaining) if timeout else remaining
+
+        worker = self._acquire()
+        unregister = cancel_token.on_cancel(worker.abort) if cancel_token else None
+        try:
+            try:
+                worker.convert(input_path, output_path, timeout)
+            except Exception as e:
+                if cancel_token is not None and cancel_token.cancelled:
+                    # The job was aborted: drop the partial PDF and the killed instance
+                    output_path.unlink(missing_ok=True)
+                    worker.restart()
+                    cancel_token.raise_if_cancelled()
+                if isinstance(e, OfficeTimeoutError):
+                    worker.restart()
+                    raise
+                if not worker.persistent or worker.is_alive():
+                    # Without UNO every job already gets a fresh process
+                    raise
+                # The instance crashed under this job: recover and retry once
+                worker.restart()
+                worker.convert(input_path, output_path, timeout)
+        finally:
+            if unregister:
+                unregister()
+            self._idle.put(worker)
+
+        logger.debug("Rendered %s with LibreOffice worker %d", input_path, worker.index)
+        return str(output_path)
+
+    def warm_up(self) -> None:
+        """
+        Start every instance now instead of on first use.
+        """
+        workers = [self._acquire() for _ in range(self._size)]
+        for worker in workers:
+            self._idle.put(worker)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.dispose()
+
+    def _acquire(self) -> _SofficeWorker:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("LibreOffice pool is closed")
+            spawn = self._idle.empty() and len(self._workers) < self._size
+            if spawn:
+                worker = _SofficeWorker(len(self._workers), self._soffice, self._start_timeout)
+                self._workers.append(worker)
+
+        if spawn:
+            try:
+                worker.start()
+            except Exception:
+                with self._lock:
+                    self._workers.remove(worker)
+                worker.dispose()
+                raise
+            return worker
+
+        worker = self._idle.get()
+        if worker.persistent and not worker.is_alive():
+            worker.restart()
+        return worker
+
+
+def _log_fallback_mode() -> None:
+    global _fallback_logged
+    if uno is None and not _fallback_logged:
+        _fallback_logged = True
+        logger.info("LibreOffice UNO bridge not available: the pool runs one soffice "
+                    "process per job instead of keeping instances warm")
@@ -0,0 +1,206 @@
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+from concurrent.futures import CancelledError, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+
+from src.domain.interfaces.office_renderer import OfficeRenderer
+from src.domain.models.cancellation import CancellationToken, raise_if_cancelled
+
+logger = logging.getLogger(__name__)
+
+WORD_FORMATS = ['.doc', '.docx', '.rtf', '.odt']
+POWERPOINT_FORMATS = ['.ppt', '.pptx', '.odp']
+
+WD_FORMAT_PDF = 17
+PP_SAVE_AS_PDF = 32
+
+
+class MSOfficeRenderer(OfficeRenderer):
+    """
+    Renderer backed by an installed Microsoft Office.
+
+    On Windows, Word and PowerPoint are driven over COM from a single dedicated
+    thread, and each application is started once and reused until close().
+    Elsewhere Word documents fall back to docx2pdf.
+
+    A job that times out leaves that thread blocked inside Office, so the
+    thread is recycled: the Office processes it started are killed, which
+    fails the hung call, and later jobs run on a fresh thread with fresh
+    application instances.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = _OfficeThread()
+        self._closed = False
+
+    def render_to_pdf(self,
+                      input_path: Union[str, Path],
+                      output_path: Union[str, Path],
+                      timeout: Optional[float] = None,
+                      cancel_token: Optional[CancellationToken] = None) -> str:
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        if not input_path.exists():
+            raise FileNotFoundError(f"File not found: {input_path}")
+
+        suffix = input_path.suffix.lower()
+        if suffix in WORD_FORMATS:
+            job = _OfficeThread.render_word
+        elif suffix in POWERPOINT_FORMATS:
+            job = _OfficeThread.render_powerpoint
+        else:
+            raise ValueError(f"Unsupported file format: {suffix}")
+
+        # Office cannot be interrupted mid-document over COM, so cancellation
+        # is honoured before the job starts and once it returns
+        raise_if_cancelled(cancel_token)
+        remaining = cancel_token.remaining() if cancel_token else None
+        if remaining is not None:
+            timeout = min(timeout, remaining) if timeout else remaining
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Office renderer is closed")
+                thread = self._thread
+                future = thread.executor.submit(job, thread, input_path.absolute(), output_path.absolute())
+            try:
+                future.result(timeout=max(0.0, deadline - time.monotonic()) if deadline else None)
+                break
+            except CancelledError:
+                # Queued behind a job that hung; run it on the replacement thread
+                continue
+            except FutureTimeoutError:
+                self._recycle(thread)
+                raise TimeoutError(f"Rendering {input_path.name} exceeded {timeout}s")
+
+        if cancel_token is not None and cancel_token.cancelled:
+            output_path.unlink(missing_ok=True)
+            cancel_token.raise_if_cancelled()
+        return str(output_path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        thread.executor.submit(thread.quit_applications).result()
+        thread.executor.shutdown(wait=True)
+
+    def _recycle(self, thread: '_OfficeThread') -> None:
+        """
+        Replace a COM thread that is stuck in a hung Office call.
+        """
+        with self._lock:
+            if self._thread is not thread:
+                return  # Already replaced after another job timed out
+            self._thread = _OfficeThread()
+        # Jobs queued behind the hung one are resubmitted by their callers
+        thread.executor.shutdown(wait=False, cancel_futures=True)
+        thread.kill_applications()
+
+
+class _OfficeThread:
+    """
+    One COM thread and the Office applications started on it.
+
+    COM objects belong to the thread that created them, so they are only
+    touched by jobs running on this thread's executor.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, initializer=self._init_com)
+        self.word = None
+        self.powerpoint = None
+        # Office processes this thread started, by application name
+        self.process_ids: Dict[str, int] = {}
+
+    def render_word(self, input_path: Path, output_path: Path) -> None:
+        if sys.platform != 'win32':
+            from docx2pdf import convert
+            convert(str(input_path), str(output_path))
+            return
+
+        if self.word is None:
+            import win32com.client
+            self.word = win32com.client.DispatchEx("Word.Application")
+            self.word.Visible = False
+            self.word.DisplayAlerts = 0
+            self._remember_process('Word', self._word_window)
+
+        document = self.word.Documents.Open(str(input_path), ReadOnly=True)
+        try:
+            document.SaveAs(str(output_path), FileFormat=WD_FORMAT_PDF)
+        finally:
+            document.Close(0)
+
+    def render_powerpoint(self, input_path: Path, output_path: Path) -> None:
+        if sys.platform != 'win32':
+            raise RuntimeError("PowerPoint rendering requires Microsoft Office on Windows")
+
+        if self.powerpoint is None:
+            import win32com.client
+            import win32gui
+            # PowerPoint runs a single instance; never kill one the user had open
+            shared = bool(win32gui.FindWindow('PPTFrameClass', None))
+            self.powerpoint = win32com.client.Dispatch("Powerpoint.Application")
+            if not shared:
+                self._remember_process('PowerPoint', lambda: self.powerpoint.HWND)
+
+        deck = self.powerpoint.Presentations.Open(str(input_path), WithWindow=False)
+        try:
+            deck.SaveAs(str(output_path), PP_SAVE_AS_PDF)
+        finally:
+            deck.Close()
+
+    def quit_applications(self) -> None:
+        for app in (self.word, self.powerpoint):
+            if app is not None:
+                try:
+                    app.Quit()
+                except Exception as e:
+                    logger.warning("Failed to quit Office application: %s", e)
+        self.word = None
+        self.powerpoint = None
+        self.process_ids.clear()
+
+    def kill_applications(self) -> None:
+        """
+        Kill this thread's Office processes from another thread, failing a hung call.
+        """
+        if not self.process_ids:
+            logger.warning("Abandoning a hung Office job; its process is unknown and keeps running")
+        for name, pid in list(self.process_ids.items()):
+            logger.warning("Killing hung %s (pid %d)", name, pid)
+            try:
+                os.kill(pid, signal.SIGTERM)  # TerminateProcess on Windows
+            except OSError as e:
+                logger.warning("Failed to kill %s (pid %d): %s", name, pid, e)
+
+    def _remember_process(self, name: str, find_window: Callable[[], int]) -> None:
+        try:
+            import win32process
+            self.process_ids[name] = win32process.GetWindowThreadProcessId(find_window())[1]
+        except Exception as e:
+            logger.debug("Could not find the %s process: %s", name, e)
+
+    def _word_window(self) -> int:
+        import win32gui
+        # Word exposes no window handle of its own, so find it by a unique caption
+        caption = f"hiel-word-{os.getpid()}-{id(self)}"
+        self.word.Caption = caption
+        return win32gui.FindWindow('OpusApp', caption)
+
+    @staticmethod
+    def _init_com() -> None:
+        if sys.platform == 'win32':
+            import pythoncom
+            pythoncom.CoInitialize()
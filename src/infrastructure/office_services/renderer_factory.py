@@ -0,0 +1,77 @@
+from typing import Dict, Optional
+import atexit
+import importlib.util
+import os
+import sys
+import threading
+
+from src.domain.interfaces.office_renderer import OfficeRenderer
+from src.infrastructure.office_services.libreoffice_pool import LibreOfficePool, find_soffice
+from src.infrastructure.office_services.ms_office_renderer import MSOfficeRenderer
+
+BACKENDS = ['auto', 'libreoffice', 'msoffice']
+
+_renderers: Dict[str, OfficeRenderer] = {}
+_lock = threading.Lock()
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    Resolve a backend name, picking one for this host when 'auto' is requested.
+
+    Args:
+        backend: 'auto', 'libreoffice' or 'msoffice'. Defaults to the
+                 HIEL_OFFICE_BACKEND environment variable, then 'auto'
+
+    Returns:
+        Concrete backend name
+    """
+    backend = (backend or os.environ.get('HIEL_OFFICE_BACKEND') or 'auto').lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown office backend: {backend}")
+
+    if backend != 'auto':
+        return backend
+    if sys.platform == 'win32' and importlib.util.find_spec('win32com') is not None:
+        return 'msoffice'
+    if find_soffice() is not None:
+        return 'libreoffice'
+    return 'msoffice'
+
+
+def get_office_renderer(backend: Optional[str] = None) -> OfficeRenderer:
+    """
+    Return the shared renderer for a backend, creating it on first use.
+
+    The same instance is handed to every converter so warm applications are
+    reused across DOCX and PPTX conversions. Renderers are closed at exit.
+
+    Args:
+        backend: 'auto', 'libreoffice' or 'msoffice'
+
+    Returns:
+        Shared OfficeRenderer instance
+    """
+    name = resolve_backend(backend)
+    with _lock:
+        renderer = _renderers.get(name)
+        if renderer is None:
+            if name == 'libreoffice':
+                size = int(os.environ.get('HIEL_OFFICE_WORKERS', min(os.cpu_count() or 1, 2)))
+                renderer = LibreOfficePool(size=size)
+            else:
+                renderer = MSOfficeRenderer()
+            _renderers[name] = renderer
+        return renderer
+
+
+@atexit.register
+def close_office_renderers() -> None:
+    """
+    Close every shared renderer.
+    """
+    with _lock:
+        renderers = list(_renderers.values())
+        _renderers.clear()
+    for renderer in renderers:
+        renderer.close()
@@ -0,0 +1,301 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import argparse
+import glob
+import json
+import re
+import sys
+import time
+
+from src.domain.models.cancellation import CancellationToken
+from src.domain.models.conversion_result import ConversionResult
+from src.domain.models.watch_rule import WatchRule
+from src.presentation.cli.tools import TOOLS
+
+COMMANDS = ['convert', 'tools', 'watch']
+
+_services: Dict[str, object] = {}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='hiel',
+        description='HiEL Utility Tools command-line interface. Runs the converters '
+                    'headless, without importing the GUI.',
+        epilog='example: python main.py convert pdf2img "scans/*.pdf" --jobs 4 --json',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert = subparsers.add_parser('convert', help='Run a converter over one or more files')
+    convert.add_argument('tool', choices=sorted(TOOLS), help='Conversion to run')
+    convert.add_argument('inputs', nargs='+', help='Input files or glob patterns (quote them to skip shell expansion)')
+    convert.add_argument('-o', '--output-dir', help='Directory for outputs (defaults to next to each input)')
+    convert.add_argument('-j', '--jobs', type=int, default=1, help='Number of files converted in parallel')
+    convert.add_argument('-p', '--param', action='append', default=[], metavar='KEY=VALUE',
+                         help='Extra service parameter, e.g. -p dpi=150 or -p size=512x512')
+    convert.add_argument('--timeout', type=float, metavar='SECONDS',
+                         help='Abort each file that runs longer than this and clean up its partial output')
+    convert.add_argument('--json', action='store_true', help='Print machine-readable JSON results with timings')
+
+    subparsers.add_parser('tools', help='List available conversions')
+
+    watch = subparsers.add_parser('watch', help='Convert files dropped into a folder until stopped')
+    watch.add_argument('folder', help='Folder to watch')
+    watch.add_argument('-r', '--rule', action='append', default=[], metavar='PATTERN=TOOL',
+                       help="Route matching files to a conversion, e.g. -r '*.pdf=pdf2img' (first match wins)")
+    watch.add_argument('--rules-file', help='JSON list of {"pattern", "tool", "params", "output_dir"} rules')
+    watch.add_argument('-o', '--output-dir', help='Directory for outputs (defaults to FOLDER/converted)')
+    watch.add_argument('-j', '--jobs', type=int, default=2, help='Number of files converted in parallel')
+    watch.add_argument('-p', '--param', action='append', default=[], metavar='KEY=VALUE',
+                       help='Extra service parameter for every rule')
+    watch.add_argument('--settle', type=float, default=2.0, metavar='SECONDS',
+                       help='Time a file must stay unchanged before it is converted (default 2)')
+    watch.add_argument('--poll-interval', type=float, default=1.0, metavar='SECONDS',
+                       help='Seconds between checks (default 1)')
+    watch.add_argument('--polling', action='store_true',
+                       help='Poll instead of using native file events, e.g. on network shares')
+    watch.add_argument('--recursive', action='store_true', help='Also watch subfolders')
+    watch.add_argument('--ledger', help='Ledger database (defaults to FOLDER/.hiel_watch.sqlite3)')
+    watch.add_argument('--retry-failed', action='store_true', help='Try files that failed before again')
+    watch.add_argument('--timeout', type=float, metavar='SECONDS', help='Abort each file that runs longer than this')
+    watch.add_argument('--once', action='store_true', help='Convert the files already there, then exit')
+    return parser
+
+
+def expand_inputs(patterns: Sequence[str]) -> List[Path]:
+    """
+    Expand glob patterns (including ``**``) into a de-duplicated, ordered file list.
+    """
+    seen = set()
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            path = Path(match)
+            key = path.resolve()
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def parse_params(items: Sequence[str]) -> Dict[str, object]:
+    """
+    Parse KEY=VALUE parameters into typed keyword arguments.
+
+    Integers, floats, booleans and WIDTHxHEIGHT sizes are converted; everything
+    else is passed through as a string.
+    """
+    params = {}
+    for item in items:
+        if '=' not in item:
+            raise ValueError(f"Parameter must be KEY=VALUE: {item}")
+        key, value = item.split('=', 1)
+        params[key.strip()] = _parse_value(value.strip())
+    return params
+
+
+def _parse_value(value: str):
+    lowered = value.lower()
+    if lowered in ('true', 'yes', 'on'):
+        return True
+    if lowered in ('false', 'no', 'off'):
+        return False
+    size = re.fullmatch(r'(\d+)x(\d+)', lowered)
+    if size:
+        return int(size.group(1)), int(size.group(2))
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def run_job(tool_name: str,
+            input_path,
+            output_path: Optional[str],
+            params: Dict[str, object],
+            timeout: Optional[float] = None) -> ConversionResult:
+    """
+    Run one conversion, reusing the service instance within this process.
+
+    The deadline starts when the job starts, not when it was queued.
+
+    Module level so it can be submitted to a ProcessPoolExecutor.
+    """
+    tool = TOOLS[tool_name]
+    started = time.perf_counter()
+    label = ', '.join(str(p) for p in input_path) if isinstance(input_path, list) else str(input_path)
+    try:
+        service = _services.get(tool_name)
+        if service is None:
+            service = _services[tool_name] = tool.create_service()
+        if timeout is not None:
+            params = dict(params, cancel_token=CancellationToken(timeout))
+        output = getattr(service, tool.method)(input_path, output_path, **params)
+        return ConversionResult(label, output, time.perf_counter() - started)
+    except Exception as e:
+        return ConversionResult(label, None, time.perf_counter() - started, str(e))
+
+
+def run_convert(args: argparse.Namespace) -> int:
+    tool = TOOLS[args.tool]
+    params = parse_params(args.param)
+    inputs = expand_inputs(args.inputs)
+
+    missing = [p for p in inputs if not p.exists()]
+    if missing:
+        print(f"error: input not found: {', '.join(str(p) for p in missing)}", file=sys.stderr)
+        return 2
+    unsupported = [p for p in inputs if p.suffix.lower() not in tool.input_suffixes]
+    if unsupported:
+        print(f"error: {tool.name} expects {', '.join(tool.input_suffixes)} files, got: "
+              f"{', '.join(str(p) for p in unsupported)}", file=sys.stderr)
+        return 2
+    if not inputs:
+        print("error: no input files matched", file=sys.stderr)
+        return 2
+
+    output_dir = Path(args.output_dir) if args.output_dir else None
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    def output_for(path: Path) -> Optional[str]:
+        return str(output_dir / tool.output_name(path)) if output_dir and tool.output_name else None
+
+    if tool.combine_inputs:
+        jobs = [([str(p) for p in inputs], output_for(inputs[0]))]
+    else:
+        jobs = [(str(p), output_for(p)) for p in inputs]
+
+    workers = max(1, min(args.jobs, len(jobs)))
+    started = time.perf_counter()
+    if workers == 1:
+        results = [run_job(tool.name, src, out, params, args.timeout) for src, out in jobs]
+    else:
+        executor_class = ProcessPoolExecutor if tool.executor == 'process' else ThreadPoolExecutor
+        with executor_class(max_workers=workers) as executor:
+            futures = [executor.submit(run_job, tool.name, src, out, params, args.timeout) for src, out in jobs]
+            results = [f.result() for f in futures]
+    wall_seconds = time.perf_counter() - started
+
+    failed = [r for r in results if not r.succeeded]
+    if args.json:
+        json.dump({
+            'tool': tool.name,
+            'jobs': workers,
+            'files': len(results),
+            'failed': len(failed),
+            'wall_seconds': round(wall_seconds, 4),
+            'results': [
+                {
+                    'input': r.input_path,
+                    'output': r.output_path,
+                    'seconds': round(r.seconds, 4),
+                    'error': r.error
+                }
+                for r in results
+            ]
+        }, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        for r in results:
+            if r.succeeded:
+                print(f"ok    {r.seconds:8.2f}s  {r.input_path}")
+            else:
+                print(f"FAIL  {r.seconds:8.2f}s  {r.input_path}: {r.error}")
+        print(f"{len(results) - len(failed)}/{len(results)} converted in {wall_seconds:.2f}s "
+              f"with {workers} job(s)")
+
+    return 1 if failed else 0
+
+
+def load_rules(args: argparse.Namespace) -> List[WatchRule]:
+    """
+    Build watch rules from --rules-file and -r PATTERN=TOOL options.
+    """
+    rules = []
+    if args.rules_file:
+        with open(args.rules_file, encoding='utf-8') as f:
+            for item in json.load(f):
+                rules.append(WatchRule(item['pattern'], item['tool'], item.get('params', {}), item.get('output_dir')))
+    for item in args.rule:
+        if '=' not in item:
+            raise ValueError(f"Rule must be PATTERN=TOOL: {item}")
+        pattern, tool = item.rsplit('=', 1)
+        rules.append(WatchRule(pattern.strip(), tool.strip()))
+
+    unknown = [rule.tool for rule in rules if rule.tool not in TOOLS]
+    if unknown:
+        raise ValueError(f"Unknown tool(s) in rules: {', '.join(unknown)}. Run 'tools' to list them")
+    if not rules:
+        raise ValueError("No watch rules given; use -r PATTERN=TOOL or --rules-file")
+    return rules
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    from src.application.folder_watcher import FolderWatcher
+    from src.infrastructure.file_services.watch_ledger import WatchLedger
+
+    rules = load_rules(args)
+    params = parse_params(args.param)
+    folder = Path(args.folder)
+    ledger = WatchLedger(args.ledger or folder / '.hiel_watch.sqlite3')
+    if args.retry_failed:
+        ledger.forget_failures()
+
+    def convert(rule: WatchRule, path: Path, output_dir: Path) -> ConversionResult:
+        tool = TOOLS[rule.tool]
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output = str(output_dir / tool.output_name(path)) if tool.output_name else None
+        input_arg = [str(path)] if tool.combine_inputs else str(path)
+        return run_job(rule.tool, input_arg, output, dict(params, **rule.params), args.timeout)
+
+    def report(result: ConversionResult) -> None:
+        if result.succeeded:
+            print(f"ok    {result.seconds:8.2f}s  {result.input_path}", flush=True)
+        else:
+            print(f"FAIL  {result.seconds:8.2f}s  {result.input_path}: {result.error}", flush=True)
+
+    watcher = FolderWatcher(folder, rules, convert, ledger,
+                            output_dir=args.output_dir,
+                            max_workers=args.jobs,
+                            settle_seconds=args.settle,
+                            poll_interval=args.poll_interval,
+                            recursive=args.recursive,
+                            use_native=not args.polling,
+                            on_result=report)
+    try:
+        if args.once:
+            watcher.run_once()
+        else:
+            print(f"Watching {folder} ({'native events' if watcher.native else 'polling'}), "
+                  f"Ctrl+C to stop", file=sys.stderr)
+            watcher.run_forever()
+    finally:
+        ledger.close()
+    return 0
+
+
+def run_tools() -> int:
+    width = max(len(name) for name in TOOLS)
+    for name in sorted(TOOLS):
+        tool = TOOLS[name]
+        print(f"{name.ljust(width)}  {tool.description} [{', '.join(tool.input_suffixes)}]")
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == 'tools':
+        return run_tools()
+    try:
+        if args.command == 'watch':
+            return run_watch(args)
+        return run_convert(args)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import importlib
+
+
+@dataclass(frozen=True)
+class CliTool:
+    """
+    A converter or image service exposed on the command line.
+
+    The service module is only imported when a job runs, so listing tools or
+    parsing arguments never pays for heavy dependencies.
+
+    Attributes:
+        name: Command-line name of the tool
+        description: One-line help text
+        module: Module containing the service class
+        class_name: Service class name
+        method: Service method called with (input_path, output_path, **params)
+        input_suffixes: Accepted input file extensions
+        output_name: Maps an input path to its output name inside --output-dir
+        executor: 'process' for CPU-bound Python work, 'thread' for work that
+                  releases the GIL or runs in an external application
+        combine_inputs: Whether all inputs form a single job
+    """
+    name: str
+    description: str
+    module: str
+    class_name: str
+    method: str
+    input_suffixes: List[str]
+    output_name: Optional[Callable[[Path], str]] = None
+    executor: str = 'process'
+    combine_inputs: bool = False
+
+    def create_service(self):
+        service_class = getattr(importlib.import_module(self.module), self.class_name)
+        return service_class()
+
+
+TOOLS: Dict[str, CliTool] = {tool.name: tool for tool in [
+    CliTool(
+        name='pdf2img',
+        description='Render PDF pages to images',
+        module='src.infrastructure.file_services.pdf_converter',
+        class_name='PDFToImageConverter',
+        method='convert',
+        input_suffixes=['.pdf'],
+        output_name=lambda p: f"{p.stem}_images"
+    ),
+    CliTool(
+        name='img2pdf',
+        description='Combine images into a single PDF',
+        module='src.infrastructure.file_services.images_to_pdf_converter',
+        class_name='ImagesToPDFConverter',
+        method='convert',
+        input_suffixes=['.png', '.jpg', '.jpeg', '.bmp'],
+        output_name=lambda p: f"{p.stem}_combined.pdf",
+        combine_inputs=True
+    ),
+    CliTool(
+        name='pdf2docx',
+        description='Convert PDF to DOCX',
+        module='src.infrastructure.file_services.docx_converter',
+        class_name='DocxConverter',
+        method='convert',
+        input_suffixes=['.pdf'],
+        output_name=lambda p: f"{p.stem}.docx"
+    ),
+    CliTool(
+        name='docx2pdf',
+        description='Convert DOCX to PDF with the office rendering backend',
+        module='src.infrastructure.file_services.docx_converter',
+        class_name='DocxConverter',
+        method='convert',
+        input_suffixes=['.docx'],
+        output_name=lambda p: f"{p.stem}.pdf",
+        executor='thread'
+    ),
+    CliTool(
+        name='pdf2xlsx',
+        description='Extract PDF tables to Excel',
+        module='src.infrastructure.file_services.excel_converter',
+        class_name='PDFToExcelConverter',
+        method='convert',
+        input_suffixes=['.pdf'],
+        output_name=lambda p: f"{p.stem}.xlsx"
+    ),
+    CliTool(
+        name='ppt2pdf',
+        description='Convert PPT/PPTX to PDF with the office rendering backend',
+        module='src.infrastructure.file_services.ppt_converter',
+        class_name='PPTConverter',
+        method='convert',
+        input_suffixes=['.ppt', '.pptx'],
+        output_name=lambda p: f"{p.stem}.pdf",
+        executor='thread'
+    ),
+    CliTool(
+        name='resize',
+        description='Resize images (requires -p size=WIDTHxHEIGHT)',
+        module='src.infrastructure.image_services.image_resizer',
+        class_name='ImageResizer',
+        method='process',
+        input_suffixes=['.png', '.jpg', '.jpeg', '.bmp', '.webp'],
+        output_name=lambda p: f"{p.stem}_resized{p.suffix}"
+    ),
+    CliTool(
+        name='rmbg',
+        description='Remove image backgrounds',
+        module='src.infrastructure.image_services.background_remover',
+        class_name='BackgroundRemover',
+        method='process',
+        input_suffixes=['.png', '.jpg', '.jpeg', '.bmp', '.webp'],
+        output_name=lambda p: f"{p.stem}_nobg.png",
+        # ONNX Runtime releases the GIL; threads share one session pool
+        executor='thread'
+    ),
+    CliTool(
+        name='upscale',
+        description='Upscale images with EDSR super-resolution (-p scale_factor=2|4)',
+        module='src.infrastructure.image_services.image_upscaler',
+        class_name='ImageUpscaler',
+        method='process',
+        input_suffixes=['.png', '.jpg', '.jpeg', '.bmp'],
+        output_name=lambda p: f"{p.stem}_upscaled{p.suffix}"
+    ),
+    CliTool(
+        name='ico',
+        description='Convert PNG logos to multi-size ICO',
+        module='src.infrastructure.image_services.logo_converter',
+        class_name='LogoConverter',
+        method='convert_logo',
+        input_suffixes=['.png'],
+        output_name=lambda p: f"{p.stem}_icon.ico"
+    ),
+    CliTool(
+        name='iconset',
+        description='Generate ICO, web favicons and Apple touch icons from one PNG',
+        module='src.infrastructure.image_services.logo_converter',
+        class_name='LogoConverter',
+        method='convert_logo_bundle',
+        input_suffixes=['.png'],
+        output_name=lambda p: f"{p.stem}_icons"
+    ),
+    CliTool(
+        name='iconbundle',
+        description='Generate Android, iOS, Windows and web icons in one pass (-p manifests=android,ios)',
+        module='src.infrastructure.image_services.icon_bundle',
+        class_name='IconBundleGenerator',
+        method='generate',
+        input_suffixes=['.png', '.jpg', '.jpeg'],
+        output_name=lambda p: f"{p.stem}_icon_bundle"
+    ),
+    CliTool(
+        name='pipeline',
+        description="Chain image operations in memory (-p 'steps=remove_background>trim>icon_bundle')",
+        module='src.infrastructure.image_services.image_pipeline',
+        class_name='ImagePipeline',
+        method='run',
+        input_suffixes=['.png', '.jpg', '.jpeg', '.bmp', '.webp'],
+        output_name=lambda p: f"{p.stem}_pipeline",
+        # Model steps release the GIL and share the process-wide models
+        executor='thread'
+    ),
+    CliTool(
+        name='android',
+        description='Generate Android launcher icons',
+        module='src.infrastructure.image_services.android_logo_generator',
+        class_name='AndroidLogoGenerator',
+        method='generate_icons',
+        input_suffixes=['.png', '.jpg', '.jpeg'],
+        output_name=lambda p: f"{p.stem}_android_res"
+    )
+]}
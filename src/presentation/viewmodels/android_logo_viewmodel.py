@@ -1,5 +1,7 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.image_services.android_logo_generator import AndroidLogoGenerator
 
 
@@ -11,6 +13,7 @@ class AndroidLogoViewModel(QObject):
     def __init__(self):
         super().__init__()
         self._generator = AndroidLogoGenerator()
+        self._scheduler = get_scheduler()
     
     def generate_android_icons(self, input_path: str, output_dir: str = None) -> None:
         """
@@ -20,6 +23,13 @@ class AndroidLogoViewModel(QObject):
             input_path: Path to input image file
             output_dir: Optional output directory path
         """
+        token = CancellationToken()
+        self._scheduler.submit(self._generate_android_icons, input_path, output_dir, token,
+                               resource_class=ResourceClass.CPU, name="Android icons",
+                               cancel_token=token)
+    
+    def _generate_android_icons(self, input_path: str, output_dir: str = None,
+                                cancel_token: CancellationToken = None) -> None:
         try:
             if not input_path:
                 raise ValueError("Please select an image file")
@@ -32,7 +42,8 @@ class AndroidLogoViewModel(QObject):
             output_paths = self._generator.generate_icons(
                 input_path=input_path,
                 output_base_dir=output_dir,
-                progress_callback=self.progress_updated.emit
+                progress_callback=self.progress_updated.emit,
+                cancel_token=cancel_token
             )
             
             # Emit completion signal with output paths
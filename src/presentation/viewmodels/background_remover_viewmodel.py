@@ -1,5 +1,7 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.image_services.background_remover import BackgroundRemover
 
 class BackgroundRemoverViewModel(QObject):
@@ -10,6 +12,7 @@ class BackgroundRemoverViewModel(QObject):
     def __init__(self):
         super().__init__()
         self._remover = BackgroundRemover()
+        self._scheduler = get_scheduler()
     
     def remove_background(self, input_path: str, output_path: str = None,
                          alpha_matting: bool = True,
@@ -17,6 +20,20 @@ class BackgroundRemoverViewModel(QObject):
                          background_threshold: int = 10,
                          erode_size: int = 10,
                          quality: int = 95) -> None:
+        token = CancellationToken()
+        self._scheduler.submit(self._remove_background, input_path, output_path,
+                               alpha_matting, foreground_threshold, background_threshold,
+                               erode_size, quality, token,
+                               resource_class=ResourceClass.MODEL, name="Remove background",
+                               cancel_token=token)
+    
+    def _remove_background(self, input_path: str, output_path: str,
+                           alpha_matting: bool,
+                           foreground_threshold: int,
+                           background_threshold: int,
+                           erode_size: int,
+                           quality: int,
+                           cancel_token: CancellationToken = None) -> None:
         try:
             if not input_path:
                 raise ValueError("Please select an image file")
@@ -29,6 +46,7 @@ class BackgroundRemoverViewModel(QObject):
                 input_path=input_path,
                 output_path=output_path,
                 progress_callback=self.progress_updated.emit,
+                cancel_token=cancel_token,
                 alpha_matting=alpha_matting,
                 foreground_threshold=foreground_threshold,
                 background_threshold=background_threshold,
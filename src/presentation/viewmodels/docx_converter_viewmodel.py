@@ -1,23 +1,54 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
+from typing import List
+from src.application.job_scheduler import get_scheduler, ResourceClass, JobPriority
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.file_services.docx_converter import DocxConverter
 
 class DocxConverterViewModel(QObject):
     conversion_completed = Signal(str)  # Output file path
+    batch_completed = Signal(list)  # List of ConversionResult
+    progress_updated = Signal(int, str)  # Progress percentage (0-100), status message
     error_occurred = Signal(str)  # Error message
     
     def __init__(self):
         super().__init__()
         self._converter = DocxConverter()
+        self._scheduler = get_scheduler()
     
-    def convert_file(self, input_path: str, output_path: str = None) -> None:
+    def convert_file(self, 
+                     input_path: str, 
+                     output_path: str = None,
+                     pages: str = 'all',
+                     multi_processing: bool = False,
+                     cpu_count: int = 0) -> None:
         """
         Convert between PDF and DOCX formats.
         
         Args:
             input_path: Path to the input file
             output_path: Optional output file path
+            pages: Pages to convert for PDF input (e.g., '1-3,5' or 'all')
+            multi_processing: Whether to parse PDF pages in parallel processes
+            cpu_count: Number of worker processes (0 uses all cores)
         """
+        # DOCX to PDF is rendered by the office application, PDF to DOCX parses in-process
+        is_docx = str(input_path).lower().endswith('.docx')
+        token = CancellationToken()
+        self._scheduler.submit(
+            self._convert_file, input_path, output_path, pages, multi_processing, cpu_count, token,
+            resource_class=ResourceClass.EXTERNAL if is_docx else ResourceClass.CPU,
+            name="PDF DOCX conversion",
+            cancel_token=token
+        )
+    
+    def _convert_file(self, 
+                      input_path: str, 
+                      output_path: str,
+                      pages: str,
+                      multi_processing: bool,
+                      cpu_count: int,
+                      cancel_token: CancellationToken = None) -> None:
         try:
             # Validate input
             if not input_path:
@@ -33,10 +64,50 @@ class DocxConverterViewModel(QObject):
             # Convert file
             output_file = self._converter.convert(
                 input_path=input_path,
-                output_path=output_path if output_path else None
+                output_path=output_path if output_path else None,
+                progress_callback=self.progress_updated.emit,
+                pages=pages,
+                multi_processing=multi_processing,
+                cpu_count=cpu_count,
+                cancel_token=cancel_token
             )
             
             self.conversion_completed.emit(output_file)
             
         except Exception as e:
-            self.error_occurred.emit(str(e)) 
\ No newline at end of file
+            self.error_occurred.emit(str(e))
+    
+    def convert_batch(self, input_paths: List[str], output_dir: str = None) -> None:
+        """
+        Convert many PDF/DOCX files in one batch.
+        
+        Args:
+            input_paths: Paths to the input files
+            output_dir: Optional output directory
+        """
+        token = CancellationToken()
+        self._scheduler.submit(self._convert_batch, input_paths, output_dir, token,
+                               resource_class=ResourceClass.EXTERNAL, priority=JobPriority.LOW,
+                               name="PDF DOCX batch", cancel_token=token)
+    
+    def _convert_batch(self, input_paths: List[str], output_dir: str = None,
+                       cancel_token: CancellationToken = None) -> None:
+        try:
+            if not input_paths:
+                raise ValueError("Please select at least one file")
+            
+            for path in input_paths:
+                if Path(path).suffix.lower() not in ['.pdf', '.docx']:
+                    raise ValueError(f"Selected file must be PDF or DOCX: {path}")
+            
+            results = self._converter.convert_batch(
+                input_paths,
+                output_dir=output_dir if output_dir else None,
+                progress_callback=lambda value: self.progress_updated.emit(value, "Converting batch"),
+                cancel_token=cancel_token
+            )
+            
+            self.batch_completed.emit(results)
+            
+        except Exception as e:
+            self.error_occurred.emit(str(e))
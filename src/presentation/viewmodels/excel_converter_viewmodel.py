@@ -1,5 +1,7 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.file_services.excel_converter import PDFToExcelConverter
 
 class ExcelConverterViewModel(QObject):
@@ -9,6 +11,7 @@ class ExcelConverterViewModel(QObject):
     def __init__(self):
         super().__init__()
         self._converter = PDFToExcelConverter()
+        self._scheduler = get_scheduler()
     
     def convert_to_excel(self, 
                         input_path: str, 
@@ -24,6 +27,17 @@ class ExcelConverterViewModel(QObject):
             pages: Pages to convert (e.g., '1-3' or 'all')
             multiple_tables: Whether to extract multiple tables per page
         """
+        token = CancellationToken()
+        self._scheduler.submit(self._convert_to_excel, input_path, output_path, pages, multiple_tables,
+                               token, resource_class=ResourceClass.CPU, name="PDF to Excel",
+                               cancel_token=token)
+    
+    def _convert_to_excel(self, 
+                          input_path: str, 
+                          output_path: str,
+                          pages: str,
+                          multiple_tables: bool,
+                          cancel_token: CancellationToken = None) -> None:
         try:
             # Validate input
             if not input_path:
@@ -41,7 +55,8 @@ class ExcelConverterViewModel(QObject):
                 input_path=input_path,
                 output_path=output_path if output_path else None,
                 pages=pages,
-                multiple_tables=multiple_tables
+                multiple_tables=multiple_tables,
+                cancel_token=cancel_token
             )
             
             self.conversion_completed.emit(output_file)
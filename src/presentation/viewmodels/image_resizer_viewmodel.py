@@ -1,5 +1,7 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.image_services.image_resizer import ImageResizer
 
 class ImageResizerViewModel(QObject):
@@ -11,11 +13,22 @@ class ImageResizerViewModel(QObject):
     def __init__(self):
         super().__init__()
         self._resizer = ImageResizer()
+        self._scheduler = get_scheduler()
     
     def resize_image(self, input_path: str, width: int, height: int, 
                     output_path: str = None, maintain_aspect: bool = True,
                     color_mode: str = 'RGBA', quality: int = 95,
                     resample: str = 'lanczos') -> None:
+        token = CancellationToken()
+        self._scheduler.submit(self._resize_image, input_path, width, height, output_path,
+                               maintain_aspect, color_mode, quality, resample, token,
+                               resource_class=ResourceClass.CPU, name="Resize image",
+                               cancel_token=token)
+    
+    def _resize_image(self, input_path: str, width: int, height: int, 
+                      output_path: str, maintain_aspect: bool,
+                      color_mode: str, quality: int, resample: str,
+                      cancel_token: CancellationToken = None) -> None:
         try:
             if not input_path:
                 raise ValueError("Please select an image file")
@@ -33,7 +46,8 @@ class ImageResizerViewModel(QObject):
                 color_mode=color_mode,
                 quality=quality,
                 resample=resample,
-                optimize=True
+                optimize=True,
+                cancel_token=cancel_token
             )
             
             self.resize_completed.emit(output_path)
@@ -42,6 +56,12 @@ class ImageResizerViewModel(QObject):
             self.error_occurred.emit(str(e))
     
     def create_android_icons(self, input_path: str) -> None:
+        token = CancellationToken()
+        self._scheduler.submit(self._create_android_icons, input_path, token,
+                               resource_class=ResourceClass.CPU, name="Android icons",
+                               cancel_token=token)
+    
+    def _create_android_icons(self, input_path: str, cancel_token: CancellationToken = None) -> None:
         try:
             if not input_path:
                 raise ValueError("Please select an image file")
@@ -55,7 +75,8 @@ class ImageResizerViewModel(QObject):
                 android_mode=True,
                 progress_callback=self.progress_updated.emit,
                 quality=95,
-                optimize=True
+                optimize=True,
+                cancel_token=cancel_token
             )
             
             self.android_resize_completed.emit(output_paths)
@@ -1,5 +1,7 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.image_services.image_upscaler import ImageUpscaler
 
 class ImageUpscalerViewModel(QObject):
@@ -9,6 +11,7 @@ class ImageUpscalerViewModel(QObject):
     def __init__(self):
         super().__init__()
         self._processor = ImageUpscaler()
+        self._scheduler = get_scheduler()
     
     def upscale_image(self, 
                      input_path: str, 
@@ -22,6 +25,16 @@ class ImageUpscalerViewModel(QObject):
             scale_factor: Upscaling factor (2 or 4)
             output_path: Optional output path
         """
+        token = CancellationToken()
+        self._scheduler.submit(self._upscale_image, input_path, scale_factor, output_path, token,
+                               resource_class=ResourceClass.MODEL, name="Upscale image",
+                               cancel_token=token)
+    
+    def _upscale_image(self, 
+                       input_path: str, 
+                       scale_factor: int,
+                       output_path: str,
+                       cancel_token: CancellationToken = None) -> None:
         try:
             # Validate input
             if not input_path:
@@ -41,7 +54,8 @@ class ImageUpscalerViewModel(QObject):
             output_file = self._processor.process(
                 input_path=input_path,
                 output_path=output_path,
-                scale_factor=scale_factor
+                scale_factor=scale_factor,
+                cancel_token=cancel_token
             )
             
             self.processing_completed.emit(output_file)
@@ -1,6 +1,8 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
 from typing import List
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.file_services.images_to_pdf_converter import ImagesToPDFConverter
 
 class ImagesToPDFViewModel(QObject):
@@ -10,6 +12,7 @@ class ImagesToPDFViewModel(QObject):
     def __init__(self):
         super().__init__()
         self._converter = ImagesToPDFConverter()
+        self._scheduler = get_scheduler()
     
     def convert_images(self, image_paths: List[str], output_path: str = None) -> None:
         """
@@ -19,6 +22,13 @@ class ImagesToPDFViewModel(QObject):
             image_paths: List of paths to image files
             output_path: Optional output PDF path
         """
+        token = CancellationToken()
+        self._scheduler.submit(self._convert_images, image_paths, output_path, token,
+                               resource_class=ResourceClass.CPU, name="Images to PDF",
+                               cancel_token=token)
+    
+    def _convert_images(self, image_paths: List[str], output_path: str = None,
+                        cancel_token: CancellationToken = None) -> None:
         try:
             # Validate input
             if not image_paths:
@@ -27,7 +37,8 @@ class ImagesToPDFViewModel(QObject):
             # Convert images to PDF
             output_file = self._converter.convert(
                 input_path=image_paths,
-                output_path=output_path if output_path else None
+                output_path=output_path if output_path else None,
+                cancel_token=cancel_token
             )
             
             self.conversion_completed.emit(output_file)
@@ -1,27 +1,61 @@
 from PySide6.QtCore import QObject, Signal
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.image_services.logo_converter import LogoConverter
 
 class LogoConverterViewModel(QObject):
     conversion_completed = Signal(str)
+    bundle_completed = Signal(dict)  # Output file name -> path
     error_occurred = Signal(str)
 
-    def convert_logo(self, input_path):
+    def __init__(self):
+        super().__init__()
+        self._scheduler = get_scheduler()
+
+    def convert_logo(self, input_path, sizes=None):
         """
         Convert 500x500 PNG to ICO
         
         Args:
             input_path: Path to input PNG file
+            sizes: Optional list of (width, height) icon sizes
         """
+        token = CancellationToken()
+        self._scheduler.submit(self._convert_logo, input_path, sizes, token,
+                               resource_class=ResourceClass.CPU, name="Logo to Icon",
+                               cancel_token=token)
+
+    def _convert_logo(self, input_path, sizes=None, cancel_token=None):
         try:
             # Perform logo conversion
-            result_path = LogoConverter.convert_logo(input_path)
+            result_path = LogoConverter.convert_logo(input_path, cancel_token=cancel_token, sizes=sizes)
 
             # Emit conversion completed signal
             self.conversion_completed.emit(result_path)
-            return result_path
 
         except Exception as e:
             # Emit error signal if conversion fails
             error_msg = f"Logo Conversion Error: {str(e)}"
             self.error_occurred.emit(error_msg)
-            raise
+
+    def convert_logo_bundle(self, input_path, output_dir=None):
+        """
+        Generate an ICO, web favicons and Apple touch icons from one PNG
+        
+        Args:
+            input_path: Path to input PNG file
+            output_dir: Optional output directory
+        """
+        token = CancellationToken()
+        self._scheduler.submit(self._convert_logo_bundle, input_path, output_dir, token,
+                               resource_class=ResourceClass.CPU, name="Icon set",
+                               cancel_token=token)
+
+    def _convert_logo_bundle(self, input_path, output_dir=None, cancel_token=None):
+        try:
+            outputs = LogoConverter.convert_logo_bundle(input_path, output_dir, cancel_token=cancel_token)
+            self.bundle_completed.emit(outputs)
+
+        except Exception as e:
+            error_msg = f"Icon Set Generation Error: {str(e)}"
+            self.error_occurred.emit(error_msg)
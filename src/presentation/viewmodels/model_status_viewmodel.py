@@ -0,0 +1,29 @@
+from PySide6.QtCore import QObject, Signal
+from typing import List, Optional, Sequence
+from src.domain.models.model_status import ModelStatus
+from src.infrastructure.image_services.model_manager import get_model_manager
+
+class ModelStatusViewModel(QObject):
+    status_changed = Signal(object)  # ModelStatus of the model that changed
+    
+    def __init__(self):
+        super().__init__()
+        self._manager = get_model_manager()
+        # Emitted from the loading thread; Qt queues it onto the GUI thread
+        self._manager.add_listener(self.status_changed.emit)
+    
+    def statuses(self) -> List[ModelStatus]:
+        return self._manager.statuses()
+    
+    def preload(self, names: Optional[Sequence[str]] = None) -> None:
+        """
+        Load and warm up models in the background so the first request
+        does not pay for it.
+        
+        Args:
+            names: Models to load. Defaults to HIEL_PRELOAD_MODELS or all models
+        """
+        self._manager.preload(names)
+    
+    def close(self) -> None:
+        self._manager.remove_listener(self.status_changed.emit)
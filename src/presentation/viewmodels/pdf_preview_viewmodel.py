@@ -0,0 +1,91 @@
+from PySide6.QtCore import QObject, Signal
+from typing import Sequence
+from src.application.job_scheduler import get_scheduler, JobPriority, ResourceClass
+from src.domain.models.cancellation import CancellationToken, OperationCancelledError, raise_if_cancelled
+from src.infrastructure.file_services.page_renderer import PageRenderer, open_document
+
+class PdfPreviewViewModel(QObject):
+    document_loaded = Signal(str, int)  # Path, page count
+    page_rendered = Signal(object)      # RenderedPage; coarse renders arrive first
+    error_occurred = Signal(str)
+
+    # A quick coarse pass, then sharper passes up to the pane's resolution
+    PREVIEW_DPIS = (24, 60, 110)
+
+    def __init__(self):
+        super().__init__()
+        self._renderer = PageRenderer()
+        self._scheduler = get_scheduler()
+        self._token = None
+
+    def load(self, path: str) -> None:
+        """
+        Open a PDF for previewing and render its first page
+
+        Args:
+            path: Path to the PDF file
+        """
+        token = self._replace_token()
+        self._scheduler.submit(self._load, path, token,
+                               resource_class=ResourceClass.CPU, priority=JobPriority.HIGH,
+                               name="PDF preview", cancel_token=token)
+
+    def show_page(self, path: str, page_index: int, dpis: Sequence[int] = PREVIEW_DPIS) -> None:
+        """
+        Render a page progressively, cancelling any preview still in progress
+
+        Args:
+            path: Path to the PDF file
+            page_index: 0-based page number
+            dpis: Resolutions to render, coarsest first
+        """
+        token = self._replace_token()
+        self._scheduler.submit(self._render_progressive, path, page_index, tuple(dpis), token,
+                               resource_class=ResourceClass.CPU, priority=JobPriority.HIGH,
+                               name="PDF preview", cancel_token=token)
+
+    def cancel(self) -> None:
+        if self._token is not None:
+            self._token.cancel()
+
+    def _replace_token(self) -> CancellationToken:
+        # Only the latest preview request matters
+        self.cancel()
+        self._token = CancellationToken()
+        return self._token
+
+    def _load(self, path: str, cancel_token: CancellationToken = None) -> None:
+        try:
+            document, _ = open_document(path)
+            try:
+                page_count = document.page_count
+            finally:
+                document.close()
+            raise_if_cancelled(cancel_token)
+            self.document_loaded.emit(path, page_count)
+            if page_count:
+                self._render_progressive(path, 0, self.PREVIEW_DPIS, cancel_token)
+        except OperationCancelledError:
+            pass
+        except Exception as e:
+            self.error_occurred.emit(f"PDF Preview Error: {str(e)}")
+
+    def _render_progressive(self, path: str, page_index: int, dpis: Sequence[int],
+                            cancel_token: CancellationToken = None) -> None:
+        try:
+            document, fingerprint = open_document(path)
+            try:
+                # A page already cached at full preview resolution needs no coarse passes
+                final = self._renderer.cache.get((fingerprint, page_index, dpis[-1], 'rgb'))
+                if final is not None:
+                    self.page_rendered.emit(final)
+                    return
+                for dpi in dpis:
+                    raise_if_cancelled(cancel_token)
+                    self.page_rendered.emit(self._renderer.render(document, fingerprint, page_index, dpi))
+            finally:
+                document.close()
+        except OperationCancelledError:
+            pass
+        except Exception as e:
+            self.error_occurred.emit(f"PDF Preview Error: {str(e)}")
@@ -1,5 +1,7 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.file_services.pdf_converter import PDFToImageConverter
 
 class PDFToImagesViewModel(QObject):
@@ -10,8 +12,29 @@ class PDFToImagesViewModel(QObject):
     def __init__(self):
         super().__init__()
         self._converter = PDFToImageConverter()
+        self._scheduler = get_scheduler()
     
-    def convert_pdf(self, input_path: str) -> None:
+    def convert_pdf(self, input_path: str, image_format: str = 'png', quality: int = 90,
+                    dpi=300, use_cache: bool = False) -> None:
+        """
+        Convert a PDF to one image per page
+        
+        Args:
+            input_path: Path to the PDF file
+            image_format: 'png', 'jpeg' or 'webp'
+            quality: JPEG/WebP quality (1-100)
+            dpi: Render resolution, or 'auto' to choose it per page
+            use_cache: Read and fill the page render cache, so converting the
+                       same PDF at the same DPI again skips rendering
+        """
+        token = CancellationToken()
+        self._scheduler.submit(self._convert_pdf, input_path, image_format, quality, dpi, use_cache, token,
+                               resource_class=ResourceClass.CPU, name="PDF to Images",
+                               cancel_token=token)
+    
+    def _convert_pdf(self, input_path: str, image_format: str = 'png', quality: int = 90,
+                     dpi=300, use_cache: bool = False,
+                     cancel_token: CancellationToken = None) -> None:
         try:
             if not input_path:
                 raise ValueError("Please select a PDF file")
@@ -26,7 +49,12 @@ class PDFToImagesViewModel(QObject):
             # Convert PDF to images with progress tracking
             output_files = self._converter.convert(
                 input_path=input_path,
-                progress_callback=self.progress_updated.emit
+                progress_callback=self.progress_updated.emit,
+                cancel_token=cancel_token,
+                fmt=image_format,
+                quality=quality,
+                dpi=dpi,
+                use_cache=use_cache
             )
             
             # Emit conversion completed signal with output files
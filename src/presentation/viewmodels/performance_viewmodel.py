@@ -0,0 +1,34 @@
+from PySide6.QtCore import QObject, Signal
+from typing import List
+from src.domain.models.job_metrics import JobMetrics
+from src.infrastructure.monitoring.instrumentation import add_sink, remove_sink
+from src.infrastructure.monitoring.metrics_sinks import MemoryMetricsSink
+
+class PerformanceViewModel(QObject):
+    metrics_recorded = Signal(object)  # JobMetrics of a finished job
+    
+    def __init__(self, capacity: int = 50):
+        """
+        Collect the metrics of the last jobs for the Performance panel.
+        
+        Args:
+            capacity: Number of jobs kept
+        """
+        super().__init__()
+        self.capacity = capacity
+        self._sink = MemoryMetricsSink(capacity)
+        # Emitted from the job's thread; Qt queues it onto the GUI thread
+        self._sink.add_listener(self.metrics_recorded.emit)
+        add_sink(self._sink)
+    
+    def recent_jobs(self) -> List[JobMetrics]:
+        """
+        Return the recorded jobs, newest first.
+        """
+        return list(reversed(self._sink.records()))
+    
+    def clear(self) -> None:
+        self._sink.clear()
+    
+    def close(self) -> None:
+        remove_sink(self._sink)
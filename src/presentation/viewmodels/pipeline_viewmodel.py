@@ -0,0 +1,52 @@
+from PySide6.QtCore import QObject, Signal
+from typing import List
+from src.application.job_scheduler import get_scheduler, ResourceClass
+from src.domain.models.cancellation import CancellationToken
+from src.domain.models.pipeline_step import PipelineStep
+from src.infrastructure.image_services.image_pipeline import ImagePipeline, uses_model
+
+class PipelineViewModel(QObject):
+    pipeline_completed = Signal(dict)  # Output name -> path
+    progress_updated = Signal(int)
+    error_occurred = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self._pipeline = ImagePipeline()
+        self._scheduler = get_scheduler()
+
+    def run_pipeline(self, input_path: str, steps: List[PipelineStep], output_dir: str = None) -> None:
+        """
+        Run a chain of image operations on one image
+
+        Args:
+            input_path: Path to the source image
+            steps: Operations in order
+            output_dir: Optional output directory
+        """
+        token = CancellationToken()
+        # Chains with a model step wait on the model queue, not the CPU queue
+        resource_class = ResourceClass.MODEL if uses_model(steps) else ResourceClass.CPU
+        self._scheduler.submit(self._run_pipeline, input_path, list(steps), output_dir, token,
+                               resource_class=resource_class, name="Image pipeline",
+                               cancel_token=token)
+
+    def _run_pipeline(self, input_path: str, steps: List[PipelineStep], output_dir: str = None,
+                      cancel_token: CancellationToken = None) -> None:
+        try:
+            if not input_path:
+                raise ValueError("Please select an image file")
+            if not steps:
+                raise ValueError("Please add at least one step")
+
+            outputs = self._pipeline.run(
+                input_path,
+                output_dir or None,
+                steps,
+                progress_callback=self.progress_updated.emit,
+                cancel_token=cancel_token
+            )
+            self.pipeline_completed.emit(outputs)
+
+        except Exception as e:
+            self.error_occurred.emit(f"Pipeline Error: {str(e)}")
@@ -1,14 +1,20 @@
 from PySide6.QtCore import QObject, Signal
 from pathlib import Path
+from typing import List
+from src.application.job_scheduler import get_scheduler, ResourceClass, JobPriority
+from src.domain.models.cancellation import CancellationToken
 from src.infrastructure.file_services.ppt_converter import PPTConverter
 
 class PPTConverterViewModel(QObject):
     conversion_completed = Signal(str)  # Output file path
+    batch_completed = Signal(list)  # List of ConversionResult
+    progress_updated = Signal(int)  # Batch progress percentage (0-100)
     error_occurred = Signal(str)  # Error message
     
     def __init__(self):
         super().__init__()
         self._converter = PPTConverter()
+        self._scheduler = get_scheduler()
     
     def convert_file(self, input_path: str, output_path: str = None) -> None:
         """
@@ -18,6 +24,13 @@ class PPTConverterViewModel(QObject):
             input_path: Path to the input file
             output_path: Optional output file path
         """
+        token = CancellationToken()
+        self._scheduler.submit(self._convert_file, input_path, output_path, token,
+                               resource_class=ResourceClass.EXTERNAL, name="PPT PDF conversion",
+                               cancel_token=token)
+    
+    def _convert_file(self, input_path: str, output_path: str = None,
+                      cancel_token: CancellationToken = None) -> None:
         try:
             # Validate input
             if not input_path:
@@ -33,10 +46,46 @@ class PPTConverterViewModel(QObject):
             # Convert file
             output_file = self._converter.convert(
                 input_path=input_path,
-                output_path=output_path if output_path else None
+                output_path=output_path if output_path else None,
+                cancel_token=cancel_token
             )
             
             self.conversion_completed.emit(output_file)
             
         except Exception as e:
-            self.error_occurred.emit(str(e)) 
\ No newline at end of file
+            self.error_occurred.emit(str(e))
+    
+    def convert_batch(self, input_paths: List[str], output_dir: str = None) -> None:
+        """
+        Convert many PPT/PPTX files to PDF in one batch.
+        
+        Args:
+            input_paths: Paths to the input presentations
+            output_dir: Optional output directory
+        """
+        token = CancellationToken()
+        self._scheduler.submit(self._convert_batch, input_paths, output_dir, token,
+                               resource_class=ResourceClass.EXTERNAL, priority=JobPriority.LOW,
+                               name="PPT PDF batch", cancel_token=token)
+    
+    def _convert_batch(self, input_paths: List[str], output_dir: str = None,
+                       cancel_token: CancellationToken = None) -> None:
+        try:
+            if not input_paths:
+                raise ValueError("Please select at least one presentation")
+            
+            for path in input_paths:
+                if Path(path).suffix.lower() not in ['.ppt', '.pptx']:
+                    raise ValueError(f"Selected file must be PPT or PPTX: {path}")
+            
+            results = self._converter.convert_batch(
+                input_paths,
+                output_dir=output_dir if output_dir else None,
+                progress_callback=self.progress_updated.emit,
+                cancel_token=cancel_token
+            )
+            
+            self.batch_completed.emit(results)
+            
+        except Exception as e:
+            self.error_occurred.emit(str(e))
@@ -2,14 +2,17 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTabWidget, QLabel, QFileDialog,
     QSpinBox, QLineEdit, QProgressBar, QMessageBox,
-    QListWidget, QListWidgetItem, QCheckBox, QGroupBox, 
-    QTextEdit, QRadioButton, QButtonGroup, QComboBox, QSlider
+    QListWidget, QListWidgetItem, QListView, QCheckBox, QGroupBox, 
+    QTextEdit, QRadioButton, QButtonGroup, QComboBox, QSlider,
+    QTableWidget, QTableWidgetItem, QHeaderView
 )
-from PySide6.QtCore import Qt, QThread
+from PySide6.QtCore import Qt, QThread, QTimer, QSize
 from PySide6.QtGui import QIcon, QDesktopServices
 from PySide6.QtCore import QUrl
 from pathlib import Path
+import logging
 import os
+import time
 from src.presentation.viewmodels.pdf_to_images_viewmodel import PDFToImagesViewModel
 from src.presentation.viewmodels.images_to_pdf_viewmodel import ImagesToPDFViewModel
 from src.presentation.viewmodels.docx_converter_viewmodel import DocxConverterViewModel
@@ -20,7 +23,17 @@ from src.presentation.viewmodels.background_remover_viewmodel import BackgroundR
 from src.presentation.viewmodels.image_upscaler_viewmodel import ImageUpscalerViewModel
 from src.presentation.viewmodels.logo_converter_viewmodel import LogoConverterViewModel
 from src.presentation.viewmodels.android_logo_viewmodel import AndroidLogoViewModel
+from src.presentation.viewmodels.performance_viewmodel import PerformanceViewModel
+from src.presentation.viewmodels.model_status_viewmodel import ModelStatusViewModel
+from src.presentation.viewmodels.pipeline_viewmodel import PipelineViewModel
+from src.presentation.views.output_list_model import OutputListModel
+from src.presentation.views.pdf_preview import PdfPreviewPane
+from src.presentation.views.thumbnails import ThumbnailLoader
 from src.infrastructure.image_services.logo_converter import LogoConverter
+from src.infrastructure.image_services.image_pipeline import OPERATIONS, parse_steps
+from src.application.job_scheduler import get_scheduler
+
+logger = logging.getLogger(__name__)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -31,12 +44,13 @@ class MainWindow(QMainWindow):
         # Set window icon
         BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         icon_path = os.path.join(BASE_DIR, 'assets', 'app_icon.ico')
-        print(f"Icon path: {icon_path}")
-        print(f"Icon exists: {os.path.exists(icon_path)}")
-        print(f"BASE_DIR: {BASE_DIR}")
+        logger.debug("Icon path: %s (exists: %s)", icon_path, os.path.exists(icon_path))
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
         
+        # Thumbnails for the output lists, decoded off the GUI thread and shared
+        self.thumbnail_loader = ThumbnailLoader(size=64)
+        
         # Initialize view models
         self.pdf_to_images_vm = PDFToImagesViewModel()
         self.pdf_to_images_vm.progress_updated.connect(self.update_progress)
@@ -49,6 +63,10 @@ class MainWindow(QMainWindow):
         
         self.docx_converter_vm = DocxConverterViewModel()
         self.docx_converter_vm.conversion_completed.connect(self.docx_conversion_completed)
+        self.docx_converter_vm.progress_updated.connect(self.update_docx_progress)
+        self.docx_converter_vm.batch_completed.connect(
+            lambda results: self.show_batch_results("Batch Conversion Complete", results)
+        )
         self.docx_converter_vm.error_occurred.connect(self.show_error)
         
         self.excel_converter_vm = ExcelConverterViewModel()
@@ -57,6 +75,10 @@ class MainWindow(QMainWindow):
         
         self.ppt_converter_vm = PPTConverterViewModel()
         self.ppt_converter_vm.conversion_completed.connect(self.ppt_conversion_completed)
+        self.ppt_converter_vm.progress_updated.connect(lambda v: self.ppt_progress_bar.setValue(v))
+        self.ppt_converter_vm.batch_completed.connect(
+            lambda results: self.show_batch_results("Batch Conversion Complete", results)
+        )
         self.ppt_converter_vm.error_occurred.connect(self.show_error)
         
         self.image_resizer_vm = ImageResizerViewModel()
@@ -73,6 +95,8 @@ class MainWindow(QMainWindow):
         self.image_upscaler_vm.error_occurred.connect(self.show_error)
         
         self.logo_converter_vm = LogoConverterViewModel()
+        self.logo_converter_vm.conversion_completed.connect(self.logo_conversion_completed)
+        self.logo_converter_vm.bundle_completed.connect(self.logo_bundle_completed)
         self.logo_converter_vm.error_occurred.connect(self.show_error)
         
         self.android_logo_vm = AndroidLogoViewModel()
@@ -80,6 +104,17 @@ class MainWindow(QMainWindow):
         self.android_logo_vm.generation_completed.connect(self.android_generation_completed)
         self.android_logo_vm.error_occurred.connect(self.show_error)
         
+        self.pipeline_vm = PipelineViewModel()
+        self.pipeline_vm.progress_updated.connect(lambda v: self.pipeline_progress_bar.setValue(v))
+        self.pipeline_vm.pipeline_completed.connect(self.pipeline_completed)
+        self.pipeline_vm.error_occurred.connect(self.show_error)
+        
+        self.performance_vm = PerformanceViewModel()
+        self.performance_vm.metrics_recorded.connect(self.add_performance_row)
+        
+        self.model_status_vm = ModelStatusViewModel()
+        self.model_status_vm.status_changed.connect(self.update_model_status)
+        
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -105,6 +140,11 @@ class MainWindow(QMainWindow):
         support_layout.addWidget(buy_coffee_btn)
         support_layout.addStretch()
         
+        # Stop every queued and running job
+        cancel_jobs_btn = QPushButton("Cancel Running Jobs")
+        cancel_jobs_btn.clicked.connect(self.cancel_jobs)
+        support_layout.addWidget(cancel_jobs_btn)
+        
         # Add support layout to main layout
         main_layout.addLayout(support_layout)
         
@@ -122,8 +162,44 @@ class MainWindow(QMainWindow):
         self.setup_android_logo_tab()
         self.setup_background_remover_tab()
         self.setup_image_upscaler_tab()
+        self.setup_pipeline_tab()
         self.setup_web_search_tab()
-        
+        self.setup_performance_tab()
+        
+        # ML model load state, shown permanently in the status bar
+        self.model_status_label = QLabel()
+        self.statusBar().addPermanentWidget(self.model_status_label)
+        self.update_model_status()
+        
+        # Load and warm up models once the window is shown, off the GUI thread
+        QTimer.singleShot(0, self.model_status_vm.preload)
+        
+    def closeEvent(self, event):
+        # Drop queued jobs and ask running ones to stop
+        get_scheduler().shutdown(wait=False, cancel_pending=True)
+        self.performance_vm.close()
+        self.model_status_vm.close()
+        super().closeEvent(event)
+    
+    def update_model_status(self, status=None):
+        statuses = self.model_status_vm.statuses()
+        self.model_status_label.setText(
+            "Models: " + ", ".join(f"{s.name} {s.state.value}" for s in statuses)
+        )
+        details = []
+        for s in statuses:
+            line = f"{s.description}: {s.state.value}"
+            if s.load_seconds is not None:
+                line += f" ({s.load_seconds:.1f}s)"
+            if s.error:
+                line += f" - {s.error}"
+            details.append(line)
+        self.model_status_label.setToolTip("\n".join(details))
+    
+    def cancel_jobs(self):
+        cancelled = get_scheduler().cancel_all()
+        self.statusBar().showMessage(f"Cancelled {cancelled} job(s)", 5000)
+    
     def _open_buy_me_coffee(self):
         """
         Open Buy Me a Coffee page in the default web browser
@@ -154,6 +230,44 @@ class MainWindow(QMainWindow):
         input_group.setLayout(input_layout)
         layout.addWidget(input_group)
         
+        # Preview of the selected PDF
+        self.pdf_preview = self.create_pdf_preview(self.pdf_input_path)
+        layout.addWidget(self.pdf_preview)
+        
+        # Output format options
+        options_group = QGroupBox("Output Options")
+        options_layout = QHBoxLayout()
+        options_layout.addWidget(QLabel("Format:"))
+        self.pdf_image_format = QComboBox()
+        for label, image_format in (("PNG", 'png'), ("JPEG", 'jpeg'), ("WebP", 'webp')):
+            self.pdf_image_format.addItem(label, image_format)
+        options_layout.addWidget(self.pdf_image_format)
+        options_layout.addWidget(QLabel("Quality:"))
+        self.pdf_image_quality = QSpinBox()
+        self.pdf_image_quality.setRange(1, 100)
+        self.pdf_image_quality.setValue(90)
+        # PNG is lossless, so quality only applies to JPEG and WebP
+        self.pdf_image_quality.setEnabled(False)
+        self.pdf_image_format.currentIndexChanged.connect(
+            lambda: self.pdf_image_quality.setEnabled(self.pdf_image_format.currentData() != 'png')
+        )
+        options_layout.addWidget(self.pdf_image_quality)
+        options_layout.addWidget(QLabel("DPI:"))
+        self.pdf_image_dpi = QComboBox()
+        # Auto renders scans at their own resolution and text at 300 DPI or more
+        for label, dpi in (("Auto", 'auto'), ("150", 150), ("300", 300), ("600", 600)):
+            self.pdf_image_dpi.addItem(label, dpi)
+        self.pdf_image_dpi.setCurrentIndex(self.pdf_image_dpi.findData(300))
+        options_layout.addWidget(self.pdf_image_dpi)
+        # Off by default: a one-off conversion gains nothing from caching every page
+        self.pdf_use_cache_cb = QCheckBox("Cache page renders")
+        self.pdf_use_cache_cb.setToolTip("Reuse pages rendered before and keep these for next time. "
+                                         "Speeds up converting the same PDF again at the same DPI")
+        options_layout.addWidget(self.pdf_use_cache_cb)
+        options_layout.addStretch()
+        options_group.setLayout(options_layout)
+        layout.addWidget(options_group)
+        
         # Convert button
         convert_btn = QPushButton("Convert PDF to Images")
         convert_btn.clicked.connect(self.convert_pdf_to_images)
@@ -168,7 +282,8 @@ class MainWindow(QMainWindow):
         # Output preview area
         output_group = QGroupBox("Converted Images")
         output_layout = QVBoxLayout()
-        self.output_images_list = QListWidget()
+        self.output_images_model = OutputListModel(self.thumbnail_loader, parent=self)
+        self.output_images_list = self.create_output_list(self.output_images_model)
         output_layout.addWidget(self.output_images_list)
         output_group.setLayout(output_layout)
         layout.addWidget(output_group)
@@ -184,26 +299,54 @@ class MainWindow(QMainWindow):
         
         # Reset UI
         self.progress_bar.setValue(0)
-        self.output_images_list.clear()
+        self.output_images_model.clear()
         
         try:
             # Convert PDF to images
-            self.pdf_to_images_vm.convert_pdf(input_path)
+            self.pdf_to_images_vm.convert_pdf(input_path,
+                                              image_format=self.pdf_image_format.currentData(),
+                                              quality=self.pdf_image_quality.value(),
+                                              dpi=self.pdf_image_dpi.currentData(),
+                                              use_cache=self.pdf_use_cache_cb.isChecked())
         except Exception as e:
             QMessageBox.critical(self, "Conversion Error", str(e))
     
     def update_progress(self, value: int):
         self.progress_bar.setValue(value)
     
+    def create_output_list(self, model: OutputListModel) -> QListView:
+        """
+        List view for output files: thumbnails, batched layout, and
+        double-click to open a file.
+        """
+        view = QListView()
+        view.setModel(model)
+        view.setIconSize(QSize(self.thumbnail_loader.size, self.thumbnail_loader.size))
+        # Uniform rows let the view skip measuring every item and only query visible ones
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.Batched)
+        view.setBatchSize(200)
+        view.setEditTriggers(QListView.NoEditTriggers)
+        view.doubleClicked.connect(
+            lambda index: QDesktopServices.openUrl(QUrl.fromLocalFile(model.path(index)))
+        )
+        return view
+    
+    def create_pdf_preview(self, source: QLineEdit) -> QGroupBox:
+        """
+        Preview pane that follows the PDF path entered in source.
+        """
+        group = QGroupBox("Preview")
+        group_layout = QVBoxLayout()
+        pane = PdfPreviewPane()
+        source.textChanged.connect(pane.set_document)
+        group_layout.addWidget(pane)
+        group.setLayout(group_layout)
+        return group
+    
     def conversion_completed(self, output_files):
-        # Clear previous items
-        self.output_images_list.clear()
-        
-        # Add converted image paths to the list
-        for file_path in output_files:
-            item = QListWidgetItem(os.path.basename(file_path))
-            item.setToolTip(file_path)
-            self.output_images_list.addItem(item)
+        # Rows are inserted in batches; thumbnails load as rows become visible
+        self.output_images_model.set_paths([str(p) for p in output_files])
         
         # Show success message
         QMessageBox.information(self, "Conversion Complete", f"Converted {len(output_files)} images")
@@ -325,10 +468,52 @@ class MainWindow(QMainWindow):
         output_layout.addWidget(browse_output_btn)
         layout.addLayout(output_layout)
         
-        # Convert button
+        # PDF to DOCX options
+        options_group = QGroupBox("PDF to DOCX Options")
+        options_layout = QVBoxLayout()
+        
+        pages_layout = QHBoxLayout()
+        pages_layout.addWidget(QLabel("Pages:"))
+        self.docx_pages_input = QLineEdit()
+        self.docx_pages_input.setPlaceholderText("e.g., 1-3,5 or 'all'")
+        self.docx_pages_input.setText("all")
+        pages_layout.addWidget(self.docx_pages_input)
+        options_layout.addLayout(pages_layout)
+        
+        processes_layout = QHBoxLayout()
+        self.docx_multi_processing_cb = QCheckBox("Use multiple processes")
+        processes_layout.addWidget(self.docx_multi_processing_cb)
+        processes_layout.addWidget(QLabel("Processes:"))
+        self.docx_cpu_count = QSpinBox()
+        self.docx_cpu_count.setRange(1, os.cpu_count() or 1)
+        self.docx_cpu_count.setValue(os.cpu_count() or 1)
+        self.docx_cpu_count.setEnabled(False)
+        self.docx_multi_processing_cb.toggled.connect(self.docx_cpu_count.setEnabled)
+        processes_layout.addWidget(self.docx_cpu_count)
+        processes_layout.addStretch()
+        options_layout.addLayout(processes_layout)
+        
+        options_group.setLayout(options_layout)
+        layout.addWidget(options_group)
+        
+        # Convert buttons
+        buttons_layout = QHBoxLayout()
         convert_btn = QPushButton("Convert")
         convert_btn.clicked.connect(self.convert_docx)
-        layout.addWidget(convert_btn)
+        buttons_layout.addWidget(convert_btn)
+        batch_btn = QPushButton("Batch Convert...")
+        batch_btn.clicked.connect(self.batch_convert_docx)
+        buttons_layout.addWidget(batch_btn)
+        layout.addLayout(buttons_layout)
+        
+        # Progress bar
+        self.docx_progress_bar = QProgressBar()
+        self.docx_progress_bar.setTextVisible(True)
+        self.docx_progress_bar.setFormat("%p%")
+        layout.addWidget(self.docx_progress_bar)
+        
+        self.docx_status_label = QLabel()
+        layout.addWidget(self.docx_status_label)
         
         layout.addStretch()
         self.tab_widget.addTab(tab, "PDF DOCX")
@@ -369,10 +554,36 @@ class MainWindow(QMainWindow):
             self.docx_output_path.setText(file_path)
     
     def convert_docx(self):
+        self.docx_progress_bar.setValue(0)
+        self.docx_status_label.clear()
         self.docx_converter_vm.convert_file(
             self.docx_input_path.text(),
-            self.docx_output_path.text() or None
+            self.docx_output_path.text() or None,
+            pages=self.docx_pages_input.text(),
+            multi_processing=self.docx_multi_processing_cb.isChecked(),
+            cpu_count=self.docx_cpu_count.value()
+        )
+    
+    def batch_convert_docx(self):
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Select Files",
+            str(Path.home()),
+            "Documents (*.pdf *.docx)"
+        )
+        if not file_paths:
+            return
+        
+        output_dir = QFileDialog.getExistingDirectory(
+            self, "Select Output Directory (cancel to save next to inputs)", str(Path.home())
         )
+        self.docx_progress_bar.setValue(0)
+        self.docx_status_label.clear()
+        self.docx_converter_vm.convert_batch(file_paths, output_dir or None)
+    
+    def update_docx_progress(self, value: int, message: str):
+        self.docx_progress_bar.setValue(value)
+        self.docx_status_label.setText(message)
     
     def docx_conversion_completed(self, output_path: str):
         QMessageBox.information(
@@ -395,6 +606,10 @@ class MainWindow(QMainWindow):
         input_layout.addWidget(browse_btn)
         layout.addLayout(input_layout)
         
+        # Preview of the selected PDF
+        self.excel_pdf_preview = self.create_pdf_preview(self.excel_input_path)
+        layout.addWidget(self.excel_pdf_preview)
+        
         # Options group
         options_group = QGroupBox("Conversion Options")
         options_layout = QVBoxLayout()
@@ -485,10 +700,21 @@ class MainWindow(QMainWindow):
         output_layout.addWidget(browse_output_btn)
         layout.addLayout(output_layout)
         
-        # Convert button
+        # Convert buttons
+        buttons_layout = QHBoxLayout()
         convert_btn = QPushButton("Convert")
         convert_btn.clicked.connect(self.convert_ppt)
-        layout.addWidget(convert_btn)
+        buttons_layout.addWidget(convert_btn)
+        batch_btn = QPushButton("Batch Convert...")
+        batch_btn.clicked.connect(self.batch_convert_ppt)
+        buttons_layout.addWidget(batch_btn)
+        layout.addLayout(buttons_layout)
+        
+        # Progress bar
+        self.ppt_progress_bar = QProgressBar()
+        self.ppt_progress_bar.setTextVisible(True)
+        self.ppt_progress_bar.setFormat("%p%")
+        layout.addWidget(self.ppt_progress_bar)
         
         layout.addStretch()
         self.tab_widget.addTab(tab, "PPT PDF")
@@ -534,6 +760,22 @@ class MainWindow(QMainWindow):
             self.ppt_output_path.text() or None
         )
     
+    def batch_convert_ppt(self):
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Select Presentations",
+            str(Path.home()),
+            "Presentations (*.ppt *.pptx)"
+        )
+        if not file_paths:
+            return
+        
+        output_dir = QFileDialog.getExistingDirectory(
+            self, "Select Output Directory (cancel to save next to inputs)", str(Path.home())
+        )
+        self.ppt_progress_bar.setValue(0)
+        self.ppt_converter_vm.convert_batch(file_paths, output_dir or None)
+    
     def ppt_conversion_completed(self, output_path: str):
         QMessageBox.information(
             self,
@@ -573,12 +815,20 @@ class MainWindow(QMainWindow):
                 "description": "Multi-size Windows application icon"
             },
             "Web Favicon (.ico)": {
-                "description": "Small icon for web browser tabs"
+                "description": "Small icon for web browser tabs",
+                "sizes": [(48, 48), (32, 32), (16, 16)]
+            },
+            "Web + Apple Icon Set": {
+                "description": "ICO, favicon.ico, favicon PNGs and Apple touch icons in one folder",
+                "bundle": True
             }
         }
         self.logo_presets_data = logo_presets
         preset_names = list(logo_presets.keys())
         self.logo_preset.addItems(preset_names)
+        self.logo_preset.currentTextChanged.connect(
+            lambda name: self.preset_description.setText(self.logo_presets_data[name]["description"])
+        )
         preset_layout.addWidget(self.logo_preset)
         options_layout.addLayout(preset_layout)
         
@@ -604,11 +854,22 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Please select a PNG file")
             return
         
-        try:
-            result_path = self.logo_converter_vm.convert_logo(input_path)
-            QMessageBox.information(self, "Conversion Complete", f"Icon saved to: {result_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Conversion Error", str(e))
+        preset = self.logo_presets_data[self.logo_preset.currentText()]
+        if preset.get("bundle"):
+            self.logo_converter_vm.convert_logo_bundle(input_path)
+        else:
+            self.logo_converter_vm.convert_logo(input_path, sizes=preset.get("sizes"))
+    
+    def logo_conversion_completed(self, result_path: str):
+        QMessageBox.information(self, "Conversion Complete", f"Icon saved to: {result_path}")
+    
+    def logo_bundle_completed(self, outputs: dict):
+        folder = os.path.dirname(next(iter(outputs.values()))) if outputs else ""
+        QMessageBox.information(
+            self,
+            "Icon Set Generated",
+            f"Generated {len(outputs)} icons in {folder}:\n\n" + "\n".join(sorted(outputs))
+        )
     
     def setup_android_logo_tab(self):
         tab = QWidget()
@@ -663,7 +924,8 @@ class MainWindow(QMainWindow):
         # Output preview
         output_group = QGroupBox("Generated Icons")
         output_layout = QVBoxLayout()
-        self.android_output_list = QListWidget()
+        self.android_output_model = OutputListModel(self.thumbnail_loader, parent=self)
+        self.android_output_list = self.create_output_list(self.android_output_model)
         output_layout.addWidget(self.android_output_list)
         output_group.setLayout(output_layout)
         layout.addWidget(output_group)
@@ -688,7 +950,7 @@ class MainWindow(QMainWindow):
         
         # Reset UI
         self.android_progress_bar.setValue(0)
-        self.android_output_list.clear()
+        self.android_output_model.clear()
         
         try:
             # Generate Android icons
@@ -697,14 +959,10 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Generation Error", str(e))
     
     def android_generation_completed(self, output_paths):
-        # Clear previous items
-        self.android_output_list.clear()
-        
         # Add generated paths to the list
-        for folder, path in output_paths.items():
-            item = QListWidgetItem(f"{folder}: {os.path.basename(path)}")
-            item.setToolTip(path)
-            self.android_output_list.addItem(item)
+        self.android_output_model.set_items(
+            [(f"{folder}: {os.path.basename(path)}", path) for folder, path in output_paths.items()]
+        )
         
         # Show success message
         QMessageBox.information(
@@ -868,9 +1126,180 @@ class MainWindow(QMainWindow):
             f"Successfully upscaled image: {output_path}"
         )
     
+    def setup_pipeline_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        # Input file selection
+        input_layout = QHBoxLayout()
+        self.pipeline_input_path = QLineEdit()
+        self.pipeline_input_path.setPlaceholderText("Select image file...")
+        browse_btn = QPushButton("Browse")
+        browse_btn.clicked.connect(lambda: self.browse_image(self.pipeline_input_path))
+        input_layout.addWidget(self.pipeline_input_path)
+        input_layout.addWidget(browse_btn)
+        layout.addLayout(input_layout)
+        
+        # Step editor
+        steps_group = QGroupBox("Steps (run top to bottom, in memory)")
+        steps_layout = QVBoxLayout()
+        
+        add_layout = QHBoxLayout()
+        self.pipeline_operation = QComboBox()
+        self.pipeline_operation.addItems(OPERATIONS)
+        self.pipeline_params = QLineEdit()
+        self.pipeline_params.setPlaceholderText("Parameters, e.g. size=512x512; maintain_aspect=false")
+        add_step_btn = QPushButton("Add Step")
+        add_step_btn.clicked.connect(self.add_pipeline_step)
+        add_layout.addWidget(self.pipeline_operation)
+        add_layout.addWidget(self.pipeline_params)
+        add_layout.addWidget(add_step_btn)
+        steps_layout.addLayout(add_layout)
+        
+        self.pipeline_steps_list = QListWidget()
+        steps_layout.addWidget(self.pipeline_steps_list)
+        
+        step_buttons = QHBoxLayout()
+        remove_step_btn = QPushButton("Remove Selected")
+        remove_step_btn.clicked.connect(
+            lambda: self.pipeline_steps_list.takeItem(self.pipeline_steps_list.currentRow())
+        )
+        preset_btn = QPushButton("Logo Preset")
+        preset_btn.setToolTip("Remove background, trim, resize to 1024 and build all icon bundles")
+        preset_btn.clicked.connect(self.load_pipeline_preset)
+        step_buttons.addWidget(remove_step_btn)
+        step_buttons.addWidget(preset_btn)
+        step_buttons.addStretch()
+        steps_layout.addLayout(step_buttons)
+        steps_group.setLayout(steps_layout)
+        layout.addWidget(steps_group)
+        
+        # Output directory selection
+        output_layout = QHBoxLayout()
+        self.pipeline_output_path = QLineEdit()
+        self.pipeline_output_path.setPlaceholderText("Select output directory (optional)...")
+        browse_output_btn = QPushButton("Browse")
+        browse_output_btn.clicked.connect(self.browse_pipeline_output)
+        output_layout.addWidget(self.pipeline_output_path)
+        output_layout.addWidget(browse_output_btn)
+        layout.addLayout(output_layout)
+        
+        # Run button and progress
+        run_btn = QPushButton("Run Pipeline")
+        run_btn.clicked.connect(self.run_pipeline)
+        layout.addWidget(run_btn)
+        
+        self.pipeline_progress_bar = QProgressBar()
+        layout.addWidget(self.pipeline_progress_bar)
+        
+        # Outputs
+        self.pipeline_output_model = OutputListModel(self.thumbnail_loader, parent=self)
+        layout.addWidget(self.create_output_list(self.pipeline_output_model))
+        
+        self.load_pipeline_preset()
+        self.tab_widget.addTab(tab, "Pipeline")
+    
+    def add_pipeline_step(self):
+        text = self.pipeline_operation.currentText()
+        params = self.pipeline_params.text().strip()
+        if params:
+            text += ':' + params
+        try:
+            step = parse_steps(text)[0]
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Step", str(e))
+            return
+        item = QListWidgetItem(str(step))
+        item.setData(Qt.UserRole, step)
+        self.pipeline_steps_list.addItem(item)
+        self.pipeline_params.clear()
+    
+    def load_pipeline_preset(self):
+        self.pipeline_steps_list.clear()
+        for step in parse_steps('remove_background>trim:padding=16>resize:size=1024x1024>icon_bundle:manifests=all'):
+            item = QListWidgetItem(str(step))
+            item.setData(Qt.UserRole, step)
+            self.pipeline_steps_list.addItem(item)
+    
+    def browse_pipeline_output(self):
+        dir_path = QFileDialog.getExistingDirectory(
+            self, "Select Output Directory", str(Path.home())
+        )
+        if dir_path:
+            self.pipeline_output_path.setText(dir_path)
+    
+    def run_pipeline(self):
+        steps = [
+            self.pipeline_steps_list.item(row).data(Qt.UserRole)
+            for row in range(self.pipeline_steps_list.count())
+        ]
+        self.pipeline_progress_bar.setValue(0)
+        self.pipeline_output_model.clear()
+        self.pipeline_vm.run_pipeline(
+            self.pipeline_input_path.text(),
+            steps,
+            self.pipeline_output_path.text() or None
+        )
+    
+    def pipeline_completed(self, outputs: dict):
+        self.pipeline_output_model.set_items(list(outputs.items()))
+        QMessageBox.information(
+            self,
+            "Pipeline Complete",
+            f"Successfully wrote {len(outputs)} files"
+        )
+    
     def setup_web_search_tab(self):
         pass
     
+    def setup_performance_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        layout.addWidget(QLabel("Timings of the most recent jobs, newest first"))
+        
+        self.performance_table = QTableWidget(0, 6)
+        self.performance_table.setHorizontalHeaderLabels(
+            ["Service", "Started", "Total (s)", "Stages (s)", "Throughput", "Status"]
+        )
+        self.performance_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.performance_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
+        self.performance_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
+        layout.addWidget(self.performance_table)
+        
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self.clear_performance)
+        layout.addWidget(clear_btn)
+        
+        for metrics in reversed(self.performance_vm.recent_jobs()):
+            self.add_performance_row(metrics)
+        
+        self.tab_widget.addTab(tab, "Performance")
+    
+    def add_performance_row(self, metrics):
+        table = self.performance_table
+        table.insertRow(0)
+        stages = ", ".join(f"{name} {seconds:.2f}" for name, seconds in metrics.stages.items())
+        rates = ", ".join(f"{value:.1f} {name}" for name, value in metrics.rates.items())
+        values = [
+            metrics.service,
+            time.strftime("%H:%M:%S", time.localtime(metrics.started_at)),
+            f"{metrics.seconds:.2f}",
+            stages,
+            rates,
+            "OK" if metrics.succeeded else metrics.error
+        ]
+        for column, value in enumerate(values):
+            table.setItem(0, column, QTableWidgetItem(value))
+        
+        # Keep only as many rows as the view model keeps jobs
+        while table.rowCount() > self.performance_vm.capacity:
+            table.removeRow(table.rowCount() - 1)
+    
+    def clear_performance(self):
+        self.performance_vm.clear()
+        self.performance_table.setRowCount(0)
+    
     def resize_completed(self, output_path: str):
         QMessageBox.information(
             self,
@@ -889,6 +1318,24 @@ class MainWindow(QMainWindow):
             message
         )
     
+    def show_batch_results(self, title: str, results: list):
+        succeeded = [r for r in results if r.succeeded]
+        failed = [r for r in results if not r.succeeded]
+        total_seconds = sum(r.seconds for r in results)
+        
+        message = f"Converted {len(succeeded)} of {len(results)} files in {total_seconds:.1f}s\n\n"
+        for result in results:
+            name = os.path.basename(result.input_path)
+            if result.succeeded:
+                message += f"✔ {name} ({result.seconds:.1f}s)\n"
+            else:
+                message += f"✘ {name}: {result.error}\n"
+        
+        if failed:
+            QMessageBox.warning(self, title, message)
+        else:
+            QMessageBox.information(self, title, message)
+    
     def browse_file_with_target(self, file_filter: str, target: QLineEdit) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select File", str(Path.home()), file_filter
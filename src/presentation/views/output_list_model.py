@@ -0,0 +1,91 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+from typing import Dict, List, Optional, Sequence, Tuple
+import os
+from src.presentation.views.thumbnails import ThumbnailLoader
+
+PathRole = Qt.UserRole + 1
+
+
+class OutputListModel(QAbstractListModel):
+    """
+    List of output files with lazily loaded thumbnails.
+
+    Rows are appended in batches from the event loop so thousands of outputs
+    never block the GUI, and the view only asks for the decoration of rows
+    it paints, so thumbnails are decoded for visible rows only.
+    """
+
+    def __init__(self, loader: ThumbnailLoader, batch_size: int = 500, parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            loader: Shared thumbnail loader and cache
+            batch_size: Rows inserted per event loop iteration
+        """
+        super().__init__(parent)
+        self._loader = loader
+        self._batch_size = batch_size
+        self._items: List[Tuple[str, str]] = []
+        self._rows: Dict[str, List[int]] = {}
+        self._backlog: List[Tuple[str, str]] = []
+        self._loader.thumbnail_ready.connect(self._thumbnail_ready)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        label, path = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return label
+        if role == Qt.ToolTipRole or role == PathRole:
+            return path
+        if role == Qt.DecorationRole:
+            return self._loader.thumbnail(path)
+        return None
+
+    def set_items(self, items: Sequence[Tuple[str, str]]) -> None:
+        """
+        Replace the list with (label, path) items, inserted in batches.
+        """
+        self.clear()
+        self._backlog = list(items)
+        self._insert_batch()
+
+    def set_paths(self, paths: Sequence[str], label_for=None) -> None:
+        """
+        Replace the list with paths, labelled with their file names by default.
+        """
+        label_for = label_for or os.path.basename
+        self.set_items([(label_for(p), p) for p in paths])
+
+    def clear(self) -> None:
+        self._backlog = []
+        self.beginResetModel()
+        self._items = []
+        self._rows = {}
+        self.endResetModel()
+
+    def path(self, index: QModelIndex) -> Optional[str]:
+        return self._items[index.row()][1] if index.isValid() else None
+
+    def _insert_batch(self) -> None:
+        if not self._backlog:
+            return
+        batch, self._backlog = self._backlog[:self._batch_size], self._backlog[self._batch_size:]
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        for offset, item in enumerate(batch):
+            self._items.append(item)
+            self._rows.setdefault(item[1], []).append(first + offset)
+        self.endInsertRows()
+        if self._backlog:
+            # Let the GUI repaint and handle input between batches
+            QTimer.singleShot(0, self._insert_batch)
+
+    def _thumbnail_ready(self, path: str) -> None:
+        for row in self._rows.get(path, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
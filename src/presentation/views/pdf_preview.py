@@ -0,0 +1,99 @@
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+from pathlib import Path
+from src.presentation.viewmodels.pdf_preview_viewmodel import PdfPreviewViewModel
+
+
+class PdfPreviewPane(QWidget):
+    """
+    Shows one page of a PDF, rendered coarse first and refined in place.
+
+    Renders go through the shared page cache, so pages seen before appear
+    at full preview resolution right away.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._vm = PdfPreviewViewModel()
+        self._vm.document_loaded.connect(self._document_loaded)
+        self._vm.page_rendered.connect(self._page_rendered)
+        self._vm.error_occurred.connect(self._show_error)
+        self._path = None
+        self._page_index = 0
+        self._page_count = 0
+        self._shown_dpi = 0
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.image_label = QLabel("No PDF selected")
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setMinimumHeight(240)
+        layout.addWidget(self.image_label, 1)
+
+        nav_layout = QHBoxLayout()
+        self.prev_btn = QPushButton("◀")
+        self.prev_btn.clicked.connect(lambda: self.show_page(self._page_index - 1))
+        self.page_label = QLabel()
+        self.page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.next_btn = QPushButton("▶")
+        self.next_btn.clicked.connect(lambda: self.show_page(self._page_index + 1))
+        nav_layout.addWidget(self.prev_btn)
+        nav_layout.addWidget(self.page_label, 1)
+        nav_layout.addWidget(self.next_btn)
+        layout.addLayout(nav_layout)
+        self._update_navigation()
+
+    def set_document(self, path: str) -> None:
+        """
+        Preview a PDF file; anything that is not an existing PDF clears the pane.
+        """
+        if path == self._path:
+            return
+        if not path or Path(path).suffix.lower() != '.pdf' or not Path(path).is_file():
+            self._vm.cancel()
+            self._path = None
+            self._page_count = 0
+            self.image_label.clear()
+            self.image_label.setText("No PDF selected")
+            self._update_navigation()
+            return
+        self._path = path
+        self._page_index = 0
+        self._shown_dpi = 0
+        self.image_label.setText("Loading preview...")
+        self._vm.load(path)
+
+    def show_page(self, page_index: int) -> None:
+        if not self._path or not 0 <= page_index < self._page_count:
+            return
+        self._page_index = page_index
+        self._shown_dpi = 0
+        self._update_navigation()
+        self._vm.show_page(self._path, page_index)
+
+    def _document_loaded(self, path: str, page_count: int) -> None:
+        if path != self._path:
+            return
+        self._page_count = page_count
+        self._update_navigation()
+
+    def _page_rendered(self, page) -> None:
+        # Drop renders of pages the user already left, and coarser ones
+        # arriving after a sharper render
+        if page.page_index != self._page_index or page.dpi < self._shown_dpi:
+            return
+        self._shown_dpi = page.dpi
+        image_format = QImage.Format_Grayscale8 if page.channels == 1 else QImage.Format_RGB888
+        image = QImage(page.samples, page.width, page.height, page.width * page.channels, image_format)
+        pixmap = QPixmap.fromImage(image)  # Copies the samples
+        self.image_label.setPixmap(pixmap.scaled(self.image_label.size(), Qt.KeepAspectRatio,
+                                                 Qt.SmoothTransformation))
+
+    def _show_error(self, message: str) -> None:
+        self.image_label.setText(message)
+
+    def _update_navigation(self) -> None:
+        self.prev_btn.setEnabled(self._page_index > 0)
+        self.next_btn.setEnabled(self._page_index + 1 < self._page_count)
+        self.page_label.setText(f"Page {self._page_index + 1} of {self._page_count}" if self._page_count else "")
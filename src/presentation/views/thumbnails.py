@@ -0,0 +1,130 @@
+from PySide6.QtCore import QObject, QRunnable, QSize, QThreadPool, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+from collections import OrderedDict, deque
+from typing import Optional
+import threading
+
+
+class ThumbnailCache:
+    """
+    Least-recently-used cache of thumbnails, bounded by total pixel bytes
+    rather than by entry count, so a few large previews cannot push memory
+    further than many small ones.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, QPixmap]" = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[QPixmap]:
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self._entries.move_to_end(key)
+        return pixmap
+
+    def put(self, key: str, pixmap: QPixmap) -> None:
+        if key in self._entries:
+            self._bytes -= self._cost(self._entries.pop(key))
+        cost = self._cost(pixmap)
+        if cost > self.max_bytes:
+            return
+        self._entries[key] = pixmap
+        self._bytes += cost
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._cost(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, loader: 'ThumbnailLoader'):
+        super().__init__()
+        self._loader = loader
+
+    def run(self):
+        self._loader._decode_next()
+
+
+class ThumbnailLoader(QObject):
+    """
+    Decodes thumbnails on a background thread pool.
+
+    Requests are served newest first, so the rows the user is looking at
+    now win over rows that were requested while scrolling past. Images are
+    decoded at thumbnail size by QImageReader (JPEG decoders skip the full
+    resolution entirely) and cached as pixmaps on the GUI thread.
+    """
+    thumbnail_ready = Signal(str)  # Path whose thumbnail is now cached
+    _decoded = Signal(str, QImage)
+
+    def __init__(self, size: int = 64, max_bytes: int = 64 * 1024 * 1024, threads: int = 2):
+        """
+        Initialize the loader.
+
+        Args:
+            size: Thumbnail edge in pixels
+            max_bytes: Thumbnail cache budget in bytes
+            threads: Decoder threads
+        """
+        super().__init__()
+        self.size = size
+        self.cache = ThumbnailCache(max_bytes)
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(threads)
+        self._requests: deque = deque()
+        self._queued = set()
+        self._failed = set()
+        self._lock = threading.Lock()
+        # QPixmap may only be created on the GUI thread
+        self._decoded.connect(self._store, Qt.QueuedConnection)
+
+    def thumbnail(self, path: str) -> Optional[QPixmap]:
+        """
+        Return the cached thumbnail, or None after queueing it for decoding.
+        """
+        pixmap = self.cache.get(path)
+        if pixmap is None and path not in self._failed:
+            self.request(path)
+        return pixmap
+
+    def request(self, path: str) -> None:
+        with self._lock:
+            if path in self._queued:
+                return
+            self._queued.add(path)
+            self._requests.append(path)
+        self._pool.start(_DecodeTask(self))
+
+    def _decode_next(self) -> None:
+        with self._lock:
+            if not self._requests:
+                return
+            path = self._requests.pop()
+
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        source = reader.size()
+        if source.isValid():
+            reader.setScaledSize(source.scaled(QSize(self.size, self.size), Qt.KeepAspectRatio))
+        self._decoded.emit(path, reader.read())
+
+    def _store(self, path: str, image: QImage) -> None:
+        with self._lock:
+            self._queued.discard(path)
+        if image.isNull():
+            self._failed.add(path)  # Not an image Qt can read; don't retry on every repaint
+            return
+        self.cache.put(path, QPixmap.fromImage(image))
+        self.thumbnail_ready.emit(path)
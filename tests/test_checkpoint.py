@@ -0,0 +1,171 @@
+from pathlib import Path
+import json
+import logging
+import subprocess
+import sys
+
+import pytest
+
+from src.infrastructure.file_services.checkpoint import MANIFEST_NAME, ConversionCheckpoint
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PAGE_COUNT = 6
+
+# Child processes that die without any cleanup partway through a conversion,
+# like a killed process would
+PDF_KILLED_RUN = '''
+import os, sys
+from src.infrastructure.file_services.pdf_converter import PDFToImageConverter
+
+def crash(percent):
+    if percent >= 50:
+        os._exit(3)
+
+PDFToImageConverter().convert(sys.argv[1], sys.argv[2], progress_callback=crash,
+                              dpi=72, encode_workers=1)
+'''
+
+DOCX_KILLED_RUN = '''
+import os, sys
+from src.infrastructure.file_services import docx_converter
+
+def crash(percent, message):
+    if message.startswith('Parsed page 2 '):
+        os._exit(3)
+
+docx_converter.CHECKPOINT_PAGES = 2
+docx_converter.DocxConverter().convert(sys.argv[1], sys.argv[2], progress_callback=crash, resume=True)
+'''
+
+
+def _open(directory: Path, fingerprint: str = 'abc', params: dict = None) -> ConversionCheckpoint:
+    return ConversionCheckpoint(directory / MANIFEST_NAME, fingerprint, params or {'dpi': 300})
+
+
+def _write_part(directory: Path, name: str, data: bytes = b'page') -> Path:
+    path = directory / name
+    path.write_bytes(data)
+    return path
+
+
+def _make_pdf(path: Path) -> Path:
+    fitz = pytest.importorskip('fitz')
+    document = fitz.open()
+    for number in range(1, PAGE_COUNT + 1):
+        page = document.new_page()
+        page.insert_text((72, 72), f"Marker page {number}", fontsize=14)
+    document.save(str(path))
+    document.close()
+    return path
+
+
+def _run_killed(script: str, *args: Path) -> None:
+    result = subprocess.run([sys.executable, '-c', script, *map(str, args)],
+                            cwd=REPO_ROOT, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 3, result.stderr
+
+
+def test_recorded_parts_survive_reopening(tmp_path):
+    checkpoint = _open(tmp_path)
+    output = _write_part(tmp_path, 'page_1.png')
+    checkpoint.record('0', output, dpi=150)
+    checkpoint.close()
+
+    part = _open(tmp_path).completed('0')
+    assert part['output'] == str(output)
+    assert part['dpi'] == 150
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    checkpoint = _open(tmp_path)
+    checkpoint.record('0', _write_part(tmp_path, 'page_1.png'))
+    checkpoint.record('1', _write_part(tmp_path, 'page_2.png'))
+    checkpoint.close()
+    with open(tmp_path / MANIFEST_NAME, 'a', encoding='utf-8') as f:
+        f.write('{"key":"2","output":"page_3.p')
+
+    checkpoint = _open(tmp_path)
+    assert checkpoint.completed('0') and checkpoint.completed('1')
+    assert checkpoint.completed('2') is None
+
+    # The next record must not be glued onto the torn line
+    checkpoint.record('2', _write_part(tmp_path, 'page_3.png'))
+    checkpoint.close()
+    checkpoint = _open(tmp_path)
+    assert all(checkpoint.completed(key) for key in ('0', '1', '2'))
+
+
+@pytest.mark.parametrize('fingerprint, params', [
+    ('changed', {'dpi': 300}),
+    ('abc', {'dpi': 150}),
+])
+def test_changed_input_or_params_start_over(tmp_path, fingerprint, params):
+    checkpoint = _open(tmp_path)
+    checkpoint.record('0', _write_part(tmp_path, 'page_1.png'))
+    checkpoint.close()
+
+    checkpoint = _open(tmp_path, fingerprint, params)
+    assert checkpoint.completed('0') is None
+    checkpoint.close()
+
+    lines = (tmp_path / MANIFEST_NAME).read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])['fingerprint'] == fingerprint
+
+
+def test_part_with_changed_output_size_is_redone(tmp_path):
+    checkpoint = _open(tmp_path)
+    checkpoint.record('0', _write_part(tmp_path, 'page_1.png', b'complete page'))
+    checkpoint.record('1', _write_part(tmp_path, 'page_2.png'))
+    checkpoint.close()
+    _write_part(tmp_path, 'page_1.png', b'torn')
+    (tmp_path / 'page_2.png').unlink()
+
+    checkpoint = _open(tmp_path)
+    assert checkpoint.completed('0') is None
+    assert checkpoint.completed('1') is None
+
+
+def test_pdf_to_images_resumes_after_kill(tmp_path, caplog):
+    from src.infrastructure.file_services.pdf_converter import PDFToImageConverter
+
+    pdf_path = _make_pdf(tmp_path / 'input.pdf')
+    output_dir = tmp_path / 'images'
+    _run_killed(PDF_KILLED_RUN, pdf_path, output_dir)
+
+    manifest = (output_dir / MANIFEST_NAME).read_text(encoding='utf-8').splitlines()
+    recorded = {json.loads(line)['output'] for line in manifest[1:]}
+    assert len(recorded) >= PAGE_COUNT // 2
+    written = {name: (output_dir / name).stat().st_mtime_ns for name in recorded}
+
+    with caplog.at_level(logging.INFO):
+        outputs = PDFToImageConverter().convert(pdf_path, output_dir, dpi=72, encode_workers=1)
+
+    assert "Resuming from" in caplog.text
+    assert [Path(output).name for output in outputs] == [f"page_{n}.png" for n in range(1, PAGE_COUNT + 1)]
+    assert all(Path(output).stat().st_size > 0 for output in outputs)
+    assert {name: (output_dir / name).stat().st_mtime_ns for name in recorded} == written
+    assert not (output_dir / MANIFEST_NAME).exists()
+
+
+def test_pdf_to_docx_resumes_after_kill(tmp_path, caplog, monkeypatch):
+    pytest.importorskip('pdf2docx')
+    docx = pytest.importorskip('docx')
+    from src.infrastructure.file_services import docx_converter
+
+    pdf_path = _make_pdf(tmp_path / 'input.pdf')
+    output_path = tmp_path / 'output.docx'
+    checkpoint_dir = tmp_path / 'output.docx.checkpoint'
+    _run_killed(DOCX_KILLED_RUN, pdf_path, output_path)
+    assert (checkpoint_dir / 'pages-1-2.json').exists()
+    assert not output_path.exists()
+
+    monkeypatch.setattr(docx_converter, 'CHECKPOINT_PAGES', 2)
+    with caplog.at_level(logging.INFO):
+        docx_converter.DocxConverter().convert(pdf_path, output_path, resume=True)
+
+    assert f"2 of {PAGE_COUNT} pages already parsed" in caplog.text
+    assert not checkpoint_dir.exists()
+    text = '\n'.join(paragraph.text for paragraph in docx.Document(str(output_path)).paragraphs)
+    for number in range(1, PAGE_COUNT + 1):
+        assert f"Marker page {number}" in text
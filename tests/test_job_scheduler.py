@@ -0,0 +1,39 @@
+import threading
+import time
+
+from src.application.job_scheduler import JobScheduler, JobState, ResourceClass
+
+
+def _live_workers(resource_class: ResourceClass) -> int:
+    return sum(1 for thread in threading.enumerate()
+               if thread.name.startswith(f"hiel-{resource_class.value}-"))
+
+
+def test_lowering_limit_retires_only_surplus_workers():
+    scheduler = JobScheduler({ResourceClass.CPU: 4})
+    try:
+        # Start four workers and leave them idle
+        release = threading.Event()
+        started = threading.Barrier(5)
+
+        def hold() -> None:
+            started.wait(timeout=5)
+            release.wait(timeout=5)
+
+        warm_up = [scheduler.submit(hold) for _ in range(4)]
+        started.wait(timeout=5)
+        release.set()
+        for job in warm_up:
+            job.result(timeout=5)
+        time.sleep(0.1)
+
+        scheduler.set_limit(ResourceClass.CPU, 2)
+        jobs = [scheduler.submit(time.sleep, 0.05) for _ in range(6)]
+        for job in jobs:
+            job.result(timeout=5)
+
+        assert [job.state for job in jobs] == [JobState.COMPLETED] * 6
+        time.sleep(0.1)
+        assert _live_workers(ResourceClass.CPU) == 2
+    finally:
+        scheduler.shutdown(wait=True, cancel_pending=True)
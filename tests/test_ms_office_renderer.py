@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from src.infrastructure.office_services import ms_office_renderer
+from src.infrastructure.office_services.ms_office_renderer import MSOfficeRenderer
+
+
+def test_timeout_recycles_the_hung_com_thread(tmp_path, monkeypatch):
+    hung = threading.Event()
+    killed = threading.Event()
+    rendered = []
+
+    def render_word(thread, input_path, output_path):
+        if not hung.is_set():
+            hung.set()
+            killed.wait(timeout=10)  # A hung Office call, failed by killing Office
+            raise RuntimeError("The RPC server is unavailable")
+        output_path.write_bytes(b'%PDF')
+        rendered.append(threading.current_thread())
+
+    monkeypatch.setattr(ms_office_renderer._OfficeThread, 'render_word', render_word)
+    monkeypatch.setattr(ms_office_renderer._OfficeThread, 'kill_applications', lambda thread: killed.set())
+    document = tmp_path / 'input.docx'
+    document.write_bytes(b'docx')
+
+    renderer = MSOfficeRenderer()
+    try:
+        hung_thread = renderer._thread
+        queued = {}
+
+        def render_queued() -> None:
+            hung.wait(timeout=5)  # Submitted while the hung job occupies the thread
+            queued['path'] = renderer.render_to_pdf(document, tmp_path / 'queued.pdf', timeout=5)
+
+        worker = threading.Thread(target=render_queued)
+        worker.start()
+        with pytest.raises(TimeoutError):
+            renderer.render_to_pdf(document, tmp_path / 'hung.pdf', timeout=0.5)
+
+        assert killed.is_set()
+        assert renderer._thread is not hung_thread
+        assert renderer.render_to_pdf(document, tmp_path / 'next.pdf', timeout=5) == str(tmp_path / 'next.pdf')
+        worker.join(timeout=5)
+        assert queued['path'] == str(tmp_path / 'queued.pdf')
+        # Both ran on the replacement thread
+        assert len(rendered) == 2 and len(set(rendered)) == 1
+    finally:
+        renderer.close()